@@ -36,6 +36,7 @@ from werkzeug.local import LocalProxy
 
 from app import proxy_fix, webauthn_server
 from app.asset_fingerprinter import asset_fingerprinter
+from app.broadcast_areas.repo import log_broadcast_areas_query_count
 from app.config import configs
 from app.custom_auth import CustomBasicAuth
 from app.extensions import antivirus_client, redis_client, zendesk_client
@@ -90,7 +91,7 @@ from app.navigation import (
     MainNavigation,
     OrgNavigation,
 )
-from app.notify_client import InviteTokenError
+from app.notify_client import InviteTokenError, clear_request_memo
 from app.notify_client.api_key_api_client import api_key_api_client
 from app.notify_client.billing_api_client import billing_api_client
 from app.notify_client.broadcast_message_api_client import (
@@ -125,12 +126,14 @@ from app.notify_client.template_statistics_api_client import (
 )
 from app.notify_client.upload_api_client import upload_api_client
 from app.notify_client.user_api_client import user_api_client
+from app.s3_client.s3_csv_client import clear_metadata_cache
 from app.url_converters import (
     LetterFileExtensionConverter,
     SimpleDateTypeConverter,
     TemplateTypeConverter,
     TicketTypeConverter,
 )
+from app.utils.polling import REVALIDATED_ENDPOINTS
 
 login_manager = LoginManager()
 csrf = CSRFProtect()
@@ -160,6 +163,11 @@ def create_app(application):
 
     application.config.from_object(configs[notify_environment])
     asset_fingerprinter._asset_root = application.config['ASSET_PATH']
+    if application.config['ASSET_MANIFEST_FILE']:
+        asset_fingerprinter.load_manifest(
+            application.config['ASSET_MANIFEST_FILE'],
+            hashed_filenames=application.config['ASSET_HASHED_FILENAMES'],
+        )
 
     init_app(application)
 
@@ -233,7 +241,7 @@ def create_app(application):
 
     register_errorhandlers(application)
 
-    setup_event_handlers()
+    setup_event_handlers(application)
 
 
 def init_app(application):
@@ -243,6 +251,10 @@ def init_app(application):
     application.before_request(load_organisation_before_request)
     application.before_request(request_helper.check_proxy_header_before_request)
 
+    application.teardown_request(clear_request_memo)
+    application.teardown_request(clear_metadata_cache)
+    application.teardown_request(log_broadcast_areas_query_count)
+
     font_paths = [
         str(item)[len(asset_fingerprinter._filesystem_path):]
         for item in pathlib.Path(asset_fingerprinter._filesystem_path).glob('fonts/*.woff2')
@@ -388,8 +400,13 @@ def useful_headers_after_request(response):
     ))
     if 'Cache-Control' in response.headers:
         del response.headers['Cache-Control']
-    response.headers.add(
-        'Cache-Control', 'no-store, no-cache, private, must-revalidate')
+    if request.endpoint in REVALIDATED_ENDPOINTS:
+        # these responses have an ETag, so let the browser keep them and ask us if they've changed
+        response.headers.add(
+            'Cache-Control', 'no-cache, private, must-revalidate')
+    else:
+        response.headers.add(
+            'Cache-Control', 'no-store, no-cache, private, must-revalidate')
     for key, value in response.headers:
         response.headers[key] = SanitiseASCII.encode(value)
     return response
@@ -524,12 +541,13 @@ def setup_blueprints(application):
     application.register_blueprint(status_blueprint)
 
 
-def setup_event_handlers():
+def setup_event_handlers(application):
     from flask_login import user_logged_in
 
-    from app.event_handlers import on_user_logged_in
+    from app.event_handlers import event_queue, on_user_logged_in
 
     user_logged_in.connect(on_user_logged_in)
+    event_queue.init_app(application)
 
 
 def add_template_filters(application):
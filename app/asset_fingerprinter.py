@@ -1,4 +1,6 @@
 import hashlib
+import json
+import os
 
 
 class AssetFingerprinter(object):
@@ -17,24 +19,52 @@ class AssetFingerprinter(object):
             {{ asset_fingerprinter.get_url('stylesheets/application.css') }}
 
         * 'app/static' is assumed to be the root for all asset files
+
+        Once `load_manifest` has been called, hashes come from the manifest written by `gulp` rather than by reading
+        each file. Files which aren’t in the manifest are still hashed the first time they’re used.
     """
 
     def __init__(self, asset_root='/static/', filesystem_path='app/static/'):
         self._cache = {}
+        self._manifest = {}
+        self._hashed_filenames = False
         self._asset_root = asset_root
         self._filesystem_path = filesystem_path
 
+    def load_manifest(self, manifest_file, hashed_filenames=False):
+        """
+        Use the hashes in `manifest_file` (relative to the filesystem path), if it exists. With `hashed_filenames`
+        the URLs for files in the manifest point at the copies `gulp` made with their hash in the filename
+        (`main.<hash>.css`), rather than having it in the querystring.
+        """
+        try:
+            with open(self._filesystem_path + manifest_file) as manifest:
+                self._manifest = json.load(manifest)
+        except FileNotFoundError:
+            self._manifest = {}
+        self._hashed_filenames = hashed_filenames
+        self._cache = {}
+
     def get_url(self, asset_path, with_querystring_hash=True):
         if not with_querystring_hash:
             return self._asset_root + asset_path
         if asset_path not in self._cache:
-            self._cache[asset_path] = (
+            self._cache[asset_path] = self._get_fingerprinted_url(asset_path)
+        return self._cache[asset_path]
+
+    def _get_fingerprinted_url(self, asset_path):
+        if asset_path not in self._manifest:
+            return (
                 self._asset_root +
                 asset_path +
                 '?' +
                 self.get_asset_fingerprint(self._filesystem_path + asset_path)
             )
-        return self._cache[asset_path]
+        if self._hashed_filenames:
+            # must match `hashedFilename` in gulpfile.js
+            name, extension = os.path.splitext(asset_path)
+            return self._asset_root + name + '.' + self._manifest[asset_path] + extension
+        return self._asset_root + asset_path + '?' + self._manifest[asset_path]
 
     def get_asset_fingerprint(self, asset_file_path):
         return hashlib.md5(
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import csv
-import pickle
 import sys
 from math import isclose
 from pathlib import Path
@@ -17,15 +16,13 @@ from populations import (
     SMARTPHONE_OWNERSHIP_BY_AGE_RANGE,
     estimate_number_of_smartphones_for_population,
 )
-from repo import BroadcastAreasRepository, rtree_index_path
-from rtreelib import Rect, RTree
+from repo import BroadcastAreasRepository
 from shapely import wkt
 from shapely.geometry import MultiPolygon, Polygon
 
 source_files_path = Path(__file__).resolve().parent / 'source_files'
 point_counts = []
 invalid_polygons = []
-rtree_index = RTree()
 
 # The hard limit in the CBCs is 6,000 points per polygon. But we also
 # care about optimising how quickjly we can process and display polygons
@@ -167,8 +164,8 @@ def estimate_number_of_smartphones_in_area(country_or_ward_code):
 
     if country_or_ward_code in CITY_OF_LONDON.WARDS:
         # We don’t have population figures for wards of the City of
-        # London. We’ll leave it empty here and estimate on the fly
-        # later based on physical area.
+        # London. We’ll leave it empty here and estimate it later
+        # based on physical area, once the polygons are stored.
         print('    Population:   N/A')  # noqa: T201
         return None
 
@@ -330,6 +327,7 @@ def add_wards_local_authorities_and_counties():
 
 def _add_electoral_wards(dataset_id):
     areas_to_add = []
+    bounds_to_add = []
 
     for feature in geojson.loads(wd20_filepath.read_text())["features"]:
         ward_code = feature["properties"]["wd20cd"]
@@ -347,7 +345,7 @@ def _add_electoral_wards(dataset_id):
             )
 
             if feature:
-                rtree_index.insert(ward_id, Rect(*Polygons(feature).bounds))
+                bounds_to_add.append([ward_id, Polygons(feature).bounds])
 
             areas_to_add.append([
                 ward_id, ward_name,
@@ -360,8 +358,8 @@ def _add_electoral_wards(dataset_id):
         except KeyError:
             print("Skipping", ward_code, ward_name)  # noqa: T201
 
-    rtree_index_path.open('wb').write(pickle.dumps(rtree_index))
     repo.insert_broadcast_areas(areas_to_add, keep_old_polygons)
+    repo.insert_broadcast_area_bounds(bounds_to_add)
 
 
 def _add_local_authorities(dataset_id):
@@ -422,11 +420,26 @@ def _add_counties_and_unitary_authorities(dataset_id):
     repo.insert_broadcast_areas(areas_to_add, keep_old_polygons)
 
 
+def estimate_number_of_smartphones_in_city_of_london():
+    # Share the City of London’s daytime population between its wards
+    # by physical area, reading their polygons back from the database
+    # so this works with --keep-old-polygons too
+    for ward_code in CITY_OF_LONDON.WARDS:
+        ward_id = "wd20-" + ward_code
+        polygons, utm_crs = repo.get_polygons_for_area(ward_id)
+        repo.update_count_of_phones(
+            ward_id,
+            CITY_OF_LONDON.DAYTIME_POPULATION * (
+                Polygons(polygons, utm_crs=utm_crs).estimated_area / CITY_OF_LONDON.AREA_SQUARE_METRES
+            ),
+        )
+
+
 # cheeky global variable
 keep_old_polygons = sys.argv[1:] == ['--keep-old-polygons']
 print('keep_old_polygons: ', keep_old_polygons)  # noqa: T201
 
-repo = BroadcastAreasRepository()
+repo = BroadcastAreasRepository(read_only=False)
 
 if keep_old_polygons:
     repo.delete_library_data()
@@ -436,6 +449,9 @@ else:
 add_test_areas()
 add_countries()
 add_wards_local_authorities_and_counties()
+estimate_number_of_smartphones_in_city_of_london()
+repo.insert_broadcast_area_ancestors()
+repo.update_total_counts_of_phones()
 
 most_detailed_polygons = formatted_list(
     sorted(point_counts, reverse=True)[:5],
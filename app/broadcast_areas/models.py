@@ -1,17 +1,66 @@
 import math
 from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
 
 from notifications_utils.formatters import formatted_list
 from notifications_utils.polygons import Polygons
 from notifications_utils.serialised_model import SerialisedModelCollection
-from rtreelib import Rect
+from shapely.ops import unary_union
+from shapely.prepared import prep
 from werkzeug.utils import cached_property
 
 from app.formatters import square_metres_to_square_miles
 from app.models import SortByNameMixin
 
-from .populations import CITY_OF_LONDON
-from .repo import BroadcastAreasRepository, rtree_index
+from .repo import BroadcastAreasRepository
+
+
+class PolygonsCache:
+    """
+    Keeps the `Polygons` of up to `maxsize` broadcast areas, dropping the least recently used first. Polygons never
+    change once the database is built, so a cache lasts as long as the worker, saving each request from decoding
+    them and building their shapes again.
+    """
+
+    def __init__(self, maxsize, load):
+        self.maxsize = maxsize
+        self.load = load
+        self._polygons = OrderedDict()
+
+    def get(self, area_id):
+        return self.get_many([area_id])[area_id]
+
+    def get_many(self, area_ids):
+        missing_area_ids = [area_id for area_id in area_ids if area_id not in self._polygons]
+        if missing_area_ids:
+            self._polygons.update(self.load(missing_area_ids))
+
+        polygons = {}
+        for area_id in area_ids:
+            if area_id in self._polygons:
+                self._polygons.move_to_end(area_id)
+                polygons[area_id] = self._polygons[area_id]
+
+        while len(self._polygons) > self.maxsize:
+            self._polygons.popitem(last=False)
+
+        return polygons
+
+
+def _load_polygons(area_ids):
+    for area_id in area_ids:
+        polygons, utm_crs = BroadcastAreasRepository().get_polygons_for_area(area_id)
+        yield area_id, Polygons(polygons, utm_crs=utm_crs)
+
+
+def _load_simple_polygons(area_ids):
+    for area_id, simple_polygons, utm_crs in BroadcastAreasRepository().get_simple_polygons_for_areas(area_ids):
+        yield area_id, Polygons(simple_polygons, utm_crs=utm_crs)
+
+
+# Full resolution polygons are only used for a few areas at a time, and can have thousands of points each
+polygons_cache = PolygonsCache(maxsize=100, load=_load_polygons)
+simple_polygons_cache = PolygonsCache(maxsize=2_000, load=_load_simple_polygons)
 
 
 class IdEqualityMixin:
@@ -89,29 +138,18 @@ class BroadcastArea(BaseBroadcastArea, IdEqualityMixin, SortByNameMixin):
         return self.id.startswith('wd20-')
 
     @classmethod
-    def from_row_with_simple_polygons(cls, row):
-        instance = cls(row[:4])
-        instance.simple_polygons = Polygons(
-            row[4],
-            utm_crs=row[5],
-        )
+    def from_row_with_simple_polygons(cls, row, simple_polygons):
+        instance = cls(row)
+        instance.simple_polygons = simple_polygons
         return instance
 
     @cached_property
     def polygons(self):
-        polygons, utm_crs = BroadcastAreasRepository().get_polygons_for_area(self.id)
-        return Polygons(
-            polygons, utm_crs=utm_crs
-        )
+        return polygons_cache.get(self.id)
 
     @cached_property
     def simple_polygons(self):
-        simple_polygons, utm_crs = (
-            BroadcastAreasRepository().get_simple_polygons_for_area(self.id)
-        )
-        return Polygons(
-            simple_polygons, utm_crs=utm_crs
-        ).utm_polygons
+        return simple_polygons_cache.get(self.id).utm_polygons
 
     @cached_property
     def sub_areas(self):
@@ -122,37 +160,33 @@ class BroadcastArea(BaseBroadcastArea, IdEqualityMixin, SortByNameMixin):
 
     @property
     def count_of_phones(self):
-        if self.id.endswith(CITY_OF_LONDON.WARDS):
-            return CITY_OF_LONDON.DAYTIME_POPULATION * (
-                self.polygons.estimated_area / CITY_OF_LONDON.AREA_SQUARE_METRES
-            )
-        if self.sub_areas:
-            return sum(area.count_of_phones for area in self.sub_areas)
-        # TODO: remove the `or 0` once missing data is fixed, see
-        # https://www.pivotaltracker.com/story/show/174837293
-        return self._count_of_phones or 0
+        # Worked out when the database is built, including the sub-areas of this area
+        return self._count_of_phones
 
     @cached_property
     def ancestors(self):
-        return list(self._ancestors_iterator)
+        return _get_ancestors([self])[self.id]
 
     @cached_property
     def parent(self):
         return next(iter(self.ancestors), None)
 
-    @property
-    def _ancestors_iterator(self):
-        id = self.id
 
-        while True:
-            parent = BroadcastAreasRepository().get_parent_for_area(id)
+def _get_ancestors(areas):
+    """
+    Find the ancestors of all of `areas` with one query. Each ancestor gets its own ancestors from the same
+    results, so looking up their parents doesn’t need another query either.
+    """
+    ancestors = defaultdict(list)
 
-            if not parent:
-                return
+    for area_id, row in BroadcastAreasRepository().get_ancestors_for_areas([area.id for area in areas]):
+        ancestors[area_id].append(BroadcastArea(row))
 
-            parent_broadcast_area = BroadcastArea(parent)
-            yield parent_broadcast_area
-            id = parent_broadcast_area.id
+    for chain in ancestors.values():
+        for index, ancestor in enumerate(chain):
+            ancestor.ancestors = chain[index + 1:]
+
+    return ancestors
 
 
 class CustomBroadcastArea(BaseBroadcastArea):
@@ -182,27 +216,45 @@ class CustomBroadcastArea(BaseBroadcastArea):
 
     @cached_property
     def overlapping_electoral_wards(self):
-        return [
-            area for area in self.nearby_electoral_wards
-            if area.simple_polygons.intersects(self.polygons)
-        ]
+        return [area for area, _ratio in self._electoral_wards_with_ratio_of_intersection]
+
+    @cached_property
+    def _electoral_wards_with_ratio_of_intersection(self):
+        """
+        Each nearby electoral ward which intersects this area, with how much of the ward is inside this area. The
+        polygons of this area are prepared once, so testing each ward against them is quick, and the intersection
+        only needs to be worked out for wards which are partly inside this area.
+        """
+        if not self.nearby_electoral_wards:
+            return []
+
+        prepared_polygons = prep(unary_union(list(self.polygons)))
+        results = []
+
+        for area in self.nearby_electoral_wards:
+            if not any(map(prepared_polygons.intersects, area.simple_polygons)):
+                continue
+            if all(map(prepared_polygons.contains, area.simple_polygons)):
+                results.append((area, 1))
+            else:
+                results.append((area, area.simple_polygons.ratio_of_intersection_with(self.polygons)))
+
+        return results
 
     @cached_property
     def nearby_electoral_wards(self):
         if not self.polygons:
             return []
-        return broadcast_area_libraries.get_areas_with_simple_polygons([
+        return broadcast_area_libraries.get_areas_with_simple_polygons(
             # We only index electoral wards in the RTree
-            overlap.data for overlap in rtree_index.query(
-                Rect(*self.simple_polygons.bounds)
-            )
-        ])
+            BroadcastAreasRepository().get_ids_of_areas_overlapping_bounds(self.simple_polygons.bounds)
+        )
 
     @cached_property
     def count_of_phones(self):
         return sum(
-            area.simple_polygons.ratio_of_intersection_with(self.polygons) * area.count_of_phones
-            for area in self.nearby_electoral_wards
+            ratio * area.count_of_phones
+            for area, ratio in self._electoral_wards_with_ratio_of_intersection
         )
 
 
@@ -255,9 +307,15 @@ class BroadcastAreaLibraries(SerialisedModelCollection, GetItemByIdMixin):
         areas = BroadcastAreasRepository().get_areas(area_ids)
         return [BroadcastArea(area) for area in areas]
 
+    def load_ancestors(self, areas):
+        ancestors = _get_ancestors(areas)
+        for area in areas:
+            area.ancestors = ancestors[area.id]
+
     def get_areas_with_simple_polygons(self, area_ids):
-        areas = BroadcastAreasRepository().get_areas_with_simple_polygons(area_ids)
-        return [BroadcastArea.from_row_with_simple_polygons(area) for area in areas]
+        simple_polygons = simple_polygons_cache.get_many(area_ids)
+        areas = BroadcastAreasRepository().get_areas(list(simple_polygons))
+        return [BroadcastArea.from_row_with_simple_polygons(area, simple_polygons[area[0]]) for area in areas]
 
 
 broadcast_area_libraries = BroadcastAreaLibraries()
@@ -1,19 +1,96 @@
-import json
 import os
-import pickle
 import sqlite3
+from array import array
+from collections import defaultdict
 from pathlib import Path
 
-rtree_index_path = Path(__file__).parent / 'rtree.pickle'
-rtree_index = pickle.loads(rtree_index_path.read_bytes())
+from flask import current_app, g, has_request_context, request
+
+# Reads go through a memory map of the database file, so every worker shares the operating system’s cached copy of
+# it rather than reading pages into memory of its own. This is bigger than the file.
+MMAP_SIZE_IN_BYTES = 1024 * 1024 * 1024
+PAGE_CACHE_SIZE_IN_KIB = 16 * 1024
+CACHED_STATEMENTS = 256
+
+_read_only_connections = {}
+
+
+def pack_polygons(polygons):
+    """
+    Pack a list of polygons (each a list of `[x, y]` points) into bytes: the number of polygons and the number of
+    points in each as unsigned 32 bit integers, then every coordinate as a 64 bit float, in native byte order.
+    """
+    counts = array('I', [len(polygons), *(len(polygon) for polygon in polygons)])
+    coordinates = array('d', [
+        coordinate
+        for polygon in polygons
+        for point in polygon
+        for coordinate in point
+    ])
+    return counts.tobytes() + coordinates.tobytes()
+
+
+def unpack_polygons(packed):
+    """
+    Turn bytes from `pack_polygons` back into a list of polygons, each a list of `(x, y)` points.
+    """
+    packed = memoryview(packed)
+    counts, coordinates = array('I'), array('d')
+    counts.frombytes(packed[:counts.itemsize])
+    end_of_counts = counts.itemsize * (1 + counts[0])
+    counts.frombytes(packed[counts.itemsize:end_of_counts])
+    coordinates.frombytes(packed[end_of_counts:])
+
+    coordinates = iter(coordinates)
+    points = list(zip(coordinates, coordinates))
+    polygons, start = [], 0
+    for count_of_points in counts[1:]:
+        polygons.append(points[start:start + count_of_points])
+        start += count_of_points
+    return polygons
+
+
+def _get_read_only_connection(database):
+    """
+    One connection per database for each worker process, kept open for as long as the worker runs. The database
+    only changes when it’s rebuilt and deployed, so it’s opened as immutable, which lets SQLite skip locking it.
+
+    Queries are run and fetched in full without yielding to other green threads, so they can safely share the
+    connection. Statements are prepared once per connection and reused.
+    """
+    key = (os.getpid(), database)
+    if key not in _read_only_connections:
+        conn = sqlite3.connect(
+            f'{database.as_uri()}?mode=ro&immutable=1',
+            uri=True,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        conn.execute(f'PRAGMA mmap_size={MMAP_SIZE_IN_BYTES}')
+        conn.execute(f'PRAGMA cache_size=-{PAGE_CACHE_SIZE_IN_KIB}')
+        _read_only_connections[key] = conn
+    return _read_only_connections[key]
+
+
+def log_broadcast_areas_query_count(exception=None):
+    """
+    Registered as a `teardown_request` handler.
+    """
+    query_count = g.pop('broadcast_areas_query_count', 0)
+    if query_count:
+        current_app.logger.debug(f'Made {query_count} broadcast areas database queries for {request.path}')
 
 
 class BroadcastAreasRepository(object):
-    def __init__(self):
+    def __init__(self, read_only=True):
         self.database = Path(__file__).resolve().parent / 'broadcast-areas.sqlite3'
+        # only create-broadcast-areas-db.py needs to change the database
+        self.read_only = read_only
 
     def conn(self):
-        return sqlite3.connect(str(self.database))
+        conn = sqlite3.connect(str(self.database))
+        conn.execute(f'PRAGMA mmap_size={MMAP_SIZE_IN_BYTES}')
+        return conn
 
     def delete_db(self):
         os.remove(str(self.database))
@@ -42,6 +119,8 @@ class BroadcastAreasRepository(object):
                 broadcast_area_library_id TEXT NOT NULL,
                 broadcast_area_library_group_id TEXT,
                 count_of_phones INTEGER,
+                -- the sum of its sub-areas’ total_count_of_phones if it has any, otherwise count_of_phones
+                total_count_of_phones INTEGER,
 
                 FOREIGN KEY (broadcast_area_library_id)
                     REFERENCES broadcast_area_libraries(id),
@@ -53,11 +132,36 @@ class BroadcastAreasRepository(object):
             conn.execute("""
             CREATE TABLE broadcast_area_polygons (
                 id TEXT PRIMARY KEY,
-                polygons TEXT NOT NULL,
-                simple_polygons TEXT NOT NULL,
+                polygons BLOB NOT NULL,
+                simple_polygons BLOB NOT NULL,
                 utm_crs TEXT NOT NULL
             )""")
 
+            # Every ancestor of every area, with depth 1 for its parent, depth 2 for its parent’s parent and so on
+            conn.execute("""
+            CREATE TABLE broadcast_area_ancestors (
+                broadcast_area_id TEXT NOT NULL,
+                ancestor_id TEXT NOT NULL,
+                depth INTEGER NOT NULL,
+
+                PRIMARY KEY (broadcast_area_id, ancestor_id),
+
+                FOREIGN KEY (broadcast_area_id)
+                    REFERENCES broadcast_areas(id),
+
+                FOREIGN KEY (ancestor_id)
+                    REFERENCES broadcast_areas(id)
+            )""")
+
+            # An R*Tree of the bounding boxes of electoral wards, for finding the wards near a custom area
+            conn.execute("""
+            CREATE VIRTUAL TABLE broadcast_area_bounds USING rtree(
+                id,
+                min_x, max_x,
+                min_y, max_y,
+                +broadcast_area_id TEXT
+            )""")
+
             conn.execute("""
             CREATE INDEX broadcast_areas_broadcast_area_library_id
             ON broadcast_areas (broadcast_area_library_id);
@@ -68,12 +172,20 @@ class BroadcastAreasRepository(object):
             ON broadcast_areas (broadcast_area_library_group_id);
             """)
 
+            conn.execute("""
+            CREATE INDEX broadcast_area_ancestors_ancestor_id
+            ON broadcast_area_ancestors (ancestor_id);
+            """)
+
     def delete_library_data(self):
-        # delete everything except broadcast_area_polygons
+        # delete everything except broadcast_area_polygons. The bounds are cheap to work out again, and the R*Tree
+        # gives every row a new id, so keeping them would add another copy of each one every time
         with self.conn() as conn:
             conn.execute('DELETE FROM broadcast_area_libraries;')
             conn.execute('DELETE FROM broadcast_area_library_groups;')
             conn.execute('DELETE FROM broadcast_areas;')
+            conn.execute('DELETE FROM broadcast_area_ancestors;')
+            conn.execute('DELETE FROM broadcast_area_bounds;')
 
     def insert_broadcast_area_library(self, id, *, name, name_singular, is_group):
 
@@ -111,14 +223,93 @@ class BroadcastAreasRepository(object):
                 ))
                 if not keep_old_features:
                     conn.execute(features_q, (
-                        id, json.dumps(polygons), json.dumps(simple_polygons), utm_crs
+                        id, pack_polygons(polygons), pack_polygons(simple_polygons), utm_crs
                     ))
 
-    def query(self, sql, *args):
+    def insert_broadcast_area_bounds(self, bounds):
+
+        q = """
+        INSERT INTO broadcast_area_bounds (broadcast_area_id, min_x, max_x, min_y, max_y)
+        VALUES (?, ?, ?, ?, ?)
+        """
+
         with self.conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, (*args,))
-            return cursor.fetchall()
+            for id, (min_x, min_y, max_x, max_y) in bounds:
+                conn.execute(q, (id, min_x, max_x, min_y, max_y))
+
+    def update_count_of_phones(self, area_id, count_of_phones):
+
+        q = """
+        UPDATE broadcast_areas
+        SET count_of_phones = ?
+        WHERE id = ?
+        """
+
+        with self.conn() as conn:
+            conn.execute(q, (count_of_phones, area_id))
+
+    def insert_broadcast_area_ancestors(self):
+        # An area’s group is only its parent if that group is an area too
+        q = """
+        INSERT INTO broadcast_area_ancestors (broadcast_area_id, ancestor_id, depth)
+        WITH RECURSIVE ancestors (broadcast_area_id, ancestor_id, depth) AS (
+            SELECT broadcast_areas.id, parents.id, 1
+            FROM broadcast_areas
+            JOIN broadcast_areas AS parents ON parents.id = broadcast_areas.broadcast_area_library_group_id
+
+            UNION ALL
+
+            SELECT ancestors.broadcast_area_id, parents.id, ancestors.depth + 1
+            FROM ancestors
+            JOIN broadcast_areas ON broadcast_areas.id = ancestors.ancestor_id
+            JOIN broadcast_areas AS parents ON parents.id = broadcast_areas.broadcast_area_library_group_id
+        )
+        SELECT broadcast_area_id, ancestor_id, depth
+        FROM ancestors
+        """
+
+        with self.conn() as conn:
+            conn.execute(q)
+
+    def update_total_counts_of_phones(self):
+        areas = self.query("""
+        SELECT id, broadcast_area_library_group_id, count_of_phones
+        FROM broadcast_areas
+        """)
+
+        count_of_phones, sub_area_ids = {}, defaultdict(list)
+        for id, group_id, count in areas:
+            count_of_phones[id] = count
+            sub_area_ids[group_id].append(id)
+
+        total_count_of_phones = {}
+
+        def get_total_count_of_phones(id):
+            if id not in total_count_of_phones:
+                if sub_area_ids[id]:
+                    total_count_of_phones[id] = sum(map(get_total_count_of_phones, sub_area_ids[id]))
+                else:
+                    # TODO: remove the `or 0` once missing data is fixed, see
+                    # https://www.pivotaltracker.com/story/show/174837293
+                    total_count_of_phones[id] = count_of_phones[id] or 0
+            return total_count_of_phones[id]
+
+        q = """
+        UPDATE broadcast_areas
+        SET total_count_of_phones = ?
+        WHERE id = ?
+        """
+
+        with self.conn() as conn:
+            for id in count_of_phones:
+                conn.execute(q, (get_total_count_of_phones(id), id))
+
+    def query(self, sql, *args):
+        if has_request_context():
+            g.broadcast_areas_query_count = g.get('broadcast_areas_query_count', 0) + 1
+
+        conn = _get_read_only_connection(self.database) if self.read_only else self.conn()
+        return conn.execute(sql, (*args,)).fetchall()
 
     def get_libraries(self):
         q = "SELECT id, name, name_singular, is_group FROM broadcast_area_libraries"
@@ -128,7 +319,7 @@ class BroadcastAreasRepository(object):
 
     def get_areas(self, area_ids):
         q = """
-        SELECT id, name, count_of_phones, broadcast_area_library_id
+        SELECT id, name, total_count_of_phones, broadcast_area_library_id
         FROM broadcast_areas
         WHERE id IN ({})
         """.format(",".join("?" * len(area_ids)))
@@ -142,22 +333,32 @@ class BroadcastAreasRepository(object):
 
         return areas
 
-    def get_areas_with_simple_polygons(self, area_ids):
+    def get_simple_polygons_for_areas(self, area_ids):
         q = """
-        SELECT broadcast_areas.id, name, count_of_phones, broadcast_area_library_id, simple_polygons, utm_crs
-        FROM broadcast_areas
-        JOIN broadcast_area_polygons on broadcast_area_polygons.id = broadcast_areas.id
-        WHERE broadcast_areas.id IN ({})
+        SELECT id, simple_polygons, utm_crs
+        FROM broadcast_area_polygons
+        WHERE id IN ({})
         """.format(",".join("?" * len(area_ids)))
 
         results = self.query(q, *area_ids)
 
-        areas = [
-            (row[0], row[1], row[2], row[3], json.loads(row[4]), row[5])
+        return [
+            (row[0], unpack_polygons(row[1]), row[2])
             for row in results
         ]
 
-        return areas
+    def get_ids_of_areas_overlapping_bounds(self, bounds):
+        min_x, min_y, max_x, max_y = bounds
+
+        q = """
+        SELECT broadcast_area_id
+        FROM broadcast_area_bounds
+        WHERE max_x >= ? AND min_x <= ? AND max_y >= ? AND min_y <= ?
+        """
+
+        results = self.query(q, min_x, max_x, min_y, max_y)
+
+        return [row[0] for row in results]
 
     def get_all_areas_for_library(self, library_id):
         is_multi_tier_library = self.query("""
@@ -172,7 +373,7 @@ class BroadcastAreasRepository(object):
         if is_multi_tier_library:
             # only interested in areas with children - eg local authorities, counties, unitary authorities. not wards.
             q = """
-            SELECT id, name, count_of_phones, broadcast_area_library_id
+            SELECT id, name, total_count_of_phones, broadcast_area_library_id
             FROM broadcast_areas
             JOIN (
                 SELECT DISTINCT broadcast_area_library_group_id
@@ -184,7 +385,7 @@ class BroadcastAreasRepository(object):
         else:
             # Countries don't have any children, so the above query wouldn't return anything.
             q = """
-            SELECT id, name, count_of_phones, broadcast_area_library_id
+            SELECT id, name, total_count_of_phones, broadcast_area_library_id
             FROM broadcast_areas
             WHERE broadcast_area_library_id = ?
             """
@@ -198,7 +399,7 @@ class BroadcastAreasRepository(object):
 
     def get_all_areas_for_group(self, group_id):
         q = """
-        SELECT id, name, count_of_phones, broadcast_area_library_id
+        SELECT id, name, total_count_of_phones, broadcast_area_library_id
         FROM broadcast_areas
         WHERE broadcast_area_library_group_id = ?
         """
@@ -212,23 +413,23 @@ class BroadcastAreasRepository(object):
 
         return areas
 
-    def get_parent_for_area(self, area_id):
+    def get_ancestors_for_areas(self, area_ids):
         q = """
-        SELECT id, name, count_of_phones, broadcast_area_library_id
-        FROM broadcast_areas
-        WHERE id IN (
-            SELECT broadcast_area_library_group_id
-            FROM broadcast_areas
-            WHERE id = ?
-        )
-        """
-
-        results = self.query(q, area_id)
+        SELECT
+            broadcast_area_ancestors.broadcast_area_id,
+            ancestors.id, ancestors.name, ancestors.total_count_of_phones, ancestors.broadcast_area_library_id
+        FROM broadcast_area_ancestors
+        JOIN broadcast_areas AS ancestors ON ancestors.id = broadcast_area_ancestors.ancestor_id
+        WHERE broadcast_area_ancestors.broadcast_area_id IN ({})
+        ORDER BY broadcast_area_ancestors.broadcast_area_id, broadcast_area_ancestors.depth
+        """.format(",".join("?" * len(area_ids)))
 
-        if not results:
-            return None
+        results = self.query(q, *area_ids)
 
-        return (results[0][0], results[0][1], results[0][2], results[0][3])
+        return [
+            (row[0], (row[1], row[2], row[3], row[4]))
+            for row in results
+        ]
 
     def get_polygons_for_area(self, area_id):
         q = """
@@ -239,15 +440,4 @@ class BroadcastAreasRepository(object):
 
         results = self.query(q, area_id)
 
-        return json.loads(results[0][0]), results[0][1]
-
-    def get_simple_polygons_for_area(self, area_id):
-        q = """
-        SELECT simple_polygons, utm_crs
-        FROM broadcast_area_polygons
-        WHERE id = ?
-        """
-
-        results = self.query(q, area_id)
-
-        return json.loads(results[0][0]), results[0][1]
+        return unpack_polygons(results[0][0]), results[0][1]
@@ -1,10 +1,14 @@
 from collections import defaultdict
 
-from app.broadcast_areas.models import CustomBroadcastArea
+from app.broadcast_areas.models import (
+    CustomBroadcastArea,
+    broadcast_area_libraries,
+)
 
 
 def aggregate_areas(areas):
     areas = _convert_custom_areas_to_wards(areas)
+    broadcast_area_libraries.load_ancestors(list(areas))
     areas = _aggregate_wards_by_local_authority(areas)
     areas = _aggregate_lower_tier_authorities(areas)
     return sorted(areas)
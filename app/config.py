@@ -1,5 +1,6 @@
 import json
 import os
+import tempfile
 
 if os.environ.get('VCAP_APPLICATION'):
     # on cloudfoundry, config is a json blob in VCAP_APPLICATION - unpack it, and populate
@@ -23,6 +24,11 @@ class Config(object):
 
     TEMPLATE_PREVIEW_API_HOST = os.environ.get('TEMPLATE_PREVIEW_API_HOST', 'http://localhost:6013')
     TEMPLATE_PREVIEW_API_KEY = os.environ.get('TEMPLATE_PREVIEW_API_KEY', 'my-secret-key')
+    # Rendered previews are kept on local disk, where all the workers on an instance can use them, and optionally
+    # in redis as well (see `app.template_previews`). Set the directory to `None` to turn the disk cache off.
+    TEMPLATE_PREVIEW_CACHE_DIRECTORY = os.path.join(tempfile.gettempdir(), 'notify-admin-template-previews')
+    TEMPLATE_PREVIEW_CACHE_MAX_SIZE_IN_BYTES = 256 * 1024 * 1024
+    TEMPLATE_PREVIEW_REDIS_CACHE_ENABLED = os.environ.get('TEMPLATE_PREVIEW_REDIS_CACHE_ENABLED') == '1'
 
     # Logging
     DEBUG = False
@@ -33,7 +39,21 @@ class Config(object):
 
     ASSETS_DEBUG = False
     AWS_REGION = os.environ.get('AWS_REGION')
+    # Each worker shares one pool of connections to S3 between all its green threads (see `app.s3_client`)
+    S3_MAX_POOL_CONNECTIONS = int(os.environ.get('S3_MAX_POOL_CONNECTIONS', 25))
+    S3_MAX_ATTEMPTS = int(os.environ.get('S3_MAX_ATTEMPTS', 3))
+    S3_CONNECT_TIMEOUT_IN_SECONDS = 5
+    S3_READ_TIMEOUT_IN_SECONDS = 30
+    # Requests to template preview and antivirus (see `app.http_client`)
+    HTTP_MAX_POOL_CONNECTIONS = int(os.environ.get('HTTP_MAX_POOL_CONNECTIONS', 25))
+    HTTP_MAX_ATTEMPTS = int(os.environ.get('HTTP_MAX_ATTEMPTS', 3))
+    HTTP_CONNECT_TIMEOUT_IN_SECONDS = 5
+    HTTP_READ_TIMEOUT_IN_SECONDS = 30
     DEFAULT_SERVICE_LIMIT = 50
+    # How long each worker trusts its copy of the organisations’ email domains (see `app.utils.user.is_gov_user`)
+    ORGANISATION_DOMAINS_CACHE_TTL_IN_SECONDS = 60
+    # Audit events are queued and sent to the API from a green thread (see `app.event_handlers.EventQueue`)
+    SEND_EVENTS_IN_BACKGROUND = True
 
     EMAIL_EXPIRY_SECONDS = 3600  # 1 hour
     INVITATION_EXPIRY_SECONDS = 3600 * 24 * 2  # 2 days - also set on api
@@ -69,14 +89,19 @@ class Config(object):
     ANTIVIRUS_ENABLED = True
 
     REDIS_URL = os.environ.get('REDIS_URL')
-    REDIS_ENABLED = True
-    
+    # API responses are only cached in redis if this is switched on (see `app.notify_client.cache`)
+    REDIS_ENABLED = os.environ.get('REDIS_ENABLED') == '1'
+
     BASIC_AUTH_USERNAME = os.environ.get('BASIC_AUTH_USERNAME')
     BASIC_AUTH_PASSWORD = os.environ.get('BASIC_AUTH_PASSWORD')
     BASIC_AUTH_FORCE = True
 
     ASSET_DOMAIN = ''
     ASSET_PATH = '/static/'
+    # Written by `gulp` alongside the static files (see `app.asset_fingerprinter`)
+    ASSET_MANIFEST_FILE = 'asset-manifest.json'
+    # Only turn this on where the hashed copies of the static files are served too
+    ASSET_HASHED_FILENAMES = os.environ.get('ASSET_HASHED_FILENAMES') == '1'
 
     # as defined in api db migration 0331_add_broadcast_org.py
     BROADCAST_ORGANISATION_ID = '38e4bf69-93b0-445d-acee-53ea53fe02df'
@@ -118,11 +143,14 @@ class Development(Config):
     ANTIVIRUS_API_HOST = 'http://localhost:6016'
     ANTIVIRUS_API_KEY = 'test-key'
     ANTIVIRUS_ENABLED = os.getenv('ANTIVIRUS_ENABLED') == '1'
+    # `flask run` doesn’t use eventlet, so nothing would run the green thread which sends queued events
+    SEND_EVENTS_IN_BACKGROUND = False
 
     ASSET_PATH = '/static/'
+    # `gulp watch` rebuilds files without updating the manifest, so hash them as they're used instead
+    ASSET_MANIFEST_FILE = None
 
     REDIS_URL = os.environ.get('DEV_REDIS_URL', 'http://redis:6379')
-    REDIS_ENABLED = True
 
 
 class Test(Development):
@@ -140,6 +168,8 @@ class Test(Development):
     NOTIFY_ENVIRONMENT = 'test'
     API_HOST_NAME = 'http://you-forgot-to-mock-an-api-call-to'
     TEMPLATE_PREVIEW_API_HOST = 'http://localhost:9999'
+    TEMPLATE_PREVIEW_CACHE_DIRECTORY = None
+    ORGANISATION_DOMAINS_CACHE_TTL_IN_SECONDS = 0
     ANTIVIRUS_API_HOST = 'https://test-antivirus'
     ANTIVIRUS_API_KEY = 'test-antivirus-secret'
     ANTIVIRUS_ENABLED = True
@@ -202,8 +232,7 @@ class Live(Config):
     ASSET_PATH = 'https://static.notifications.service.gov.uk/'
     
     REDIS_URL = os.environ.get('REDIS_URL')
-    REDIS_ENABLED = True
-    
+
     ADMIN_CLIENT_SECRET = os.environ.get('ADMIN_CLIENT_SECRET')
     ADMIN_CLIENT_USER_NAME = os.environ.get('ADMIN_CLIENT_USERNAME')
     API_HOST_NAME = os.environ.get('API_HOST_NAME')
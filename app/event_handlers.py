@@ -1,7 +1,23 @@
-from flask import request
+import time
+from collections import deque
+
+from eventlet import sleep, spawn
+from flask import current_app, request
+from gds_metrics.metrics import Gauge, Histogram
 
 from app.notify_client.events_api_client import events_api_client
 
+EVENT_QUEUE_DEPTH = Gauge(
+    'admin_event_queue_depth',
+    'Audit events waiting to be sent to the API',
+    multiprocess_mode='livesum',
+)
+
+EVENT_FLUSH_DURATION = Histogram(
+    'admin_event_flush_duration_seconds',
+    'Time taken to send a batch of queued audit events to the API',
+)
+
 EVENT_SCHEMAS = {
     "sucessful_login": {"user_id"},
     "update_user_email": {"user_id", "updated_by_id", "original_email_address", "new_email_address"},
@@ -71,7 +87,86 @@ def _send_event(event_type, **kwargs):
     event_data = _construct_event_data(request)
     event_data.update(kwargs)
 
-    events_api_client.create_event(event_type, event_data)
+    event_queue.put(event_type, event_data)
+
+
+class EventQueue:
+    """
+    Sends audit events to the API from a green thread, so the request which caused them (a sign in, for example)
+    doesn’t wait for the API. Events are sent in batches of up to `MAX_BATCH_SIZE`. An event which fails is put back
+    on the queue and retried, with a growing delay, up to `MAX_ATTEMPTS` times.
+
+    Anything still queued when a worker stops is sent by `flush_on_exit`, called from gunicorn’s `worker_exit` hook.
+    With `SEND_EVENTS_IN_BACKGROUND` off events are sent straight away, as part of the request.
+    """
+
+    MAX_BATCH_SIZE = 50
+    MAX_ATTEMPTS = 5
+    RETRY_DELAY_IN_SECONDS = 0.5
+
+    def __init__(self):
+        self.app = None
+        self.events = deque()
+        self._sender = None
+
+    def init_app(self, app):
+        self.app = app
+
+    def put(self, event_type, event_data):
+        if not current_app.config['SEND_EVENTS_IN_BACKGROUND']:
+            events_api_client.create_event(event_type, event_data)
+            return
+
+        self.events.append((event_type, event_data, 1))
+        EVENT_QUEUE_DEPTH.set(len(self.events))
+
+        # a green thread is falsy once it has finished, so compare with `None`
+        if self._sender is None:
+            self._sender = spawn(self._send_in_background)
+
+    def flush_on_exit(self):
+        if self.app is None:
+            return
+        with self.app.app_context():
+            while self.events:
+                self.flush()
+
+    def flush(self):
+        """
+        Send the next batch of events. Returns the most times any event in the batch had been tried, if any of them
+        failed, or 0 if they were all sent.
+        """
+        most_attempts_failed = 0
+        started_at = time.monotonic()
+
+        for _ in range(min(self.MAX_BATCH_SIZE, len(self.events))):
+            event_type, event_data, attempt = self.events.popleft()
+            try:
+                events_api_client.create_event(event_type, event_data)
+            except Exception:
+                if attempt >= self.MAX_ATTEMPTS:
+                    current_app.logger.exception(f'Giving up sending {event_type} event after {attempt} attempts')
+                else:
+                    current_app.logger.warning(f'Failed to send {event_type} event (attempt {attempt}), will retry')
+                    self.events.append((event_type, event_data, attempt + 1))
+                    most_attempts_failed = max(most_attempts_failed, attempt)
+
+        EVENT_FLUSH_DURATION.observe(time.monotonic() - started_at)
+        EVENT_QUEUE_DEPTH.set(len(self.events))
+        return most_attempts_failed
+
+    def _send_in_background(self):
+        try:
+            with self.app.app_context():
+                while self.events:
+                    attempts = self.flush()
+                    if attempts:
+                        sleep(self.RETRY_DELAY_IN_SECONDS * 2 ** (attempts - 1))
+        finally:
+            self._sender = None
+
+
+event_queue = EventQueue()
 
 
 def _construct_event_data(request):
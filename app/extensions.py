@@ -1,9 +1,46 @@
+from flask import current_app, has_request_context, request
 from notifications_utils.clients.antivirus.antivirus_client import (
     AntivirusClient,
+    AntivirusError,
 )
 from notifications_utils.clients.redis.redis_client import RedisClient
 from notifications_utils.clients.zendesk.zendesk_client import ZendeskClient
+from requests import RequestException
 
-antivirus_client = AntivirusClient()
+from app.http_client import PooledHTTPClient
+
+
+class AdminAntivirusClient(AntivirusClient):
+    """
+    Scans files like `AntivirusClient`, but through a `PooledHTTPClient`, so scans reuse connections, time out and
+    are retried if antivirus is briefly unavailable.
+    """
+
+    http_client = PooledHTTPClient('antivirus')
+
+    def scan(self, document_stream):
+        headers = {'Authorization': 'Bearer {}'.format(self.auth_token)}
+        if has_request_context() and hasattr(request, 'get_onwards_request_headers'):
+            headers.update(request.get_onwards_request_headers())
+
+        try:
+            response = self.http_client.post(
+                '{}/scan'.format(self.api_host),
+                headers=headers,
+                files={'document': document_stream},
+                idempotent=True,
+            )
+            response.raise_for_status()
+        except RequestException as e:
+            error = AntivirusError.from_exception(e)
+            current_app.logger.warning('Notify Antivirus API request failed with error: {}'.format(error.message))
+            raise error
+        finally:
+            document_stream.seek(0)
+
+        return response.json()['ok']
+
+
+antivirus_client = AdminAntivirusClient()
 zendesk_client = ZendeskClient()
 redis_client = RedisClient()
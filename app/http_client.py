@@ -0,0 +1,109 @@
+import time
+from urllib.parse import urlsplit
+
+import requests
+from flask import current_app
+from gds_metrics.metrics import Histogram
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_REQUEST_DURATION = Histogram(
+    'admin_http_request_duration_seconds',
+    'Time taken by requests from the admin app to other services, like template preview and antivirus',
+    ['service', 'path'],
+)
+
+
+class CircuitOpenError(requests.ConnectionError):
+    pass
+
+
+class PooledHTTPClient:
+    """
+    Makes requests to another service (eg template preview) through one `requests.Session` per worker, so
+    connections are kept alive and reused rather than opened for every request. Requests time out, and requests
+    which are safe to repeat (`idempotent=True`) are retried a few times if they can’t connect or get a 502, 503 or
+    504.
+
+    After `CIRCUIT_BREAKER_FAILURE_THRESHOLD` failures in a row the circuit opens: requests fail straight away with
+    `CircuitOpenError` for `CIRCUIT_BREAKER_RESET_AFTER_IN_SECONDS`, rather than tying up a worker waiting for a
+    service which is down. After that requests are let through again: the circuit closes when one succeeds, or opens
+    again as soon as one fails.
+    """
+
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+    CIRCUIT_BREAKER_RESET_AFTER_IN_SECONDS = 30
+
+    RETRIED_STATUS_CODES = {502, 503, 504}
+
+    def __init__(self, service_name):
+        self.service_name = service_name
+        self._sessions = {}
+        self._failures = 0
+        self._circuit_opened_at = None
+
+    def post(self, url, *, idempotent=False, **kwargs):
+        self._check_circuit()
+        started_at = time.monotonic()
+        try:
+            response = self._get_session(idempotent).post(
+                url,
+                timeout=(
+                    current_app.config['HTTP_CONNECT_TIMEOUT_IN_SECONDS'],
+                    current_app.config['HTTP_READ_TIMEOUT_IN_SECONDS'],
+                ),
+                **kwargs
+            )
+        except requests.RequestException:
+            self._record_failure()
+            raise
+        finally:
+            HTTP_REQUEST_DURATION.labels(self.service_name, urlsplit(url).path).observe(
+                time.monotonic() - started_at
+            )
+
+        if response.status_code >= 500:
+            self._record_failure()
+        else:
+            self._record_success()
+
+        return response
+
+    def _get_session(self, idempotent):
+        # created the first time each worker needs it, so sessions are never shared between forked processes
+        if idempotent not in self._sessions:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_maxsize=current_app.config['HTTP_MAX_POOL_CONNECTIONS'],
+                max_retries=Retry(
+                    total=current_app.config['HTTP_MAX_ATTEMPTS'] - 1,
+                    allowed_methods=frozenset({'POST'}),
+                    status_forcelist=self.RETRIED_STATUS_CODES,
+                    backoff_factor=0.1,
+                    # give the last response back to the caller rather than raising
+                    raise_on_status=False,
+                ) if idempotent else 0,
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._sessions[idempotent] = session
+        return self._sessions[idempotent]
+
+    def _check_circuit(self):
+        if self._circuit_opened_at is None:
+            return
+        if time.monotonic() - self._circuit_opened_at < self.CIRCUIT_BREAKER_RESET_AFTER_IN_SECONDS:
+            raise CircuitOpenError(f'Not sending request to {self.service_name}: too many requests have failed')
+        # let this request through to see if the service has recovered
+        self._circuit_opened_at = None
+
+    def _record_failure(self):
+        self._failures += 1
+        if self._failures >= self.CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+            if self._circuit_opened_at is None:
+                current_app.logger.warning(f'Circuit opened for {self.service_name} after {self._failures} failures')
+            self._circuit_opened_at = time.monotonic()
+
+    def _record_success(self):
+        self._failures = 0
+        self._circuit_opened_at = None
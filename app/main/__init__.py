@@ -32,6 +32,7 @@ from app.main.views import (  # noqa isort:skip
     pricing,
     providers,
     register,
+    reports,
     returned_letters,
     security_policy,
     send,
@@ -2450,6 +2450,17 @@ class AdminClearCacheForm(StripWhitespaceForm):
             raise ValidationError('Select at least one option')
 
 
+class AdminClearTemporaryLogosForm(StripWhitespaceForm):
+    older_than_hours = GovukIntegerField(
+        'Remove temporary logos uploaded more than this many hours ago',
+        validators=[
+            InputRequired(message='Cannot be empty'),
+            validators.NumberRange(min=1, message='Must be at least 1'),
+        ],
+        default=24,
+    )
+
+
 class AdminOrganisationGoLiveNotesForm(StripWhitespaceForm):
     request_to_go_live_notes = TextAreaField(
         'Go live notes',
@@ -1,5 +1,7 @@
+import os
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from notifications_utils.field import Field
 from notifications_utils.formatters import formatted_list
@@ -11,10 +13,28 @@ from notifications_utils.sanitise_text import SanitiseSMS
 from notifications_utils.template import BroadcastMessageTemplate
 from wtforms import ValidationError
 
-from app.main._commonly_used_passwords import commonly_used_passwords
 from app.models.spreadsheet import Spreadsheet
 from app.utils.user import is_gov_user
 
+# One password per line, sorted
+COMMONLY_USED_PASSWORDS_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), 'commonly_used_passwords.txt'
+)
+
+# Common character substitutions, so `P4ssw0rd` is treated the same as `password`
+PASSWORD_SUBSTITUTIONS = str.maketrans('0134579@$!', 'oieastgasi')
+
+
+def normalise_password(password):
+    return password.casefold().translate(PASSWORD_SUBSTITUTIONS)
+
+
+@lru_cache(maxsize=None)
+def get_commonly_used_passwords():
+    # loaded the first time a password is checked, rather than by every worker as it starts
+    with open(COMMONLY_USED_PASSWORDS_FILE) as commonly_used_passwords:
+        return frozenset(normalise_password(line.rstrip('\n')) for line in commonly_used_passwords)
+
 
 class CommonlyUsedPassword:
     def __init__(self, message=None):
@@ -23,7 +43,7 @@ class CommonlyUsedPassword:
         self.message = message
 
     def __call__(self, form, field):
-        if field.data in commonly_used_passwords:
+        if normalise_password(field.data) in get_commonly_used_passwords():
             raise ValidationError(self.message)
 
 
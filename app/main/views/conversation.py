@@ -1,4 +1,8 @@
-from flask import jsonify, redirect, render_template, session, url_for
+import heapq
+import json
+from functools import lru_cache, partial
+
+from flask import redirect, render_template, session, url_for
 from flask_login import current_user
 from notifications_python_client.errors import HTTPError
 from notifications_utils.recipients import format_phone_number_human_readable
@@ -8,8 +12,13 @@ from app import current_service, notification_api_client, service_api_client
 from app.main import main
 from app.main.forms import SearchByNameForm
 from app.models.template_list import TemplateList
+from app.utils.concurrency import run_concurrently
+from app.utils.polling import partials_response
 from app.utils.user import user_has_permissions
 
+# Rendered messages are kept by each worker, so a poll only renders the messages it hasn’t seen before
+RENDERED_MESSAGES_CACHE_SIZE = 1000
+
 
 @main.route("/services/<uuid:service_id>/conversation/<uuid:notification_id>")
 @user_has_permissions('view_activity')
@@ -30,10 +39,11 @@ def conversation(service_id, notification_id):
 @user_has_permissions('view_activity')
 def conversation_updates(service_id, notification_id):
 
-    return jsonify(get_conversation_partials(
-        service_id,
-        get_user_number(service_id, notification_id)
-    ))
+    conversation_data = get_conversation_data(service_id, get_user_number(service_id, notification_id))
+    return partials_response(
+        partial(render_conversation_partials, *conversation_data),
+        upstream_data=conversation_data,
+    )
 
 
 @main.route("/services/<uuid:service_id>/conversation/<uuid:notification_id>/reply-with")
@@ -79,11 +89,27 @@ def conversation_reply_with_template(
 
 
 def get_conversation_partials(service_id, user_number):
+    return render_conversation_partials(*get_conversation_data(service_id, user_number))
+
+
+def get_conversation_data(service_id, user_number):
+    return run_concurrently(
+        partial(
+            notification_api_client.get_notifications_for_service,
+            service_id,
+            to=user_number,
+            template_type='sms',
+        ),
+        partial(service_api_client.get_inbound_sms, service_id, user_number=user_number),
+    )
+
+
+def render_conversation_partials(notifications, inbound_sms):
 
     return {
         'messages': render_template(
             'views/conversations/messages.html',
-            conversation=get_sms_thread(service_id, user_number),
+            conversation=get_sms_thread(notifications['notifications'], inbound_sms['data']),
         )
     }
 
@@ -98,36 +124,46 @@ def get_user_number(service_id, notification_id):
     return format_phone_number_human_readable(user_number)
 
 
-def get_sms_thread(service_id, user_number):
-
-    for notification in sorted((  # noqa: B020
-        notification_api_client.get_notifications_for_service(service_id,
-                                                              to=user_number,
-                                                              template_type='sms')['notifications'] +
-        service_api_client.get_inbound_sms(service_id, user_number=user_number)['data']
-    ), key=lambda notification: notification['created_at']):
+def get_sms_thread(notifications, inbound_sms):
+    """
+    Both lists come from the API newest first, so the thread (oldest first) is a merge of the two lists reversed,
+    rather than a sort of everything.
+    """
+    for notification in heapq.merge(
+        reversed(notifications),
+        reversed(inbound_sms),
+        key=lambda notification: notification['created_at'],
+    ):
 
         is_inbound = ('notify_number' in notification)
         redact_personalisation = not is_inbound and notification['template']['redact_personalisation']
 
-        if redact_personalisation:
-            notification['personalisation'] = {}
-
         yield {
             'inbound': is_inbound,
-            'content': SMSPreviewTemplate(
-                {
-                    'template_type': 'sms',
-                    'content': (
-                        notification['content'] if is_inbound else
-                        notification['template']['content']
-                    )
-                },
-                notification.get('personalisation'),
-                downgrade_non_sms_characters=(not is_inbound),
-                redact_missing_personalisation=redact_personalisation,
+            'content': _render_message(
+                notification['content'] if is_inbound else notification['template']['content'],
+                json.dumps(
+                    {} if redact_personalisation else notification.get('personalisation'),
+                    sort_keys=True,
+                ),
+                is_inbound,
+                redact_personalisation,
             ),
             'created_at': notification['created_at'],
             'status': notification.get('status'),
             'id': notification['id'],
         }
+
+
+@lru_cache(maxsize=RENDERED_MESSAGES_CACHE_SIZE)
+def _render_message(content, personalisation, is_inbound, redact_personalisation):
+    # personalisation is passed as JSON so it can be part of the cache key
+    return str(SMSPreviewTemplate(
+        {
+            'template_type': 'sms',
+            'content': content,
+        },
+        json.loads(personalisation),
+        downgrade_non_sms_characters=(not is_inbound),
+        redact_missing_personalisation=redact_personalisation,
+    ))
@@ -3,15 +3,7 @@ from datetime import datetime
 from functools import partial
 from itertools import groupby
 
-from flask import (
-    Response,
-    abort,
-    jsonify,
-    render_template,
-    request,
-    session,
-    url_for,
-)
+from flask import Response, abort, render_template, request, session, url_for
 from flask_login import current_user
 from notifications_utils.recipients import format_phone_number_human_readable
 from werkzeug.utils import redirect
@@ -24,6 +16,7 @@ from app import (
 )
 from app.formatters import format_date_numeric, format_datetime_numeric
 from app.main import main
+from app.models.spreadsheet import Spreadsheet
 from app.statistics_utils import get_formatted_percentage
 from app.utils import (
     DELIVERED_STATUSES,
@@ -31,8 +24,9 @@ from app.utils import (
     REQUESTED_STATUSES,
     service_has_permission,
 )
-from app.utils.csv import Spreadsheet
+from app.utils.concurrency import run_concurrently
 from app.utils.pagination import generate_next_dict, generate_previous_dict
+from app.utils.polling import partials_response
 from app.utils.time import get_current_financial_year
 from app.utils.user import user_has_permissions
 
@@ -67,7 +61,11 @@ def service_dashboard(service_id):
 @main.route("/services/<uuid:service_id>/dashboard.json")
 @user_has_permissions('view_activity')
 def service_dashboard_updates(service_id):
-    return jsonify(**get_dashboard_partials(service_id))
+    dashboard_data = get_dashboard_data(service_id)
+    return partials_response(
+        partial(render_dashboard_partials, service_id, *dashboard_data),
+        upstream_data=dashboard_data,
+    )
 
 
 @main.route("/services/<uuid:service_id>/template-activity")
@@ -131,9 +129,11 @@ def template_usage(service_id):
 def usage(service_id):
     year, current_financial_year = requested_and_current_financial_year(request)
 
-    free_sms_allowance = billing_api_client.get_free_sms_fragment_limit_for_year(service_id, year)
-    units = billing_api_client.get_monthly_usage_for_service(service_id, year)
-    yearly_usage = billing_api_client.get_annual_usage_for_service(service_id, year)
+    free_sms_allowance, units, yearly_usage = run_concurrently(
+        partial(billing_api_client.get_free_sms_fragment_limit_for_year, service_id, year),
+        partial(billing_api_client.get_monthly_usage_for_service, service_id, year),
+        partial(billing_api_client.get_annual_usage_for_service, service_id, year),
+    )
 
     return render_template(
         'views/usage.html',
@@ -182,8 +182,11 @@ def inbox(service_id):
 @user_has_permissions('view_activity')
 @service_has_permission('inbound_sms')
 def inbox_updates(service_id):
-
-    return jsonify(get_inbox_partials(service_id))
+    inbound_messages_data = get_inbox_data(service_id)
+    return partials_response(
+        partial(render_inbox_partials, service_id, inbound_messages_data),
+        upstream_data=inbound_messages_data,
+    )
 
 
 @main.route("/services/<uuid:service_id>/inbox.csv")
@@ -211,8 +214,16 @@ def inbox_download(service_id):
 
 
 def get_inbox_partials(service_id):
+    return render_inbox_partials(service_id, get_inbox_data(service_id))
+
+
+def get_inbox_data(service_id):
+    page = int(request.args.get('page', 1))
+    return service_api_client.get_most_recent_inbound_sms(service_id, page=page)
+
+
+def render_inbox_partials(service_id, inbound_messages_data):
     page = int(request.args.get('page', 1))
-    inbound_messages_data = service_api_client.get_most_recent_inbound_sms(service_id, page=page)
     inbound_messages = inbound_messages_data['data']
     if not inbound_messages:
         inbound_number = current_service.inbound_number
@@ -274,19 +285,30 @@ def aggregate_notifications_stats(template_statistics):
 
 
 def get_dashboard_partials(service_id):
-    all_statistics = template_statistics_client.get_template_statistics_for_service(service_id, limit_days=7)
+    return render_dashboard_partials(service_id, *get_dashboard_data(service_id))
+
+
+def get_dashboard_data(service_id):
+    return run_concurrently(
+        partial(template_statistics_client.get_template_statistics_for_service, service_id, limit_days=7),
+        partial(
+            billing_api_client.get_free_sms_fragment_limit_for_year,
+            current_service.id,
+            get_current_financial_year(),
+        ),
+        partial(
+            billing_api_client.get_annual_usage_for_service,
+            service_id,
+            get_current_financial_year(),
+        ),
+    )
+
+
+def render_dashboard_partials(service_id, all_statistics, free_sms_allowance, yearly_usage):
     template_statistics = aggregate_template_usage(all_statistics)
     stats = aggregate_notifications_stats(all_statistics)
 
     dashboard_totals = get_dashboard_totals(stats),
-    free_sms_allowance = billing_api_client.get_free_sms_fragment_limit_for_year(
-        current_service.id,
-        get_current_financial_year(),
-    )
-    yearly_usage = billing_api_client.get_annual_usage_for_service(
-        service_id,
-        get_current_financial_year(),
-    )
     return {
         'upcoming': render_template(
             'views/dashboard/_upcoming.html',
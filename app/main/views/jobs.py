@@ -7,11 +7,9 @@ from flask import (
     Response,
     abort,
     flash,
-    jsonify,
     redirect,
     render_template,
     request,
-    stream_with_context,
     url_for,
 )
 from flask_login import current_user
@@ -32,8 +30,10 @@ from app import (
 from app.formatters import get_time_left, message_count_noun
 from app.main import main
 from app.main.forms import SearchNotificationsForm
+from app.main.views.reports import report_response
 from app.models.job import Job
 from app.utils import parse_filter_args, set_status_filters
+from app.utils.concurrency import run_concurrently
 from app.utils.csv import generate_notifications_csv
 from app.utils.letters import (
     get_letter_printing_statement,
@@ -44,6 +44,7 @@ from app.utils.pagination import (
     generate_previous_dict,
     get_page_from_request,
 )
+from app.utils.polling import partials_response
 from app.utils.user import user_has_permissions
 
 
@@ -94,25 +95,19 @@ def view_job_csv(service_id, job_id):
     filter_args = parse_filter_args(request.args)
     filter_args['status'] = set_status_filters(filter_args)
 
-    return Response(
-        stream_with_context(
-            generate_notifications_csv(
-                service_id=service_id,
-                job_id=job_id,
-                status=filter_args.get('status'),
-                page=request.args.get('page', 1),
-                page_size=5000,
-                format_for_csv=True,
-                template_type=job.template_type,
-            )
+    return report_response(
+        generate_notifications_csv,
+        filename='{} - {}.csv'.format(
+            job.template['name'],
+            format_datetime_short(job.created_at)
         ),
-        mimetype='text/csv',
-        headers={
-            'Content-Disposition': 'inline; filename="{} - {}.csv"'.format(
-                job.template['name'],
-                format_datetime_short(job.created_at)
-            )
-        }
+        service_id=service_id,
+        job_id=job_id,
+        status=filter_args.get('status'),
+        page=request.args.get('page', 1),
+        page_size=5000,
+        format_for_csv=True,
+        template_type=job.template_type,
     )
 
 
@@ -151,8 +146,12 @@ def cancel_letter_job(service_id, job_id):
 def view_job_updates(service_id, job_id):
 
     job = Job.from_id(job_id, service_id=service_id)
+    job_data = get_job_data(job)
 
-    return jsonify(**get_job_partials(job))
+    return partials_response(
+        partial(render_job_partials, job, *job_data),
+        upstream_data=[job._dict, *job_data],
+    )
 
 
 @main.route('/services/<uuid:service_id>/notifications', methods=['GET', 'POST'])
@@ -193,9 +192,11 @@ def view_notifications(service_id, message_type=None):
 @main.route('/services/<uuid:service_id>/notifications/<template_type:message_type>.json', methods=['GET', 'POST'])
 @user_has_permissions()
 def get_notifications_as_json(service_id, message_type=None):
-    return jsonify(get_notifications(
-        service_id, message_type, status_override=request.args.get('status')
-    ))
+    notifications_data = get_notifications_data(service_id, message_type)
+    return partials_response(
+        partial(render_notifications_partials, service_id, message_type, *notifications_data),
+        upstream_data=notifications_data,
+    )
 
 
 @main.route('/services/<uuid:service_id>/notifications.csv', endpoint="view_notifications_csv")
@@ -205,40 +206,71 @@ def get_notifications_as_json(service_id, message_type=None):
 )
 @user_has_permissions()
 def get_notifications(service_id, message_type, status_override=None):
-    # TODO get the api to return count of pages as well.
-    page = get_page_from_request()
-    if page is None:
-        abort(404, "Invalid page argument ({}).".format(request.args.get('page')))
-    filter_args = parse_filter_args(request.args)
-    filter_args['status'] = set_status_filters(filter_args)
-    service_data_retention_days = None
-    search_term = request.form.get('to', '')
-
-    if message_type is not None:
-        service_data_retention_days = current_service.get_days_of_retention(message_type)
-
     if request.path.endswith('csv') and current_user.has_permissions('view_activity'):
+        filter_args = parse_filter_args(request.args)
+        filter_args['status'] = set_status_filters(filter_args)
         return Response(
             generate_notifications_csv(
                 service_id=service_id,
-                page=page,
+                page=_get_notifications_page(),
                 page_size=5000,
                 template_type=[message_type],
                 status=filter_args.get('status'),
-                limit_days=service_data_retention_days
+                limit_days=_get_notifications_days_of_retention(message_type),
             ),
             mimetype='text/csv',
             headers={
                 'Content-Disposition': 'inline; filename="notifications.csv"'}
         )
-    notifications = notification_api_client.get_notifications_for_service(
-        service_id=service_id,
-        page=page,
-        template_type=[message_type] if message_type else [],
-        status=filter_args.get('status'),
-        limit_days=service_data_retention_days,
-        to=search_term,
+    return render_notifications_partials(
+        service_id, message_type, *get_notifications_data(service_id, message_type)
     )
+
+
+def _get_notifications_page():
+    # TODO get the api to return count of pages as well.
+    page = get_page_from_request()
+    if page is None:
+        abort(404, "Invalid page argument ({}).".format(request.args.get('page')))
+    return page
+
+
+def _get_notifications_days_of_retention(message_type):
+    if message_type is None:
+        return None
+    return current_service.get_days_of_retention(message_type)
+
+
+def get_notifications_data(service_id, message_type):
+    page = _get_notifications_page()
+    filter_args = parse_filter_args(request.args)
+    filter_args['status'] = set_status_filters(filter_args)
+    service_data_retention_days = _get_notifications_days_of_retention(message_type)
+
+    notifications, service_statistics = run_concurrently(
+        partial(
+            notification_api_client.get_notifications_for_service,
+            service_id=service_id,
+            page=page,
+            template_type=[message_type] if message_type else [],
+            status=filter_args.get('status'),
+            limit_days=service_data_retention_days,
+            to=request.form.get('to', ''),
+        ),
+        partial(
+            service_api_client.get_service_statistics,
+            service_id,
+            limit_days=service_data_retention_days,
+        ),
+    )
+    return notifications, service_statistics, service_data_retention_days
+
+
+def render_notifications_partials(
+    service_id, message_type, notifications, service_statistics, service_data_retention_days
+):
+    page = _get_notifications_page()
+    search_term = request.form.get('to', '')
     url_args = {
         'message_type': message_type,
         'status': request.args.get('status')
@@ -270,10 +302,7 @@ def get_notifications(service_id, message_type, status_override=None):
             status_filters=get_status_filters(
                 current_service,
                 message_type,
-                service_api_client.get_service_statistics(
-                    service_id,
-                    limit_days=service_data_retention_days
-                )
+                service_statistics,
             )
         ),
         'notifications': render_template(
@@ -386,9 +415,21 @@ def _get_job_counts(job):
 
 
 def get_job_partials(job):
+    return render_job_partials(job, *get_job_data(job))
+
+
+def get_job_data(job):
+    filter_args = parse_filter_args(request.args)
+    filter_args['status'] = set_status_filters(filter_args)
+    return run_concurrently(
+        partial(job.get_notifications, status=filter_args['status']),
+        partial(current_service.get_days_of_retention, job.template_type),
+    )
+
+
+def render_job_partials(job, notifications, service_data_retention_days):
     filter_args = parse_filter_args(request.args)
     filter_args['status'] = set_status_filters(filter_args)
-    notifications = job.get_notifications(status=filter_args['status'])
     if job.template_type == 'letter':
         counts = render_template(
             'partials/jobs/count-letters.html',
@@ -403,7 +444,6 @@ def get_job_partials(job):
                 job.status == 'finished' and not notifications['notifications']
             ),
         )
-    service_data_retention_days = current_service.get_days_of_retention(job.template_type)
 
     return {
         'counts': counts,
@@ -4,19 +4,10 @@ import io
 import json
 import os
 from datetime import datetime
+from functools import partial
 
 from dateutil import parser
-from flask import (
-    Response,
-    flash,
-    jsonify,
-    redirect,
-    render_template,
-    request,
-    send_file,
-    stream_with_context,
-    url_for,
-)
+from flask import flash, redirect, render_template, request, send_file, url_for
 from notifications_python_client.errors import APIError, HTTPError
 from notifications_utils import LETTER_MAX_PAGE_COUNT
 from notifications_utils.letter_timings import (
@@ -33,6 +24,7 @@ from app import (
     notification_api_client,
 )
 from app.main import main
+from app.main.views.reports import report_response
 from app.notify_client.api_key_api_client import KEY_TYPE_TEST
 from app.template_previews import get_page_count_for_letter
 from app.utils import (
@@ -47,6 +39,7 @@ from app.utils.letters import (
     get_letter_printing_statement,
     get_letter_validation_error,
 )
+from app.utils.polling import partials_response
 from app.utils.templates import get_template
 from app.utils.user import user_has_permissions
 
@@ -257,9 +250,11 @@ def get_letter_file_data(service_id, notification_id, filetype, with_metadata=Fa
 @main.route("/services/<uuid:service_id>/notification/<uuid:notification_id>.json")
 @user_has_permissions('view_activity', 'send_messages')
 def view_notification_updates(service_id, notification_id):
-    return jsonify(**get_single_notification_partials(
-        notification_api_client.get_notification(service_id, notification_id)
-    ))
+    notification = notification_api_client.get_notification(service_id, notification_id)
+    return partials_response(
+        partial(get_single_notification_partials, notification),
+        upstream_data=notification,
+    )
 
 
 def get_single_notification_partials(notification):
@@ -295,24 +290,19 @@ def download_notifications_csv(service_id):
     filter_args['status'] = set_status_filters(filter_args)
 
     service_data_retention_days = current_service.get_days_of_retention(filter_args.get('message_type')[0])
-    return Response(
-        stream_with_context(
-            generate_notifications_csv(
-                service_id=service_id,
-                job_id=None,
-                status=filter_args.get('status'),
-                page=request.args.get('page', 1),
-                page_size=10000,
-                format_for_csv=True,
-                template_type=filter_args.get('message_type'),
-                limit_days=service_data_retention_days,
-            )
+    return report_response(
+        generate_notifications_csv,
+        filename='{} - {} - {} report.csv'.format(
+            format_date_numeric(datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ")),
+            filter_args['message_type'][0],
+            current_service.name,
         ),
-        mimetype='text/csv',
-        headers={
-            'Content-Disposition': 'inline; filename="{} - {} - {} report.csv"'.format(
-                format_date_numeric(datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ")),
-                filter_args['message_type'][0],
-                current_service.name)
-        }
+        service_id=service_id,
+        job_id=None,
+        status=filter_args.get('status'),
+        page=request.args.get('page', 1),
+        page_size=10000,
+        format_for_csv=True,
+        template_type=filter_args.get('message_type'),
+        limit_days=service_data_retention_days,
     )
@@ -39,12 +39,17 @@ from app.main.views.dashboard import (
     get_tuples_of_financial_years,
     requested_and_current_financial_year,
 )
+from app.main.views.reports import report_response
 from app.main.views.service_settings import get_branding_as_value_and_label
 from app.models.organisation import AllOrganisations, Organisation
+from app.models.spreadsheet import Spreadsheet
 from app.models.user import InvitedOrgUser, User
 from app.s3_client.s3_mou_client import get_mou
-from app.utils.csv import Spreadsheet
-from app.utils.user import user_has_permissions, user_is_platform_admin
+from app.utils.user import (
+    clear_organisation_domains_cache,
+    user_has_permissions,
+    user_is_platform_admin,
+)
 
 
 @main.route("/organisations", methods=['GET'])
@@ -170,9 +175,20 @@ def organisation_dashboard(org_id):
 @user_has_permissions()
 def download_organisation_usage_report(org_id):
     selected_year = request.args.get('selected_year')
-    services_usage = current_organisation.services_and_usage(
-        financial_year=selected_year
-    )['services']
+    return report_response(
+        generate_organisation_usage_csv,
+        filename='{} organisation usage report for year {} - generated on {}.csv'.format(
+            current_organisation.name,
+            selected_year,
+            datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        ),
+        org_id=org_id,
+        financial_year=selected_year,
+    )
+
+
+def generate_organisation_usage_csv(org_id, financial_year):
+    services_usage = organisations_client.get_services_and_usage(org_id, financial_year)['services']
 
     unit_column_names = OrderedDict([
         ('service_id', 'Service ID'),
@@ -197,17 +213,7 @@ def download_organisation_usage_report(org_id):
         for service in services_usage
     ]
 
-    return Spreadsheet.from_rows(org_usage_data).as_csv_data, 200, {
-        'Content-Type': 'text/csv; charset=utf-8',
-        'Content-Disposition': (
-            'inline;'
-            'filename="{} organisation usage report for year {}'
-            ' - generated on {}.csv"'.format(
-                current_organisation.name,
-                selected_year,
-                datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-            ))
-    }
+    yield Spreadsheet.from_rows(org_usage_data).as_csv_data
 
 
 @main.route("/organisations/<uuid:org_id>/trial-services", methods=['GET'])
@@ -506,6 +512,7 @@ def edit_organisation_domains(org_id):
                     for domain in filter(None, form.domains.data)
                 )),
             )
+            clear_organisation_domains_cache()
         except HTTPError as e:
             error_message = "Domain already exists"
             if e.status_code == 400 and error_message in e.message:
@@ -19,16 +19,19 @@ from app.extensions import redis_client
 from app.main import main
 from app.main.forms import (
     AdminClearCacheForm,
+    AdminClearTemporaryLogosForm,
     AdminReturnedLettersForm,
     BillingReportDateFilterForm,
     DateFilterForm,
     RequiredDateFilterForm,
 )
+from app.main.views.reports import report_response
+from app.models.spreadsheet import Spreadsheet
+from app.s3_client.s3_logo_client import delete_temp_files_older_than
 from app.statistics_utils import (
     get_formatted_percentage,
     get_formatted_percentage_two_dp,
 )
-from app.utils.csv import Spreadsheet
 from app.utils.pagination import (
     generate_next_dict,
     generate_previous_dict,
@@ -208,6 +211,15 @@ def platform_admin_reports():
 @main.route("/platform-admin/reports/live-services.csv")
 @user_is_platform_admin
 def live_services_csv():
+    return report_response(
+        generate_live_services_csv,
+        filename='{} live services report.csv'.format(
+            format_date_numeric(datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ")),
+        ),
+    )
+
+
+def generate_live_services_csv():
     results = service_api_client.get_live_services_data()["data"]
 
     column_names = OrderedDict([
@@ -238,12 +250,7 @@ def live_services_csv():
 
         live_services_data.append([row[api_key] for api_key in column_names.keys()])
 
-    return Spreadsheet.from_rows(live_services_data).as_csv_data, 200, {
-        'Content-Type': 'text/csv; charset=utf-8',
-        'Content-Disposition': 'inline; filename="{} live services report.csv"'.format(
-            format_date_numeric(datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ")),
-        )
-    }
+    yield Spreadsheet.from_rows(live_services_data).as_csv_data
 
 
 @main.route("/platform-admin/reports/notifications-sent-by-service", methods=['GET', 'POST'])
@@ -557,6 +564,22 @@ def clear_cache():
     )
 
 
+@main.route("/platform-admin/clear-temporary-logos", methods=['GET', 'POST'])
+@user_is_platform_admin
+def clear_temporary_logos():
+    form = AdminClearTemporaryLogosForm()
+
+    if form.validate_on_submit():
+        num_deleted = delete_temp_files_older_than(form.older_than_hours.data)
+
+        flash(f'Removed {num_deleted} temporary logos', category='default')
+
+    return render_template(
+        'views/platform-admin/clear-temporary-logos.html',
+        form=form
+    )
+
+
 def sum_service_usage(service):
     total = 0
     for notification_type in service['statistics'].keys():
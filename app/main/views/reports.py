@@ -0,0 +1,71 @@
+from functools import partial
+
+from flask import (
+    Response,
+    abort,
+    current_app,
+    redirect,
+    render_template,
+    stream_with_context,
+    url_for,
+)
+
+from app.main import main
+from app.models.report import Report
+from app.utils.polling import partials_response
+from app.utils.user import user_is_logged_in
+
+
+def report_response(write_csv, *, filename, **kwargs):
+    """
+    Respond with the CSV report from `write_csv(**kwargs)`.
+
+    With redis enabled the report is written to S3 in the background and the user is sent to a page which waits for
+    it to be ready. Without redis there’s nowhere to keep track of it, so the report is streamed back instead.
+    """
+    if not current_app.config['REDIS_ENABLED']:
+        return Response(
+            stream_with_context(write_csv(**kwargs)),
+            mimetype='text/csv',
+            headers={'Content-Disposition': 'inline; filename="{}"'.format(filename)},
+        )
+
+    report = Report.start(write_csv, filename=filename, **kwargs)
+    return redirect(url_for('main.view_report', report_id=report.id))
+
+
+@main.route('/reports/<uuid:report_id>')
+@user_is_logged_in
+def view_report(report_id):
+    report = Report.from_id(report_id)
+    return render_template(
+        'views/report.html',
+        report=report,
+        partials=get_report_partials(report),
+        updates_url=url_for('.view_report_updates', report_id=report.id),
+    )
+
+
+@main.route('/reports/<uuid:report_id>.json')
+@user_is_logged_in
+def view_report_updates(report_id):
+    report = Report.from_id(report_id)
+    return partials_response(
+        partial(get_report_partials, report),
+        upstream_data=report._dict,
+    )
+
+
+@main.route('/reports/<uuid:report_id>.csv')
+@user_is_logged_in
+def download_report(report_id):
+    report = Report.from_id(report_id)
+    if report.status != Report.FINISHED:
+        abort(404)
+    return redirect(report.download_url)
+
+
+def get_report_partials(report):
+    return {
+        'status': render_template('partials/report-status.html', report=report),
+    }
@@ -1,4 +1,5 @@
 import itertools
+from functools import partial
 from string import ascii_uppercase
 from zipfile import BadZipFile
 
@@ -42,6 +43,7 @@ from app.main.forms import (
     get_placeholder_form_instance,
 )
 from app.models.contact_list import ContactList, ContactListsAlphabetical
+from app.models.spreadsheet import Spreadsheet
 from app.models.user import Users
 from app.s3_client.s3_csv_client import (
     get_csv_metadata,
@@ -55,7 +57,7 @@ from app.utils import (
     should_skip_template_page,
     unicode_truncate,
 )
-from app.utils.csv import Spreadsheet, get_errors_for_csv
+from app.utils.csv import get_csv_rows, get_csv_validation
 from app.utils.templates import get_template
 from app.utils.user import user_has_permissions
 
@@ -144,20 +146,17 @@ def send_messages(service_id, template_id):
     form = CsvUploadForm()
     if form.validate_on_submit():
         try:
-            upload_id = s3upload(
-                service_id,
-                Spreadsheet.from_file_form(form).as_dict,
-                current_app.config['AWS_REGION']
-            )
             file_name_metadata = unicode_truncate(
                 SanitiseASCII.encode(form.file.data.filename),
                 1600
             )
-            set_metadata_on_csv_upload(
-                service_id,
-                upload_id,
-                original_file_name=file_name_metadata
-            )
+            with Spreadsheet.spool_csv_from_file_form(form) as csv_file:
+                upload_id = s3upload(
+                    service_id,
+                    {'file_name': form.file.data.filename, 'data': csv_file},
+                    current_app.config['AWS_REGION'],
+                    metadata={'original_file_name': file_name_metadata},
+                )
             return redirect(url_for(
                 '.check_messages',
                 service_id=service_id,
@@ -650,18 +649,29 @@ def _check_messages(service_id, template_id, upload_id, preview_row, letters_as_
         # recalculate the page count once we have the values
         page_count=get_page_count_for_letter(db_template),
     )
-    recipients = RecipientCSV(
-        contents,
+    guestlist = list(itertools.chain.from_iterable(
+        [user.name, user.mobile_number, user.email_address] for user in Users(service_id)
+    )) if current_service.trial_mode else None
+    recipient_csv = partial(
+        RecipientCSV,
         template=template,
         max_initial_rows_shown=50,
         max_errors_shown=50,
-        guestlist=itertools.chain.from_iterable(
-            [user.name, user.mobile_number, user.email_address] for user in Users(service_id)
-        ) if current_service.trial_mode else None,
+        guestlist=guestlist,
         remaining_messages=remaining_messages,
         allow_international_sms=current_service.has_permission('international_sms'),
         allow_international_letters=current_service.has_permission('international_letters'),
     )
+    recipients = recipient_csv(contents)
+    validation = get_csv_validation(upload_id, recipients, validated_against=[
+        template_id,
+        db_template['version'],
+        current_service.name,
+        current_service.prefix_sms,
+        current_service.permissions,
+        guestlist,
+        remaining_messages,
+    ])
 
     if request.args.get('from_test'):
         # only happens if generating a letter preview test
@@ -674,11 +684,23 @@ def _check_messages(service_id, template_id, upload_id, preview_row, letters_as_
     if preview_row < 2:
         abort(404)
 
-    if preview_row < len(recipients) + 2:
-        template.values = recipients[preview_row - 2].recipient_and_personalisation
+    if preview_row < validation['count_of_recipients'] + 2:
+        if validation['ok']:
+            # Every row is valid, so only the one being previewed needs reading again
+            template.values = recipient_csv(get_csv_rows(
+                recipients.file_data, validation, preview_row - 2, preview_row - 1
+            ))[0].recipient_and_personalisation
+        else:
+            template.values = recipients[preview_row - 2].recipient_and_personalisation
     elif preview_row > 2:
         abort(404)
 
+    if validation['ok']:
+        # …and the page only shows the first rows
+        recipients = recipient_csv(get_csv_rows(
+            recipients.file_data, validation, 0, validation['count_of_displayed_recipients']
+        ))
+
     page_count = get_page_count_for_letter(db_template, template.values)
     template.page_count = page_count
     original_file_name = get_csv_metadata(service_id, upload_id).get('original_file_name', '')
@@ -686,10 +708,10 @@ def _check_messages(service_id, template_id, upload_id, preview_row, letters_as_
     return dict(
         recipients=recipients,
         template=template,
-        errors=recipients.has_errors,
-        row_errors=get_errors_for_csv(recipients, template.template_type),
-        count_of_recipients=len(recipients),
-        count_of_displayed_recipients=len(list(recipients.displayed_rows)),
+        errors=validation['has_errors'],
+        row_errors=validation['row_errors'],
+        count_of_recipients=validation['count_of_recipients'],
+        count_of_displayed_recipients=validation['count_of_displayed_recipients'],
         original_file_name=original_file_name,
         upload_id=upload_id,
         form=CsvUploadForm(),
@@ -700,7 +722,7 @@ def _check_messages(service_id, template_id, upload_id, preview_row, letters_as_
             current_service.trial_mode,
             template.template_type == 'letter',
         )),
-        first_recipient_column=recipients.recipient_column_headers[0],
+        first_recipient_column=validation['first_recipient_column'],
         preview_row=preview_row,
         sent_previously=job_api_client.has_sent_previously(
             service_id, template.id, db_template['version'], original_file_name
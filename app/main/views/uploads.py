@@ -37,6 +37,7 @@ from app.extensions import antivirus_client
 from app.main import main
 from app.main.forms import CsvUploadForm, LetterUploadPostageForm, PDFUploadForm
 from app.models.contact_list import ContactList
+from app.models.spreadsheet import Spreadsheet
 from app.s3_client.s3_letter_upload_client import (
     LetterNotFoundError,
     backup_original_letter_to_s3,
@@ -47,7 +48,7 @@ from app.s3_client.s3_letter_upload_client import (
 )
 from app.template_previews import TemplatePreview, sanitise_letter
 from app.utils import unicode_truncate
-from app.utils.csv import Spreadsheet, get_errors_for_csv
+from app.utils.csv import get_errors_for_csv
 from app.utils.letters import (
     get_letter_printing_statement,
     get_letter_validation_error,
@@ -402,19 +403,16 @@ def upload_contact_list(service_id):
 
     if form.validate_on_submit():
         try:
-            upload_id = ContactList.upload(
-                current_service.id,
-                Spreadsheet.from_file_form(form).as_dict,
-            )
             file_name_metadata = unicode_truncate(
                 SanitiseASCII.encode(form.file.data.filename),
                 1600
             )
-            ContactList.set_metadata(
-                current_service.id,
-                upload_id,
-                original_file_name=file_name_metadata
-            )
+            with Spreadsheet.spool_csv_from_file_form(form) as csv_file:
+                upload_id = ContactList.upload(
+                    current_service.id,
+                    {'file_name': form.file.data.filename, 'data': csv_file},
+                    original_file_name=file_name_metadata,
+                )
             return redirect(url_for(
                 '.check_contact_list',
                 service_id=service_id,
@@ -1,4 +1,6 @@
+import hashlib
 import itertools
+import json
 from datetime import datetime, timedelta
 
 from flask import current_app
@@ -13,6 +15,7 @@ from app.broadcast_areas.models import (
     broadcast_area_libraries,
 )
 from app.broadcast_areas.utils import aggregate_areas
+from app.extensions import redis_client
 from app.formatters import round_to_significant_figures
 from app.models import JSONModel, ModelList
 from app.models.user import User
@@ -24,6 +27,10 @@ ESTIMATED_AREA_OF_LARGEST_UK_COUNTY = broadcast_area_libraries.get_areas([
     'ctyua19-E10000023'  # North Yorkshire
 ])[0].polygons.estimated_area
 
+# Estimates only depend on the areas, which don’t change, and the broadcast areas database, which only changes when
+# it’s deployed
+AREA_ESTIMATES_TTL_IN_SECONDS = 24 * 60 * 60
+
 
 class BroadcastMessage(JSONModel):
 
@@ -145,7 +152,48 @@ class BroadcastMessage(JSONModel):
 
     @cached_property
     def simple_polygons_with_bleed(self):
-        return self.get_polygons_from_areas(area_attribute='simple_polygons_with_bleed')
+        return Polygons(
+            [
+                [[long, lat] for lat, long in polygon]
+                for polygon in self._area_estimates['simple_polygons_with_bleed']
+            ],
+            utm_crs=self._area_estimates['simple_polygons_with_bleed_utm_crs'],
+        )
+
+    @property
+    def _area_estimates_cache_key(self):
+        return 'broadcast-area-estimates-{}'.format(hashlib.sha256(json.dumps([
+            sorted(self.area_ids),
+            self._dict['areas'].get('simple_polygons', []),
+        ]).encode('utf-8')).hexdigest())
+
+    @cached_property
+    def _area_estimates(self):
+        """
+        The bleed around the areas and how many phones are in them take a while to work out, and the pages which
+        show them are reloaded often, so they are shared between requests (and workers) for the same areas.
+        """
+        cached = redis_client.get(self._area_estimates_cache_key)
+
+        if cached:
+            return json.loads(cached)
+
+        return self._cache_area_estimates()
+
+    def _cache_area_estimates(self):
+        simple_polygons_with_bleed = self.get_polygons_from_areas(area_attribute='simple_polygons_with_bleed')
+        count_of_phones = sum(area.count_of_phones for area in self.areas)
+        estimates = {
+            'simple_polygons_with_bleed': simple_polygons_with_bleed.as_coordinate_pairs_lat_long,
+            'simple_polygons_with_bleed_utm_crs': simple_polygons_with_bleed.utm_crs,
+            'count_of_phones': count_of_phones,
+            'count_of_phones_likely': self._get_count_of_phones_likely(
+                round_to_significant_figures(count_of_phones, 1),
+                simple_polygons_with_bleed,
+            ),
+        }
+        redis_client.set(self._area_estimates_cache_key, json.dumps(estimates), ex=AREA_ESTIMATES_TTL_IN_SECONDS)
+        return estimates
 
     @property
     def reference(self):
@@ -188,20 +236,23 @@ class BroadcastMessage(JSONModel):
     @cached_property
     def count_of_phones(self):
         return round_to_significant_figures(
-            sum(area.count_of_phones for area in self.areas),
+            self._area_estimates['count_of_phones'],
             1
         )
 
     @cached_property
     def count_of_phones_likely(self):
+        return self._area_estimates['count_of_phones_likely']
+
+    def _get_count_of_phones_likely(self, count_of_phones, simple_polygons_with_bleed):
         estimated_area = self.simple_polygons.estimated_area
 
         if estimated_area > ESTIMATED_AREA_OF_LARGEST_UK_COUNTY:
             # For large areas, use a naïve but computationally less
             # expensive way of counting the number of phones in the
             # bleed area
-            count = self.count_of_phones * (
-                self.simple_polygons_with_bleed.estimated_area / estimated_area
+            count = count_of_phones * (
+                simple_polygons_with_bleed.estimated_area / estimated_area
             )
         else:
             # For smaller areas, where the computation can be done in
@@ -209,7 +260,7 @@ class BroadcastMessage(JSONModel):
             # phones based on the ammount of overlap with areas for
             # which we have population data
             count = CustomBroadcastArea.from_polygon_objects(
-                self.simple_polygons_with_bleed
+                simple_polygons_with_bleed
             ).count_of_phones
 
         return round_to_significant_figures(count, 1)
@@ -285,6 +336,11 @@ class BroadcastMessage(JSONModel):
 
         self._update(**data)
 
+        # Work out the estimates for the new areas now, so the pages which show them can get them from the cache
+        self._dict['areas'] = areas
+        if self.areas:
+            self._cache_area_estimates()
+
     def _update(self, **kwargs):
         broadcast_message_api_client.update_broadcast_message(
             broadcast_message_id=self.id,
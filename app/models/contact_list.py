@@ -46,12 +46,13 @@ class ContactList(JSONModel):
         return current_app.config['CONTACT_LIST_UPLOAD_BUCKET_NAME']
 
     @staticmethod
-    def upload(service_id, file_dict):
+    def upload(service_id, file_dict, **metadata):
         return s3upload(
             service_id,
             file_dict,
             current_app.config['AWS_REGION'],
             bucket=ContactList.get_bucket_name(),
+            metadata=metadata,
         )
 
     @staticmethod
@@ -81,17 +82,12 @@ class ContactList(JSONModel):
 
     def copy_to_uploads(self):
         metadata = self.get_metadata(self.service_id, self.id)
-        new_upload_id = s3upload(
+        return s3upload(
             self.service_id,
             {'data': self.contents},
             current_app.config['AWS_REGION'],
+            metadata=metadata,
         )
-        set_metadata_on_csv_upload(
-            self.service_id,
-            new_upload_id,
-            **metadata,
-        )
-        return new_upload_id
 
     @classmethod
     def create(cls, service_id, upload_id):
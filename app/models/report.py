@@ -0,0 +1,174 @@
+import hashlib
+import json
+import uuid
+from tempfile import SpooledTemporaryFile
+
+from eventlet import sleep, spawn, spawn_after
+from eventlet.semaphore import Semaphore
+from flask import abort, current_app
+from flask_login import current_user
+
+from app.extensions import redis_client
+from app.models import JSONModel
+from app.s3_client.s3_report_client import (
+    DOWNLOAD_URL_EXPIRY_IN_SECONDS,
+    delete_reports_older_than,
+    get_report_download_url,
+    upload_report,
+)
+
+# Each worker writes this many reports at once, and queues any others
+MAX_REPORTS_WRITTEN_AT_ONCE = 4
+
+_report_writers = Semaphore(MAX_REPORTS_WRITTEN_AT_ONCE)
+
+
+class Report(JSONModel):
+    """
+    A CSV report which is written to S3 on a green thread, so the request which asked for it (and any proxy in
+    front of it) doesn’t have to wait for the whole thing. Its status is kept in redis.
+
+    A report can only be seen by the user who asked for it. If they ask for the same report again while it’s being
+    written, or within `FINISHED_TTL_IN_SECONDS` of it being finished, they get the same one back.
+    """
+
+    ALLOWED_PROPERTIES = {
+        'id',
+        'user_id',
+        'filename',
+        'status',
+    }
+
+    PENDING = 'pending'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+
+    PENDING_TTL_IN_SECONDS = 60 * 60
+    FINISHED_TTL_IN_SECONDS = 15 * 60
+
+    # Report files have recipients’ details in them, so they’re deleted from S3 once they can’t be downloaded: the
+    # report has gone from redis and any download link given out before then has stopped working
+    FILE_TTL_IN_SECONDS = FINISHED_TTL_IN_SECONDS + DOWNLOAD_URL_EXPIRY_IN_SECONDS
+
+    # The worker writing a report keeps a key alive in redis. If the worker goes away the key expires, and the
+    # pending report is treated as failed so it can be asked for again.
+    WRITER_TIMEOUT_IN_SECONDS = 60
+    WRITER_HEARTBEAT_INTERVAL_IN_SECONDS = 15
+
+    # Reports are written to memory up to this size, then to a temporary file on disk
+    SPOOLED_FILE_MAX_MEMORY_SIZE = 5 * 1024 * 1024
+
+    @classmethod
+    def from_id(cls, report_id):
+        report = cls._get(report_id)
+        if not report or report.user_id != current_user.id:
+            abort(404)
+        return report
+
+    @classmethod
+    def start(cls, write_csv, *, filename, **kwargs):
+        """
+        Start writing the CSV from `write_csv(**kwargs)` (a function which returns strings to be joined together)
+        in the background, unless the same report has already been asked for.
+        """
+        report_id = cls._make_id(current_user.id, write_csv, kwargs)
+        report = cls._get(report_id)
+
+        if report and report.status != cls.FAILED:
+            return report
+
+        report = cls({
+            'id': report_id,
+            'user_id': current_user.id,
+            'filename': filename,
+            'status': cls.PENDING,
+        })
+        if not report._claim_writer():
+            # another request has only just started writing the same report
+            return report
+        report._save()
+        spawn(report._write, current_app._get_current_object(), write_csv, kwargs)
+        return report
+
+    @property
+    def download_url(self):
+        return get_report_download_url(self.id, self.filename)
+
+    def _write(self, app, write_csv, kwargs):
+        # keeps going while the report is queued behind others, as well as while it’s being written
+        heartbeat = spawn(self._send_heartbeats, app)
+        try:
+            with app.app_context(), _report_writers:
+                try:
+                    with SpooledTemporaryFile(max_size=self.SPOOLED_FILE_MAX_MEMORY_SIZE) as report_file:
+                        for chunk in write_csv(**kwargs):
+                            report_file.write(chunk.encode('utf-8'))
+                        report_file.seek(0)
+                        upload_report(self.id, report_file)
+                except Exception:
+                    app.logger.exception(f'Failed to write report {self.id}')
+                    self.status = self.FAILED
+                else:
+                    self.status = self.FINISHED
+                self._save()
+            if self.status == self.FINISHED:
+                spawn_after(self.FILE_TTL_IN_SECONDS, self._delete_old_files, app)
+        finally:
+            heartbeat.kill()
+            redis_client.delete(self._writer_cache_key(self.id))
+
+    def _delete_old_files(self, app):
+        # deletes this report’s file, and any left behind by workers which went away before deleting theirs
+        with app.app_context():
+            try:
+                delete_reports_older_than(self.FILE_TTL_IN_SECONDS)
+            except Exception:
+                app.logger.exception('Failed to delete old reports')
+
+    def _send_heartbeats(self, app):
+        with app.app_context():
+            while True:
+                sleep(self.WRITER_HEARTBEAT_INTERVAL_IN_SECONDS)
+                self._keep_writer_alive()
+
+    def _claim_writer(self):
+        # `nx` makes this atomic, so only one request can start writing a report
+        return redis_client.set(
+            self._writer_cache_key(self.id), self.id, ex=self.WRITER_TIMEOUT_IN_SECONDS, nx=True
+        )
+
+    def _keep_writer_alive(self):
+        redis_client.set(self._writer_cache_key(self.id), self.id, ex=self.WRITER_TIMEOUT_IN_SECONDS)
+
+    def _save(self):
+        redis_client.set(
+            self._cache_key(self.id),
+            json.dumps({property: getattr(self, property) for property in self.ALLOWED_PROPERTIES}),
+            ex=self.PENDING_TTL_IN_SECONDS if self.status == self.PENDING else self.FINISHED_TTL_IN_SECONDS,
+        )
+
+    @classmethod
+    def _get(cls, report_id):
+        cached = redis_client.get(cls._cache_key(report_id))
+        if not cached:
+            return None
+        report = json.loads(cached)
+        if report['status'] == cls.PENDING and not redis_client.get(cls._writer_cache_key(report_id)):
+            report['status'] = cls.FAILED
+        return cls(report)
+
+    @staticmethod
+    def _cache_key(report_id):
+        return f'report-{report_id}'
+
+    @staticmethod
+    def _writer_cache_key(report_id):
+        return f'report-{report_id}-writer'
+
+    @staticmethod
+    def _make_id(user_id, write_csv, kwargs):
+        return str(uuid.UUID(hashlib.sha256(json.dumps(
+            [user_id, write_csv.__module__, write_csv.__qualname__, kwargs],
+            sort_keys=True,
+            default=str,
+        ).encode('utf-8')).hexdigest()[:32]))
@@ -536,6 +536,10 @@ class Service(JSONModel, SortByNameMixin):
     def all_template_folder_ids(self):
         return {folder['id'] for folder in self.all_template_folders}
 
+    @cached_property
+    def all_template_folders_by_id(self):
+        return {folder['id']: folder for folder in self.all_template_folders}
+
     def get_template_folder(self, folder_id):
         if folder_id is None:
             return {
@@ -543,7 +547,10 @@ class Service(JSONModel, SortByNameMixin):
                 'name': 'Templates',
                 'parent_id': None,
             }
-        return self._get_by_id(self.all_template_folders, folder_id)
+        try:
+            return self.all_template_folders_by_id[str(folder_id)]
+        except KeyError:
+            abort(404)
 
     def get_template_folder_path(self, template_folder_id):
 
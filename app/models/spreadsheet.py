@@ -1,6 +1,8 @@
+import codecs
 import csv
 from io import StringIO
 from os import path
+from tempfile import SpooledTemporaryFile
 
 import pyexcel
 import pyexcel_xlsx
@@ -10,6 +12,9 @@ class Spreadsheet():
 
     ALLOWED_FILE_EXTENSIONS = ('csv', 'xlsx', 'xls', 'ods', 'xlsm', 'tsv')
 
+    # Converted uploads stay in memory up to this size, then get written to a temporary file on disk
+    SPOOLED_CSV_MAX_MEMORY_SIZE = 5 * 1024 * 1024
+
     def __init__(self, csv_data=None, rows=None, filename=''):
 
         self.filename = filename
@@ -49,6 +54,12 @@ class Spreadsheet():
     def normalise_newlines(file_content):
         return '\r\n'.join(file_content.read().decode('utf-8').splitlines())
 
+    @staticmethod
+    def iter_normalised_lines(file_content):
+        # Splits lines the same way as `normalise_newlines`, but only decodes one line at a time
+        for line in codecs.getreader('utf-8')(file_content):
+            yield line.splitlines()[0]
+
     @classmethod
     def from_rows(cls, rows, filename=''):
         return cls(rows=rows, filename=filename)
@@ -96,3 +107,59 @@ class Spreadsheet():
             form.file.data,
             filename=form.file.data.filename,
         )
+
+    @classmethod
+    def spool_csv_from_file(cls, file_content, filename=''):
+        """
+        Convert an uploaded file to CSV one line or row at a time, without holding the whole file in memory.
+
+        Returns a binary file, positioned at the start, containing the same CSV data as
+        `from_file(file_content, filename).as_csv_data`. It should be closed once it has been used.
+        """
+        extension = cls.get_extension(filename)
+        spooled_csv = SpooledTemporaryFile(max_size=cls.SPOOLED_CSV_MAX_MEMORY_SIZE)
+
+        try:
+            output = codecs.getwriter('utf-8')(spooled_csv)
+
+            if extension == 'csv':
+                for index, line in enumerate(cls.iter_normalised_lines(file_content)):
+                    output.write('\r\n' + line if index else line)
+            else:
+                csv.writer(output).writerows(cls._iter_rows_from_file(file_content, extension))
+
+            spooled_csv.seek(0)
+        except Exception:
+            spooled_csv.close()
+            raise
+
+        return spooled_csv
+
+    @classmethod
+    def spool_csv_from_file_form(cls, form):
+        return cls.spool_csv_from_file(
+            form.file.data,
+            filename=form.file.data.filename,
+        )
+
+    @classmethod
+    def _iter_rows_from_file(cls, file_content, extension):
+        if extension == 'xlsm':
+            # Macro-enabled workbooks can be read a row at a time by the plugin for `.xlsx` files
+            extension = 'xlsx'
+
+        with SpooledTemporaryFile(max_size=cls.SPOOLED_CSV_MAX_MEMORY_SIZE, mode='w+', newline='') as tsv:
+
+            if extension == 'tsv':
+                for line in cls.iter_normalised_lines(file_content):
+                    tsv.write(line + '\r\n')
+                tsv.seek(0)
+                file_content = tsv
+
+            try:
+                yield from pyexcel.iget_array(
+                    file_type=extension,
+                    file_stream=file_content,
+                )
+            finally:
+                pyexcel.free_resources()
@@ -16,6 +16,7 @@ class TemplateList():
         self.template_type = template_type
         self.template_folder_id = template_folder_id
         self.user = user
+        self._folder_visibility = {}
 
     def __iter__(self):
         yield from self.items
@@ -67,11 +68,17 @@ class TemplateList():
         if template_folder_id:
             template_folder_id = str(template_folder_id)
         return [
-            template for template in self.service.all_templates
+            template for template in self._templates_by_folder.get(template_folder_id, [])
             if (set(template_type) & {'all', template['template_type']})
-            and template.get('folder') == template_folder_id
         ]
 
+    @cached_property
+    def _templates_by_folder(self):
+        templates_by_folder = {}
+        for template in self.service.all_templates:
+            templates_by_folder.setdefault(template.get('folder'), []).append(template)
+        return templates_by_folder
+
     @cached_property
     def user_template_folders(self):
         """Returns a modified list of folders a user has permission to view
@@ -115,36 +122,44 @@ class TemplateList():
         return user_folders
 
     def get_template_folders(self, template_type='all', parent_folder_id=None):
-        if self.user:
-            folders = self.user_template_folders
-        else:
-            folders = self.service.all_template_folders
         if parent_folder_id:
             parent_folder_id = str(parent_folder_id)
 
         return [
-            folder for folder in folders
-            if (
-                folder['parent_id'] == parent_folder_id
-                and self.is_folder_visible(folder['id'], template_type)
-            )
+            folder for folder in self._folders_by_parent.get(parent_folder_id, [])
+            if self.is_folder_visible(folder['id'], template_type)
         ]
 
+    @cached_property
+    def _folders_by_parent(self):
+        if self.user:
+            folders = self.user_template_folders
+        else:
+            folders = self.service.all_template_folders
+        folders_by_parent = {}
+        for folder in folders:
+            folders_by_parent.setdefault(folder['parent_id'], []).append(folder)
+        return folders_by_parent
+
     def is_folder_visible(self, template_folder_id, template_type='all'):
 
         if template_type == 'all':
             return True
 
-        if self.get_templates(template_type, template_folder_id):
-            return True
-
-        if any(
-            self.is_folder_visible(child_folder['id'], template_type)
-            for child_folder in self.get_template_folders(template_type, template_folder_id)
-        ):
-            return True
+        # Whether a folder is visible depends on all the folders inside it, so remember the answer rather than
+        # working it out again for each of its parents
+        key = (template_folder_id, template_type if isinstance(template_type, str) else tuple(template_type))
+
+        if key not in self._folder_visibility:
+            self._folder_visibility[key] = bool(
+                self.get_templates(template_type, template_folder_id)
+                or any(
+                    self.is_folder_visible(child_folder['id'], template_type)
+                    for child_folder in self._folders_by_parent.get(template_folder_id, [])
+                )
+            )
 
-        return False
+        return self._folder_visibility[key]
 
     @property
     def as_id_and_name(self):
@@ -83,6 +83,7 @@ class HeaderNavigation(Navigation):
             'archive_user',
             'change_user_auth',
             'clear_cache',
+            'clear_temporary_logos',
             'create_email_branding',
             'create_letter_branding',
             'edit_sms_provider_ratio',
@@ -1,12 +1,95 @@
-from flask import abort, has_request_context, request
+import json
+import re
+from copy import deepcopy
+from functools import wraps
+
+from flask import abort, current_app, g, has_request_context, request
 from flask_login import current_user
+from gds_metrics.metrics import Counter
 from notifications_python_client import __version__
 from notifications_python_client.base import BaseAPIClient
 from notifications_utils.clients.redis import RequestCache
 
 from app.extensions import redis_client
 
-cache = RequestCache(redis_client)
+CACHE_LOOKUPS = Counter(
+    'admin_api_client_cache_lookups_total',
+    'Read-through cache lookups made by the admin API clients',
+    ['key_family', 'result'],
+)
+
+
+class AdminRequestCache(RequestCache):
+    """
+    Read-through cache for API client methods, backed by redis.
+
+    Behaves like `RequestCache`, but also counts hits and misses against the key format (the "key family", eg
+    `service-{service_id}-templates`) so we can see which caches are earning their keep. When redis is disabled the
+    lookup always misses and the API is called as normal.
+
+    Every key family needs its own `ttl_in_seconds`. Anything the API can change without going through a method
+    with a matching `@cache.delete` should only be kept for an hour or so.
+    """
+
+    def set(self, key_format, *, ttl_in_seconds):
+
+        def _set(client_method):
+
+            @wraps(client_method)
+            def new_client_method(*args, **kwargs):
+                redis_key = self._make_key(key_format, client_method, args, kwargs)
+                cached = self.redis_client.get(redis_key)
+                if cached:
+                    CACHE_LOOKUPS.labels(key_format, 'hit').inc()
+                    return json.loads(cached)
+                CACHE_LOOKUPS.labels(key_format, 'miss').inc()
+                api_response = client_method(*args, **kwargs)
+                self.redis_client.set(
+                    redis_key,
+                    json.dumps(api_response),
+                    ex=int(ttl_in_seconds),
+                )
+                return api_response
+
+            return new_client_method
+
+        return _set
+
+
+cache = AdminRequestCache(redis_client)
+
+
+UUID_REGEX = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+
+def _path_segments(url):
+    return tuple(segment for segment in str(url).split('?')[0].split('/') if segment)
+
+
+def _paths_overlap(first_url, second_url):
+    """
+    Two paths overlap if one is a prefix of the other (`/service/<id>` and `/service/<id>/archive`) or if they
+    refer to the same object (`/service/<id>/users/<user_id>` and `/user/<user_id>`).
+    """
+    first, second = _path_segments(first_url), _path_segments(second_url)
+    shortest = min(len(first), len(second))
+    if first[:shortest] == second[:shortest]:
+        return True
+    return bool(
+        {segment for segment in first if UUID_REGEX.match(segment)} &
+        {segment for segment in second if UUID_REGEX.match(segment)}
+    )
+
+
+def clear_request_memo(exception=None):
+    """
+    Registered as a `teardown_request` handler. `flask.g` can outlive a single request (for example when an app
+    context is already pushed), so the memo is explicitly thrown away at the end of every request.
+    """
+    calls_saved = g.pop('api_get_calls_saved', 0)
+    g.pop('api_get_memo', None)
+    if calls_saved:
+        current_app.logger.debug(f'Request memo saved {calls_saved} duplicate API GET calls for {request.path}')
 
 
 def _attach_current_user(data):
@@ -54,17 +137,54 @@ class NotifyAdminAPIClient(BaseAPIClient):
         if current_service and not current_service.active and not current_user.platform_admin:
             abort(403)
 
-    def post(self, *args, **kwargs):
+    def get(self, url, params=None):
+        """
+        Identical GETs made within one request (by `before_request` handlers, models, views and templates) are only
+        sent to the API once. Callers get their own copy of the response so they can't change each other's data.
+        """
+        if not has_request_context():
+            return super().get(url, params=params)
+
+        memo = g.setdefault('api_get_memo', {})
+        key = (str(url), json.dumps(params, sort_keys=True, default=str))
+
+        if key in memo:
+            g.api_get_calls_saved = g.get('api_get_calls_saved', 0) + 1
+            return deepcopy(memo[key])
+
+        response = super().get(url, params=params)
+        memo[key] = deepcopy(response)
+        return response
+
+    def _forget_memoised_gets(self, url):
+        if not has_request_context() or 'api_get_memo' not in g:
+            return
+        g.api_get_memo = {
+            (memo_url, params): response
+            for (memo_url, params), response in g.api_get_memo.items()
+            if not _paths_overlap(memo_url, url)
+        }
+
+    def post(self, url, data):
         self.check_inactive_service()
-        return super().post(*args, **kwargs)
+        try:
+            return super().post(url, data)
+        finally:
+            self._forget_memoised_gets(url)
 
-    def put(self, *args, **kwargs):
+    def put(self, url, data):
         self.check_inactive_service()
-        return super().put(*args, **kwargs)
+        try:
+            return super().put(url, data)
+        finally:
+            self._forget_memoised_gets(url)
 
-    def delete(self, *args, **kwargs):
+    def delete(self, url, data=None):
         self.check_inactive_service()
-        return super().delete(*args, **kwargs)
+        try:
+            return super().delete(url, data)
+        finally:
+            self._forget_memoised_gets(url)
 
 
 class InviteTokenError(Exception):
@@ -34,18 +34,18 @@ class BroadcastMessageAPIClient(NotifyAdminAPIClient):
     def get_broadcast_messages(self, service_id):
         return self.get(f'/service/{service_id}/broadcast-message')['broadcast_messages']
 
-    # @cache.set('service-{service_id}-broadcast-message-{broadcast_message_id}')
+    @cache.set('service-{service_id}-broadcast-message-{broadcast_message_id}', ttl_in_seconds=60)
     def get_broadcast_message(self, *, service_id, broadcast_message_id):
         return self.get(f'/service/{service_id}/broadcast-message/{broadcast_message_id}')
 
-    # @cache.delete('service-{service_id}-broadcast-message-{broadcast_message_id}')
+    @cache.delete('service-{service_id}-broadcast-message-{broadcast_message_id}')
     def update_broadcast_message(self, *, service_id, broadcast_message_id, data):
         self.post(
             f'/service/{service_id}/broadcast-message/{broadcast_message_id}',
             data=data,
         )
 
-    # @cache.delete('service-{service_id}-broadcast-message-{broadcast_message_id}')
+    @cache.delete('service-{service_id}-broadcast-message-{broadcast_message_id}')
     def update_broadcast_message_status(self, status, *, service_id, broadcast_message_id):
         data = _attach_current_user({
             'status': status,
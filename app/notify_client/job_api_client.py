@@ -1,6 +1,9 @@
 from app.extensions import redis_client
 from app.notify_client import NotifyAdminAPIClient, _attach_current_user, cache
 
+# Jobs are deleted by the API once they're past the service's data retention, without the cache being cleared
+HAS_JOBS_TTL_IN_SECONDS = 3600
+
 
 class JobApiClient(NotifyAdminAPIClient):
 
@@ -84,7 +87,7 @@ class JobApiClient(NotifyAdminAPIClient):
             url=f'/service/{service_id}/job/scheduled-job-stats'
         )
 
-    # @cache.set('has_jobs-{service_id}')
+    @cache.set('has_jobs-{service_id}', ttl_in_seconds=HAS_JOBS_TTL_IN_SECONDS)
     def has_jobs(self, service_id):
         return bool(self.get_jobs(service_id)['data'])
 
@@ -103,19 +106,19 @@ class JobApiClient(NotifyAdminAPIClient):
         redis_client.set(
             'has_jobs-{}'.format(service_id),
             b'true',
-            ex=int(cache.DEFAULT_TTL),
+            ex=HAS_JOBS_TTL_IN_SECONDS,
         )
 
         return job
 
-    # @cache.delete('has_jobs-{service_id}')
+    @cache.delete('has_jobs-{service_id}')
     def cancel_job(self, service_id, job_id):
         return self.post(
             url='/service/{}/job/{}/cancel'.format(service_id, job_id),
             data={}
         )
 
-    # @cache.delete('has_jobs-{service_id}')
+    @cache.delete('has_jobs-{service_id}')
     def cancel_letter_job(self, service_id, job_id):
         return self.post(
             url='/service/{}/job/{}/cancel-letter-job'.format(service_id, job_id),
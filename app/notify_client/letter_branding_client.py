@@ -3,15 +3,15 @@ from app.notify_client import NotifyAdminAPIClient, cache
 
 class LetterBrandingClient(NotifyAdminAPIClient):
 
-    # @cache.set('letter_branding-{branding_id}')
+    @cache.set('letter_branding-{branding_id}', ttl_in_seconds=86400)
     def get_letter_branding(self, branding_id):
         return self.get(url='/letter-branding/{}'.format(branding_id))
 
-    # @cache.set('letter_branding')
+    @cache.set('letter_branding', ttl_in_seconds=86400)
     def get_all_letter_branding(self):
         return self.get(url='/letter-branding')
 
-    # @cache.delete('letter_branding')
+    @cache.delete('letter_branding')
     def create_letter_branding(self, filename, name):
         data = {
             "filename": filename,
@@ -19,8 +19,8 @@ class LetterBrandingClient(NotifyAdminAPIClient):
         }
         return self.post(url="/letter-branding", data=data)
 
-    # @cache.delete('letter_branding')
-    # @cache.delete('letter_branding-{branding_id}')
+    @cache.delete('letter_branding')
+    @cache.delete('letter_branding-{branding_id}')
     def update_letter_branding(self, branding_id, filename, name):
         data = {
             "filename": filename,
@@ -4,7 +4,7 @@ from app.notify_client import NotifyAdminAPIClient, cache
 
 class TemplateFolderAPIClient(NotifyAdminAPIClient):
 
-    # @cache.delete('service-{service_id}-template-folders')
+    @cache.delete('service-{service_id}-template-folders')
     def create_template_folder(
         self,
         service_id,
@@ -17,7 +17,7 @@ class TemplateFolderAPIClient(NotifyAdminAPIClient):
         }
         return self.post('/service/{}/template-folder'.format(service_id), data)['data']['id']
 
-    # @cache.set('service-{service_id}-template-folders')
+    @cache.set('service-{service_id}-template-folders', ttl_in_seconds=86400)
     def get_template_folders(self, service_id):
         return self.get('/service/{}/template-folder'.format(service_id))['template_folders']
 
@@ -34,8 +34,8 @@ class TemplateFolderAPIClient(NotifyAdminAPIClient):
                 if folder['id'] == str(folder_id)
             )
 
-    # @cache.delete('service-{service_id}-template-folders')
-    # @cache.delete('service-{service_id}-templates')
+    @cache.delete('service-{service_id}-template-folders')
+    @cache.delete('service-{service_id}-templates')
     def move_to_folder(self, service_id, folder_id, template_ids, folder_ids):
 
         if folder_id:
@@ -51,7 +51,7 @@ class TemplateFolderAPIClient(NotifyAdminAPIClient):
         if template_ids:
             redis_client.delete(*(f'service-{service_id}-template-{id}-version-None' for id in template_ids))
 
-    # @cache.delete('service-{service_id}-template-folders')
+    @cache.delete('service-{service_id}-template-folders')
     def update_template_folder(self, service_id, template_folder_id, name, users_with_permission=None):
         data = {"name": name}
         if users_with_permission:
@@ -61,7 +61,7 @@ class TemplateFolderAPIClient(NotifyAdminAPIClient):
             data
         )
 
-    # @cache.delete('service-{service_id}-template-folders')
+    @cache.delete('service-{service_id}-template-folders')
     def delete_template_folder(self, service_id, template_folder_id):
         self.delete('/service/{}/template-folder/{}'.format(service_id, template_folder_id), {})
 
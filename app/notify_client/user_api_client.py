@@ -34,7 +34,7 @@ class UserApiClient(NotifyAdminAPIClient):
     def get_user(self, user_id):
         return self._get_user(user_id)['data']
 
-    # @cache.set('user-{user_id}')
+    @cache.set('user-{user_id}', ttl_in_seconds=3600)
     def _get_user(self, user_id):
         return self.get("/user/{}".format(user_id))
 
@@ -50,7 +50,7 @@ class UserApiClient(NotifyAdminAPIClient):
                 return None
             raise e
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def update_user_attribute(self, user_id, **kwargs):
         data = dict(kwargs)
         disallowed_attributes = set(data.keys()) - ALLOWED_ATTRIBUTES
@@ -63,24 +63,24 @@ class UserApiClient(NotifyAdminAPIClient):
         user_data = self.post(url, data=data)
         return user_data['data']
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def archive_user(self, user_id):
         return self.post('/user/{}/archive'.format(user_id), data=None)
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def reset_failed_login_count(self, user_id):
         url = "/user/{}/reset-failed-login-count".format(user_id)
         user_data = self.post(url, data={})
         return user_data['data']
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def update_password(self, user_id, password):
         data = {"_password": password}
         url = "/user/{}/update-password".format(user_id)
         user_data = self.post(url, data=data)
         return user_data['data']
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def verify_password(self, user_id, password):
         try:
             url = "/user/{}/verify/password".format(user_id)
@@ -113,7 +113,7 @@ class UserApiClient(NotifyAdminAPIClient):
         endpoint = '/user/{0}/email-already-registered'.format(user_id)
         self.post(endpoint, data=data)
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def check_verify_code(self, user_id, code, code_type):
         data = {'code_type': code_type, 'code': code}
         endpoint = '/user/{}/verify/code'.format(user_id)
@@ -125,7 +125,7 @@ class UserApiClient(NotifyAdminAPIClient):
                 return False, e.message
             raise e
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def complete_webauthn_login_attempt(self, user_id, is_successful):
         data = {'successful': is_successful}
         endpoint = f'/user/{user_id}/complete/webauthn-login'
@@ -145,9 +145,9 @@ class UserApiClient(NotifyAdminAPIClient):
         endpoint = '/organisations/{}/users'.format(org_id)
         return self.get(endpoint)['data']
 
-    # @cache.delete('service-{service_id}')
-    # @cache.delete('service-{service_id}-template-folders')
-    # @cache.delete('user-{user_id}')
+    @cache.delete('service-{service_id}')
+    @cache.delete('service-{service_id}-template-folders')
+    @cache.delete('user-{user_id}')
     def add_user_to_service(self, service_id, user_id, permissions, folder_permissions):
         # permissions passed in are the combined UI permissions, not DB permissions
         endpoint = '/service/{}/users/{}'.format(service_id, user_id)
@@ -158,13 +158,13 @@ class UserApiClient(NotifyAdminAPIClient):
 
         self.post(endpoint, data=data)
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def add_user_to_organisation(self, org_id, user_id):
         resp = self.post('/organisations/{}/users/{}'.format(org_id, user_id), data={})
         return resp['data']
 
-    # @cache.delete('service-{service_id}-template-folders')
-    # @cache.delete('user-{user_id}')
+    @cache.delete('service-{service_id}-template-folders')
+    @cache.delete('user-{user_id}')
     def set_user_permissions(self, user_id, service_id, permissions, folder_permissions=None):
         # permissions passed in are the combined UI permissions, not DB permissions
         data = {
@@ -193,7 +193,7 @@ class UserApiClient(NotifyAdminAPIClient):
         users = self.post(endpoint, data=data)
         return users
 
-    # @cache.delete('user-{user_id}')
+    @cache.delete('user-{user_id}')
     def activate_user(self, user_id):
         return self.post("/user/{}/activate".format(user_id), data=None)
 
@@ -0,0 +1,52 @@
+import time
+from functools import lru_cache
+
+from boto3.session import Session
+from botocore.config import Config
+from flask import current_app
+from gds_metrics.metrics import Histogram
+
+S3_REQUEST_DURATION = Histogram(
+    'admin_s3_request_duration_seconds',
+    'Time taken by requests from the admin app to S3',
+    ['operation'],
+)
+
+
+def get_s3_resource(region_name=None):
+    """
+    The S3 resource for a region (`AWS_REGION` by default), created the first time a worker needs it and reused
+    after that, so requests share one session, one set of credentials and one connection pool. The underlying client
+    is safe to share between threads (and so between green threads).
+    """
+    return _get_s3_resource(region_name or current_app.config['AWS_REGION'])
+
+
+@lru_cache(maxsize=None)
+def _get_s3_resource(region_name):
+    s3 = Session().resource(
+        's3',
+        region_name=region_name,
+        config=Config(
+            max_pool_connections=current_app.config['S3_MAX_POOL_CONNECTIONS'],
+            connect_timeout=current_app.config['S3_CONNECT_TIMEOUT_IN_SECONDS'],
+            read_timeout=current_app.config['S3_READ_TIMEOUT_IN_SECONDS'],
+            retries={
+                'total_max_attempts': current_app.config['S3_MAX_ATTEMPTS'],
+                'mode': 'standard',
+            },
+        ),
+    )
+    s3.meta.client.meta.events.register('provide-client-params.s3', _start_timing_request)
+    s3.meta.client.meta.events.register('after-call.s3', _record_request_duration)
+    return s3
+
+
+def _start_timing_request(context, **kwargs):
+    context['admin_request_started_at'] = time.monotonic()
+
+
+def _record_request_duration(model, context, **kwargs):
+    S3_REQUEST_DURATION.labels(operation=model.name).observe(
+        time.monotonic() - context['admin_request_started_at']
+    )
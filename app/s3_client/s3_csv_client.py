@@ -1,13 +1,20 @@
 import uuid
 
 import botocore
-from flask import current_app
+from boto3.s3.transfer import TransferConfig
+from flask import current_app, g, has_app_context
 from notifications_utils.s3 import s3upload as utils_s3upload
 
+from app.s3_client import get_s3_resource
 from app.s3_client.s3_logo_client import get_s3_object
 
 FILE_LOCATION_STRUCTURE = 'service-{}-notify/{}.csv'
 
+# Files are sent in parts of this size, a few at a time, so uploading never needs more than
+# `MULTIPART_CHUNK_SIZE * MULTIPART_MAX_CONCURRENCY` bytes of memory however big the file is
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 4
+
 
 def get_csv_location(service_id, upload_id, bucket=None):
     return (
@@ -20,18 +27,46 @@ def get_csv_upload(service_id, upload_id, bucket=None):
     return get_s3_object(*get_csv_location(service_id, upload_id, bucket))
 
 
-def s3upload(service_id, filedata, region, bucket=None):
+def s3upload(service_id, filedata, region, bucket=None, metadata=None):
     upload_id = str(uuid.uuid4())
     bucket_name, file_location = get_csv_location(service_id, upload_id, bucket)
-    utils_s3upload(
-        filedata=filedata['data'],
-        region=region,
-        bucket_name=bucket_name,
-        file_location=file_location,
-    )
+    metadata = _stringify_metadata(metadata or {})
+    if hasattr(filedata['data'], 'read'):
+        s3upload_fileobj(
+            fileobj=filedata['data'],
+            region=region,
+            bucket_name=bucket_name,
+            file_location=file_location,
+            metadata=metadata,
+        )
+    else:
+        utils_s3upload(
+            filedata=filedata['data'],
+            region=region,
+            bucket_name=bucket_name,
+            file_location=file_location,
+            metadata=metadata,
+        )
+    _get_metadata_cache()[bucket_name, file_location] = metadata
     return upload_id
 
 
+def s3upload_fileobj(fileobj, region, bucket_name, file_location, metadata=None):
+    get_s3_resource(region).Object(bucket_name, file_location).upload_fileobj(
+        fileobj,
+        ExtraArgs={
+            'ServerSideEncryption': 'AES256',
+            'ContentType': 'binary/octet-stream',
+            'Metadata': metadata or {},
+        },
+        Config=TransferConfig(
+            multipart_threshold=MULTIPART_CHUNK_SIZE,
+            multipart_chunksize=MULTIPART_CHUNK_SIZE,
+            max_concurrency=MULTIPART_MAX_CONCURRENCY,
+        ),
+    )
+
+
 def s3download(service_id, upload_id, bucket=None):
     contents = ''
     try:
@@ -45,23 +80,55 @@ def s3download(service_id, upload_id, bucket=None):
 
 
 def set_metadata_on_csv_upload(service_id, upload_id, bucket=None, **kwargs):
+    metadata = _stringify_metadata(kwargs)
+    location = get_csv_location(service_id, upload_id, bucket=bucket)
+
+    if _get_metadata_cache().get(location) == metadata:
+        # S3 can only change metadata by copying the whole file, so don’t if nothing would change
+        return
+
     get_csv_upload(
         service_id, upload_id, bucket=bucket
     ).copy_from(
-        CopySource='{}/{}'.format(*get_csv_location(service_id, upload_id, bucket=bucket)),
+        CopySource='{}/{}'.format(*location),
         ServerSideEncryption='AES256',
-        Metadata={
-            key: str(value) for key, value in kwargs.items()
-        },
+        Metadata=metadata,
         MetadataDirective='REPLACE',
     )
+    _get_metadata_cache()[location] = metadata
 
 
 def get_csv_metadata(service_id, upload_id, bucket=None):
-    try:
-        key = get_csv_upload(service_id, upload_id, bucket)
-        return key.get()['Metadata']
-    except botocore.exceptions.ClientError as e:
-        current_app.logger.error("Unable to download s3 file {}".format(
-            FILE_LOCATION_STRUCTURE.format(service_id, upload_id)))
-        raise e
+    location = get_csv_location(service_id, upload_id, bucket=bucket)
+    metadata_cache = _get_metadata_cache()
+
+    if location not in metadata_cache:
+        try:
+            # Loading `.metadata` makes a HEAD request, so unlike `.get()` it doesn’t download the file
+            metadata_cache[location] = get_csv_upload(service_id, upload_id, bucket).metadata
+        except botocore.exceptions.ClientError as e:
+            current_app.logger.error("Unable to get metadata for s3 file {}".format(
+                FILE_LOCATION_STRUCTURE.format(service_id, upload_id)))
+            raise e
+
+    return dict(metadata_cache[location])
+
+
+def clear_metadata_cache(exception=None):
+    """
+    Registered as a `teardown_request` handler, so metadata is only remembered for the rest of the request which
+    read or wrote it.
+    """
+    g.pop('csv_metadata', None)
+
+
+def _get_metadata_cache():
+    if not has_app_context():
+        return {}
+    return g.setdefault('csv_metadata', {})
+
+
+def _stringify_metadata(metadata):
+    return {
+        key: str(value) for key, value in metadata.items()
+    }
@@ -2,10 +2,11 @@ import json
 import urllib
 
 import botocore
-from boto3 import resource
 from flask import current_app
 from notifications_utils.s3 import s3upload as utils_s3upload
 
+from app.s3_client import get_s3_resource
+
 
 class LetterNotFoundError(Exception):
     pass
@@ -77,8 +78,7 @@ class LetterMetadata:
 def get_letter_s3_object(service_id, file_id):
     try:
         file_location = get_transient_letter_file_location(service_id, file_id)
-        s3 = resource('s3')
-        return s3.Object(current_app.config['TRANSIENT_UPLOADED_LETTERS'], file_location).get()
+        return get_s3_resource().Object(current_app.config['TRANSIENT_UPLOADED_LETTERS'], file_location).get()
     except botocore.exceptions.ClientError as e:
         if e.response['Error']['Code'] == 'NoSuchKey':
             raise LetterNotFoundError(f'Letter not found for service {service_id} and file {file_id}')
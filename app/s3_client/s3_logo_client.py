@@ -1,19 +1,26 @@
 import uuid
+from datetime import datetime, timedelta, timezone
+from functools import partial
 
-from boto3 import resource
 from flask import current_app
 from notifications_utils.s3 import s3upload as utils_s3upload
 
+from app.s3_client import get_s3_resource
+from app.utils.concurrency import run_concurrently
+
 TEMP_TAG = 'temp-{user_id}_'
 EMAIL_LOGO_LOCATION_STRUCTURE = '{temp}{unique_id}-{filename}'
 LETTER_PREFIX = 'letters/static/images/letter-template/'
 LETTER_TEMP_TAG = LETTER_PREFIX + TEMP_TAG
 LETTER_TEMP_LOGO_LOCATION = 'letters/static/images/letter-template/temp-{user_id}_{unique_id}-{filename}'
 
+# S3 deletes at most 1,000 keys per request
+MAX_KEYS_PER_DELETE = 1000
+MAX_CONCURRENT_DELETES = 4
+
 
 def get_s3_object(bucket_name, filename):
-    s3 = resource('s3')
-    return s3.Object(bucket_name, filename)
+    return get_s3_resource().Object(bucket_name, filename)
 
 
 def delete_s3_object(filename):
@@ -21,6 +28,35 @@ def delete_s3_object(filename):
     get_s3_object(bucket_name, filename).delete()
 
 
+def delete_s3_objects(filenames):
+    """
+    Delete the objects in the logo bucket called `filenames`, a batch of keys per request with a few requests at
+    a time. Returns how many were deleted.
+    """
+    filenames = list(filenames)
+    bucket = get_s3_resource().Bucket(current_app.config['LOGO_UPLOAD_BUCKET_NAME'])
+    run_concurrently(
+        *(
+            partial(_delete_s3_objects_batch, bucket, filenames[start:start + MAX_KEYS_PER_DELETE])
+            for start in range(0, len(filenames), MAX_KEYS_PER_DELETE)
+        ),
+        max_concurrency=MAX_CONCURRENT_DELETES,
+    )
+    return len(filenames)
+
+
+def _delete_s3_objects_batch(bucket, filenames):
+    response = bucket.delete_objects(Delete={
+        'Objects': [{'Key': filename} for filename in filenames],
+        'Quiet': True,
+    })
+    # a request can succeed while failing to delete some of its keys
+    if response.get('Errors'):
+        raise RuntimeError('Unable to delete {} logos from s3, first error: {}'.format(
+            len(response['Errors']), response['Errors'][0]
+        ))
+
+
 def persist_logo(old_name, new_name):
     if old_name == new_name:
         return
@@ -32,8 +68,7 @@ def persist_logo(old_name, new_name):
 
 def get_s3_objects_filter_by_prefix(prefix):
     bucket_name = current_app.config['LOGO_UPLOAD_BUCKET_NAME']
-    s3 = resource('s3')
-    return s3.Bucket(bucket_name).objects.filter(Prefix=prefix)
+    return get_s3_resource().Bucket(bucket_name).objects.filter(Prefix=prefix)
 
 
 def get_temp_truncated_filename(filename, user_id):
@@ -101,13 +136,29 @@ def letter_filename_for_db(filename, user_id):
 
 
 def delete_email_temp_files_created_by(user_id):
-    for obj in get_s3_objects_filter_by_prefix(TEMP_TAG.format(user_id=user_id)):
-        delete_s3_object(obj.key)
+    delete_s3_objects(
+        obj.key for obj in get_s3_objects_filter_by_prefix(TEMP_TAG.format(user_id=user_id))
+    )
 
 
 def delete_letter_temp_files_created_by(user_id):
-    for obj in get_s3_objects_filter_by_prefix(LETTER_TEMP_TAG.format(user_id=user_id)):
-        delete_s3_object(obj.key)
+    delete_s3_objects(
+        obj.key for obj in get_s3_objects_filter_by_prefix(LETTER_TEMP_TAG.format(user_id=user_id))
+    )
+
+
+def delete_temp_files_older_than(hours):
+    """
+    Delete every user’s temporary email and letter logos which were uploaded more than `hours` hours ago. Returns
+    how many were deleted.
+    """
+    uploaded_before = datetime.now(timezone.utc) - timedelta(hours=hours)
+    return delete_s3_objects(
+        obj.key
+        for prefix in (TEMP_TAG.partition('{')[0], LETTER_TEMP_TAG.partition('{')[0])
+        for obj in get_s3_objects_filter_by_prefix(prefix)
+        if obj.last_modified < uploaded_before
+    )
 
 
 def delete_email_temp_file(filename):
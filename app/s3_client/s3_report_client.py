@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
+
+from flask import current_app
+
+from app.s3_client import get_s3_resource
+from app.s3_client.s3_csv_client import s3upload_fileobj
+
+# Reports are kept in the CSV upload bucket, under their own prefix
+REPORT_LOCATION_PREFIX = 'reports/'
+REPORT_LOCATION_STRUCTURE = REPORT_LOCATION_PREFIX + '{}.csv'
+
+# S3 deletes at most 1,000 keys per request
+MAX_KEYS_PER_DELETE = 1000
+
+# Long enough to start downloading, short enough that a copied link soon stops working
+DOWNLOAD_URL_EXPIRY_IN_SECONDS = 60
+
+
+def get_report_location(report_id):
+    return (
+        current_app.config['CSV_UPLOAD_BUCKET_NAME'],
+        REPORT_LOCATION_STRUCTURE.format(report_id),
+    )
+
+
+def upload_report(report_id, fileobj):
+    bucket_name, file_location = get_report_location(report_id)
+    s3upload_fileobj(
+        fileobj=fileobj,
+        region=current_app.config['AWS_REGION'],
+        bucket_name=bucket_name,
+        file_location=file_location,
+    )
+
+
+def get_report_download_url(report_id, filename):
+    bucket_name, file_location = get_report_location(report_id)
+    return get_s3_resource().meta.client.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': bucket_name,
+            'Key': file_location,
+            'ResponseContentType': 'text/csv; charset=utf-8',
+            'ResponseContentDisposition': "attachment; filename*=UTF-8''{}".format(quote(filename)),
+        },
+        ExpiresIn=DOWNLOAD_URL_EXPIRY_IN_SECONDS,
+    )
+
+
+def delete_reports_older_than(seconds):
+    """
+    Delete every report which was uploaded more than `seconds` seconds ago. Returns how many were deleted.
+    """
+    uploaded_before = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+    bucket = get_s3_resource().Bucket(current_app.config['CSV_UPLOAD_BUCKET_NAME'])
+    keys = [
+        obj.key
+        for obj in bucket.objects.filter(Prefix=REPORT_LOCATION_PREFIX)
+        if obj.last_modified < uploaded_before
+    ]
+    for start in range(0, len(keys), MAX_KEYS_PER_DELETE):
+        response = bucket.delete_objects(Delete={
+            'Objects': [{'Key': key} for key in keys[start:start + MAX_KEYS_PER_DELETE]],
+            'Quiet': True,
+        })
+        # a request can succeed while failing to delete some of its keys
+        if response.get('Errors'):
+            raise RuntimeError('Unable to delete {} reports from s3, first error: {}'.format(
+                len(response['Errors']), response['Errors'][0]
+            ))
+    return len(keys)
@@ -1,11 +1,34 @@
 import base64
+import hashlib
+import itertools
+import os
+import uuid
+from datetime import datetime
 from io import BytesIO
 
-import requests
 from flask import current_app, json
+from gds_metrics.metrics import Counter
 from notifications_utils.pdf import extract_page_from_pdf
+from notifications_utils.timezones import convert_utc_to_bst
 
 from app import current_service
+from app.extensions import redis_client
+from app.http_client import PooledHTTPClient
+
+PREVIEW_CACHE_LOOKUPS = Counter(
+    'admin_template_preview_cache_lookups_total',
+    'Lookups in the cache of rendered letter previews, by where the preview was found',
+    ['filetype', 'result'],
+)
+
+PREVIEW_REDIS_CACHE_TTL_IN_SECONDS = 24 * 60 * 60
+
+# The disk cache is trimmed back to its maximum size after this many previews have been written to it by a worker
+WRITES_BETWEEN_DISK_CACHE_EVICTIONS = 100
+
+_disk_cache_writes = itertools.count(1)
+
+template_preview_client = PooledHTTPClient('template-preview')
 
 
 class TemplatePreview:
@@ -17,28 +40,20 @@ class TemplatePreview:
             'values': values,
             'filename': current_service.letter_branding and current_service.letter_branding['filename']
         }
-        resp = requests.post(
-            '{}/preview.{}{}'.format(
-                current_app.config['TEMPLATE_PREVIEW_API_HOST'],
-                filetype,
-                '?page={}'.format(page) if page else '',
-            ),
-            json=data,
-            headers={'Authorization': 'Token {}'.format(current_app.config['TEMPLATE_PREVIEW_API_KEY'])}
-        )
-        return (resp.content, resp.status_code, resp.headers.items())
+        return _get_preview(filetype, data, page=page)
 
     @classmethod
     def from_valid_pdf_file(cls, pdf_file, page):
         pdf_page = extract_page_from_pdf(BytesIO(pdf_file), int(page) - 1)
 
-        response = requests.post(
+        response = template_preview_client.post(
             '{}/precompiled-preview.png{}'.format(
                 current_app.config['TEMPLATE_PREVIEW_API_HOST'],
                 '?hide_notify=true' if page == '1' else ''
             ),
             data=base64.b64encode(pdf_page).decode('utf-8'),
-            headers={'Authorization': 'Token {}'.format(current_app.config['TEMPLATE_PREVIEW_API_KEY'])}
+            headers={'Authorization': 'Token {}'.format(current_app.config['TEMPLATE_PREVIEW_API_KEY'])},
+            idempotent=True,
         )
 
         return (response.content, response.status_code, response.headers.items())
@@ -47,13 +62,14 @@ class TemplatePreview:
     def from_invalid_pdf_file(cls, pdf_file, page):
         pdf_page = extract_page_from_pdf(BytesIO(pdf_file), int(page) - 1)
 
-        response = requests.post(
+        response = template_preview_client.post(
             '{}/precompiled/overlay.png{}'.format(
                 current_app.config['TEMPLATE_PREVIEW_API_HOST'],
                 '?page_number={}'.format(page)
             ),
             data=pdf_page,
-            headers={'Authorization': 'Token {}'.format(current_app.config['TEMPLATE_PREVIEW_API_KEY'])}
+            headers={'Authorization': 'Token {}'.format(current_app.config['TEMPLATE_PREVIEW_API_KEY'])},
+            idempotent=True,
         )
 
         return (response.content, response.status_code, response.headers.items())
@@ -66,12 +82,7 @@ class TemplatePreview:
             'values': None,
             'filename': filename
         }
-        resp = requests.post(
-            '{}/preview.png'.format(current_app.config['TEMPLATE_PREVIEW_API_HOST']),
-            json=data,
-            headers={'Authorization': 'Token {}'.format(current_app.config['TEMPLATE_PREVIEW_API_KEY'])}
-        )
-        return (resp.content, resp.status_code, resp.headers.items())
+        return _get_preview('png', data)
 
     @classmethod
     def from_utils_template(cls, template, filetype, page=None):
@@ -83,6 +94,139 @@ class TemplatePreview:
         )
 
 
+def _get_preview(filetype, data, page=None):
+    """
+    Get a preview (or, for the `json` filetype, the page count) of a letter from template preview.
+
+    Previews are the same for the same request on the same day (letters show today’s date), so successful responses
+    are cached by a hash of all of those: first on local disk, then in redis if `TEMPLATE_PREVIEW_REDIS_CACHE_ENABLED`
+    is set. Anything else from template preview is passed straight back, and never cached.
+    """
+    cache_key = _get_preview_cache_key(filetype, data, page)
+
+    cached = _get_from_disk_cache(cache_key)
+    if cached:
+        PREVIEW_CACHE_LOOKUPS.labels(filetype, 'disk').inc()
+        return _cached_response(cached)
+
+    cached = _get_from_redis_cache(cache_key)
+    if cached:
+        PREVIEW_CACHE_LOOKUPS.labels(filetype, 'redis').inc()
+        _set_in_disk_cache(cache_key, cached)
+        return _cached_response(cached)
+
+    PREVIEW_CACHE_LOOKUPS.labels(filetype, 'miss').inc()
+
+    resp = template_preview_client.post(
+        '{}/preview.{}{}'.format(
+            current_app.config['TEMPLATE_PREVIEW_API_HOST'],
+            filetype,
+            '?page={}'.format(page) if page else '',
+        ),
+        json=data,
+        headers={'Authorization': 'Token {}'.format(current_app.config['TEMPLATE_PREVIEW_API_KEY'])},
+        idempotent=True,
+    )
+
+    if resp.status_code == 200:
+        cached = resp.headers.get('Content-Type', '').encode('utf-8') + b'\n' + resp.content
+        _set_in_disk_cache(cache_key, cached)
+        _set_in_redis_cache(cache_key, cached)
+
+    return (resp.content, resp.status_code, resp.headers.items())
+
+
+def _get_preview_cache_key(filetype, data, page):
+    return hashlib.sha256(json.dumps(
+        [filetype, page, data, convert_utc_to_bst(datetime.utcnow()).date()],
+        sort_keys=True,
+        default=str,
+    ).encode('utf-8')).hexdigest()
+
+
+def _cached_response(cached):
+    # cached previews are stored as the content type, a newline, then the content
+    content_type, content = cached.split(b'\n', 1)
+    return (content, 200, [('Content-Type', content_type.decode('utf-8'))])
+
+
+def _get_disk_cache_path(cache_key):
+    return os.path.join(current_app.config['TEMPLATE_PREVIEW_CACHE_DIRECTORY'], cache_key[:2], cache_key)
+
+
+def _get_from_disk_cache(cache_key):
+    if not current_app.config['TEMPLATE_PREVIEW_CACHE_DIRECTORY']:
+        return None
+    path = _get_disk_cache_path(cache_key)
+    try:
+        with open(path, 'rb') as cache_file:
+            cached = cache_file.read()
+        # the modified time is used as the last time the preview was used, so the least recently used go first
+        os.utime(path)
+    except OSError:
+        return None
+    return cached
+
+
+def _set_in_disk_cache(cache_key, cached):
+    if not current_app.config['TEMPLATE_PREVIEW_CACHE_DIRECTORY']:
+        return
+    path = _get_disk_cache_path(cache_key)
+    # write to a temporary file first, so other workers never read half a preview
+    temporary_path = '{}.{}.tmp'.format(path, uuid.uuid4())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary_path, 'wb') as cache_file:
+            cache_file.write(cached)
+        os.replace(temporary_path, path)
+    except OSError:
+        current_app.logger.exception('Failed to write letter preview to the disk cache')
+        return
+    if next(_disk_cache_writes) % WRITES_BETWEEN_DISK_CACHE_EVICTIONS == 0:
+        _evict_from_disk_cache(
+            current_app.config['TEMPLATE_PREVIEW_CACHE_DIRECTORY'],
+            current_app.config['TEMPLATE_PREVIEW_CACHE_MAX_SIZE_IN_BYTES'],
+        )
+
+
+def _evict_from_disk_cache(directory, max_size_in_bytes):
+    """
+    Delete the least recently used previews until the cache fits in `max_size_in_bytes`. Other workers share the
+    directory, so any file might be gone (or be replaced) by the time we get to it.
+    """
+    cache_files = []
+    for path, _, filenames in os.walk(directory):
+        for filename in filenames:
+            try:
+                stat = os.stat(os.path.join(path, filename))
+            except FileNotFoundError:
+                continue
+            cache_files.append((stat.st_mtime, stat.st_size, os.path.join(path, filename)))
+
+    total_size_in_bytes = sum(size for _, size, _ in cache_files)
+
+    for _, size, path in sorted(cache_files):
+        if total_size_in_bytes <= max_size_in_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size_in_bytes -= size
+
+
+def _get_from_redis_cache(cache_key):
+    if not current_app.config['TEMPLATE_PREVIEW_REDIS_CACHE_ENABLED']:
+        return None
+    return redis_client.get(f'template-preview-{cache_key}')
+
+
+def _set_in_redis_cache(cache_key, cached):
+    if not current_app.config['TEMPLATE_PREVIEW_REDIS_CACHE_ENABLED']:
+        return
+    redis_client.set(f'template-preview-{cache_key}', cached, ex=PREVIEW_REDIS_CACHE_TTL_IN_SECONDS)
+
+
 def get_page_count_for_letter(template, values=None):
 
     if template['template_type'] != 'letter':
@@ -95,7 +239,7 @@ def get_page_count_for_letter(template, values=None):
 
 
 def sanitise_letter(pdf_file, *, upload_id, allow_international_letters):
-    return requests.post(
+    return template_preview_client.post(
         '{}/precompiled/sanitise?allow_international_letters={}&upload_id={}'.format(
             current_app.config['TEMPLATE_PREVIEW_API_HOST'],
             'true' if allow_international_letters else 'false',
@@ -0,0 +1,49 @@
+from contextvars import copy_context
+
+from eventlet import sleep, spawn
+from eventlet.greenpool import GreenPool
+
+
+def run_concurrently(*calls, max_concurrency=None):
+    """
+    Call each of `calls` (functions which take no arguments, eg made with `functools.partial`) on its own green
+    thread and return their results in the same order. Use it for independent API requests, so a page waits for
+    the slowest call rather than the sum of all of them. Pass `max_concurrency` to limit how many calls run at once.
+
+    Each green thread runs in a copy of the caller's context, so it sees the same request, `flask.g`, current user
+    and current service, and API requests keep the trace headers of the original request. If any call raises, the
+    first exception (in the order the calls were given) is re-raised once all the calls have finished.
+    """
+    pool = GreenPool(max_concurrency or len(calls) or 1)
+    green_threads = [
+        pool.spawn(copy_context().run, _call_capturing_exception, call)
+        for call in calls
+    ]
+    # let every call finish before raising, so nothing is left running once the request has been torn down
+    pool.waitall()
+    results = []
+    for green_thread in green_threads:
+        result, exception = green_thread.wait()
+        if exception:
+            raise exception
+        results.append(result)
+    return results
+
+
+def call_in_background(call):
+    """
+    Start calling `call` (a function which takes no arguments) on its own green thread, in a copy of the caller's
+    context like `run_concurrently`, and return straight away. `.wait()` on the green thread that's returned gives
+    the result of the call, or re-raises what it raised.
+    """
+    green_thread = spawn(copy_context().run, call)
+    # give the call a chance to send its request before the caller gets on with something else
+    sleep(0)
+    return green_thread
+
+
+def _call_capturing_exception(call):
+    try:
+        return call(), None
+    except Exception as e:
+        return None, e
@@ -1,7 +1,28 @@
-from notifications_utils.recipients import RecipientCSV
+import csv
+import hashlib
+import json
+from functools import partial
+from io import StringIO
 
-from app.models.spreadsheet import Spreadsheet
-from app.utils.templates import get_sample_template
+from notifications_utils.formatters import (
+    strip_all_whitespace,
+    strip_and_remove_obscure_whitespace,
+)
+from notifications_utils.insensitive_dict import InsensitiveDict
+from notifications_utils.recipients import (
+    first_column_headings,
+    insert_or_append_to_dict,
+)
+
+from app.extensions import redis_client
+from app.utils.concurrency import call_in_background
+
+# Uploaded files never change, so this only needs to cover someone going back and forth between
+# the rows of a file before sending it
+CSV_VALIDATION_TTL_IN_SECONDS = 60 * 60
+
+# Rows of a notifications report are written to one buffer, which is sent on whenever it gets this big
+NOTIFICATIONS_CSV_CHUNK_SIZE = 64 * 1024
 
 
 def get_errors_for_csv(recipients, template_type):
@@ -52,6 +73,80 @@ def get_errors_for_csv(recipients, template_type):
     return errors
 
 
+def get_csv_validation(upload_id, recipients, *, validated_against):
+    """
+    Summarise what validating every row of `recipients` found, without doing it again for the same
+    `upload_id` while `validated_against` (everything else the outcome depends on) stays the same.
+    """
+    cache_key = 'csv-validation-{}-{}'.format(upload_id, hashlib.sha256(
+        json.dumps(validated_against, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest())
+
+    cached = redis_client.get(cache_key)
+
+    if cached:
+        return json.loads(cached)
+
+    validation = _validate_csv(recipients)
+    redis_client.set(cache_key, json.dumps(validation), ex=CSV_VALIDATION_TTL_IN_SECONDS)
+    return validation
+
+
+def _validate_csv(recipients):
+    row_errors = get_errors_for_csv(recipients, recipients.template_type)
+    header_line_count, *lines_per_row = _count_lines_per_record(recipients.file_data) or [0]
+
+    return {
+        'ok': not any((
+            recipients.too_many_rows,
+            not len(recipients),
+            not recipients.has_recipient_columns,
+            recipients.duplicate_recipient_column_headers,
+            recipients.missing_column_headers,
+            row_errors,
+            recipients.has_errors,
+        )),
+        'has_errors': bool(recipients.has_errors),
+        'row_errors': row_errors,
+        'count_of_recipients': len(recipients),
+        'count_of_displayed_recipients': len(list(recipients.displayed_rows)),
+        'first_recipient_column': recipients.recipient_column_headers[0],
+        'header_line_count': header_line_count,
+        # Rows almost always take up one line each, so only the others are stored
+        'multiline_rows': [
+            [index, line_count] for index, line_count in enumerate(lines_per_row) if line_count != 1
+        ],
+    }
+
+
+def _count_lines_per_record(file_data):
+    # Parses the file the same way as `RecipientCSV`
+    reader = csv.reader(file_data.splitlines(), quoting=csv.QUOTE_MINIMAL, skipinitialspace=True)
+    line_counts, lines_read = [], 0
+    for _record in reader:
+        line_counts.append(reader.line_num - lines_read)
+        lines_read = reader.line_num
+    return line_counts
+
+
+def get_csv_rows(file_data, validation, start, stop):
+    """
+    Return the header and rows `start` to `stop` of a validated file, as a smaller file which
+    `RecipientCSV` can read without going through the rest.
+    """
+    lines = file_data.splitlines()
+    header_line_count = validation['header_line_count']
+
+    def first_line_of_row(row_index):
+        return header_line_count + row_index + sum(
+            line_count - 1 for index, line_count in validation['multiline_rows'] if index < row_index
+        )
+
+    return '\n'.join(
+        lines[:header_line_count] + lines[first_line_of_row(start):first_line_of_row(stop)]
+    )
+
+
 def generate_notifications_csv(**kwargs):
     from app import notification_api_client
     from app.s3_client.s3_csv_client import s3download
@@ -59,27 +154,45 @@ def generate_notifications_csv(**kwargs):
         kwargs['page'] = 1
 
     if kwargs.get('job_id'):
-        original_file_contents = s3download(kwargs['service_id'], kwargs['job_id'])
-        original_upload = RecipientCSV(
-            original_file_contents,
-            template=get_sample_template(kwargs['template_type']),
+        original_raw_column_headers, original_rows = _read_original_upload(
+            s3download(kwargs['service_id'], kwargs['job_id'])
         )
-        original_column_headers = original_upload.column_headers
+        original_column_headers = list(dict.fromkeys(original_raw_column_headers))
+        recipient_column_keys = {
+            InsensitiveDict.make_key(column_header)
+            for column_header in first_column_headings[kwargs['template_type']]
+        }
         fieldnames = ['Row number'] + original_column_headers + ['Template', 'Type', 'Job', 'Status', 'Time']
     else:
         fieldnames = ['Recipient', 'Reference', 'Template', 'Type', 'Sent by', 'Sent by email', 'Job', 'Status', 'Time']
 
     yield ','.join(fieldnames) + '\n'
 
-    while kwargs['page']:
-        notifications_resp = notification_api_client.get_notifications_for_service(**kwargs)
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    notifications_resp = notification_api_client.get_notifications_for_service(**kwargs)
+
+    while True:
+        if notifications_resp['links'].get('next'):
+            # Start getting the next page while this one is written out
+            kwargs['page'] += 1
+            next_page = call_in_background(
+                partial(notification_api_client.get_notifications_for_service, **kwargs)
+            )
+        else:
+            next_page = None
+
         for notification in notifications_resp['notifications']:
             if kwargs.get('job_id'):
+                original_row = _get_original_row(
+                    original_raw_column_headers,
+                    original_rows[notification['row_number'] - 1],
+                    recipient_column_keys,
+                )
                 values = [
                     notification['row_number'],
                 ] + [
-                    original_upload[notification['row_number'] - 1].get(header).data
-                    for header in original_column_headers
+                    original_row.get(header) for header in original_column_headers
                 ] + [
                     notification['template_name'],
                     notification['template_type'],
@@ -100,10 +213,52 @@ def generate_notifications_csv(**kwargs):
                     notification['status'],
                     notification['created_at']
                 ]
-            yield Spreadsheet.from_rows([map(str, values)]).as_csv_data
+            writer.writerow(map(str, values))
+            if buffer.tell() >= NOTIFICATIONS_CSV_CHUNK_SIZE:
+                yield _empty_buffer(buffer)
 
-        if notifications_resp['links'].get('next'):
-            kwargs['page'] += 1
-        else:
+        if buffer.tell():
+            yield _empty_buffer(buffer)
+
+        if next_page is None:
             return
-    raise Exception("Should never reach here")
+
+        notifications_resp = next_page.wait()
+
+
+def _read_original_upload(file_data):
+    """
+    Split an uploaded file into its column headers and rows the same way as `RecipientCSV`, but without
+    building and validating a `Row` for every one of them. Rows are only made into dictionaries when
+    `_get_original_row` looks them up.
+    """
+    reader = csv.reader(
+        strip_all_whitespace(file_data).splitlines(),
+        quoting=csv.QUOTE_MINIMAL,
+        skipinitialspace=True,
+    )
+    return next(reader, []), list(reader)
+
+
+def _get_original_row(raw_column_headers, row, recipient_column_keys):
+    """
+    Make a row into a dictionary the same way as `RecipientCSV.get_rows`: a repeated recipient column keeps its
+    last value, other repeated columns are collected into a list, and lookups ignore case and spaces.
+    """
+    original_row = {}
+    for column_header, value in zip(raw_column_headers, row):
+        value = strip_and_remove_obscure_whitespace(value) or None
+        if InsensitiveDict.make_key(column_header) in recipient_column_keys:
+            original_row[column_header] = value
+        else:
+            insert_or_append_to_dict(original_row, column_header, value)
+    for column_header in raw_column_headers[len(row):]:
+        insert_or_append_to_dict(original_row, column_header, None)
+    return InsensitiveDict(original_row)
+
+
+def _empty_buffer(buffer):
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
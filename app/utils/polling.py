@@ -0,0 +1,62 @@
+import hashlib
+import json
+
+from flask import current_app, request
+from flask_login import current_user
+
+from app.extensions import redis_client
+
+# The `.json` endpoints polled by `updateContent.js`. Their responses carry an ETag, so browsers are allowed to keep
+# them (privately) and revalidate them with `If-None-Match` instead of downloading the same partials again.
+REVALIDATED_ENDPOINTS = {
+    'main.conversation_updates',
+    'main.get_notifications_as_json',
+    'main.inbox_updates',
+    'main.service_dashboard_updates',
+    'main.view_job_updates',
+    'main.view_notification_updates',
+    'main.view_report_updates',
+}
+
+# Templates also load some data themselves and show relative times ('2 minutes ago'), so rendered partials are only
+# reused for a few polls
+RENDERED_PARTIALS_TTL_IN_SECONDS = 10
+
+
+def _hash(*things):
+    return hashlib.sha256(
+        json.dumps(things, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+
+def partials_response(render_partials, *, upstream_data):
+    """
+    Respond to a poll with the JSON from `render_partials()`.
+
+    Partials are rendered at most once per `RENDERED_PARTIALS_TTL_IN_SECONDS` for the same user, URL and
+    `upstream_data` (the API responses the partials are built from). The response has an ETag made from its
+    content, so a poll that would get the same partials again is answered with a 304 and no body.
+    """
+    cache_key = 'polling-partials-{}'.format(_hash(
+        request.method,
+        request.full_path,
+        request.form.to_dict(flat=False),
+        current_user.id,
+        upstream_data,
+    ))
+
+    body = redis_client.get(cache_key)
+
+    if not body:
+        body = json.dumps(render_partials(), sort_keys=True).encode('utf-8')
+        redis_client.set(cache_key, body, ex=RENDERED_PARTIALS_TTL_IN_SECONDS)
+
+    etag = hashlib.sha256(body).hexdigest()
+
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(body, mimetype='application/json')
+
+    response.set_etag(etag)
+    return response
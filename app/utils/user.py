@@ -1,4 +1,5 @@
 import os
+import time
 from functools import wraps
 
 from flask import abort, current_app
@@ -9,11 +10,47 @@ from app.notify_client.organisations_api_client import organisations_client
 user_is_logged_in = login_required
 
 
+class DomainTrie:
+    """
+    Known domains stored label by label, starting from the top level domain (`gov.uk` as `uk` -> `gov`), so
+    checking an email address takes one lookup per label of its domain, however many domains are known.
+    """
+
+    # not a string, so it can’t be mistaken for a label
+    END_OF_DOMAIN = None
+
+    def __init__(self, domains):
+        self.root = {}
+        for domain in domains:
+            node = self.root
+            for label in reversed(domain.strip().lower().split('.')):
+                node = node.setdefault(label, {})
+            node[self.END_OF_DOMAIN] = True
+
+    def matches(self, email_address):
+        """
+        True if the email address is at a known domain, or a subdomain of one.
+        """
+        node = self.root
+        for label in reversed(email_address.lower().rsplit('@', 1)[-1].split('.')):
+            node = node.get(label)
+            if node is None:
+                return False
+            if self.END_OF_DOMAIN in node:
+                return True
+        return False
+
+
 with open('{}/email_domains.txt'.format(
     os.path.dirname(os.path.realpath(__file__))
 )) as email_domains:
     GOVERNMENT_EMAIL_DOMAIN_NAMES = [line.strip() for line in email_domains]
 
+GOVERNMENT_EMAIL_DOMAINS = DomainTrie(GOVERNMENT_EMAIL_DOMAIN_NAMES)
+
+# Each worker’s copy of the organisations’ domains, refreshed every `ORGANISATION_DOMAINS_CACHE_TTL_IN_SECONDS`
+_organisation_domains = {}
+
 
 def user_has_permissions(*permissions, **permission_kwargs):
     def wrap(func):
@@ -51,21 +88,23 @@ def user_is_platform_admin(f):
 
 
 def is_gov_user(email_address):
-    return _email_address_ends_with(
-        email_address, GOVERNMENT_EMAIL_DOMAIN_NAMES
-    ) or _email_address_ends_with(
-        email_address, organisations_client.get_domains()
+    return (
+        GOVERNMENT_EMAIL_DOMAINS.matches(email_address) or
+        _get_organisation_domains().matches(email_address)
     )
 
 
-def _email_address_ends_with(email_address, known_domains):
-    return any(
-        email_address.lower().endswith((
-            "@{}".format(known),
-            ".{}".format(known),
-        ))
-        for known in known_domains
-    )
+def _get_organisation_domains():
+    ttl_in_seconds = current_app.config['ORGANISATION_DOMAINS_CACHE_TTL_IN_SECONDS']
+    fetched_at = _organisation_domains.get('fetched_at')
+    if fetched_at is None or time.monotonic() - fetched_at >= ttl_in_seconds:
+        _organisation_domains['trie'] = DomainTrie(organisations_client.get_domains())
+        _organisation_domains['fetched_at'] = time.monotonic()
+    return _organisation_domains['trie']
+
+
+def clear_organisation_domains_cache():
+    _organisation_domains.clear()
 
 
 def normalise_email_address_aliases(email_address):
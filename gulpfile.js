@@ -6,6 +6,9 @@
 // 1. LIBRARIES
 // - - - - - - - - - - - - - - -
 const { src, pipe, dest, series, parallel, watch } = require('gulp');
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
 const rollupPluginCommonjs = require('rollup-plugin-commonjs');
 const rollupPluginNodeResolve = require('rollup-plugin-node-resolve');
 const streamqueue = require('streamqueue');
@@ -237,6 +240,40 @@ const images = () => {
 };
 
 
+// Write the MD5 hash of every static file to a manifest, so the app doesn't need to read and hash each file itself
+// (see app/asset_fingerprinter.py). Also write a copy of each file with its hash in its filename
+// (main.css -> main.<hash>.css), which can be served with an immutable, cache-forever URL.
+
+const hashedFilenamePattern = /\.[0-9a-f]{32}(\.[^.\/]+)?$/;
+
+const hashedFilename = (filePath, hash) => {
+  const extension = path.extname(filePath);
+  return filePath.slice(0, filePath.length - extension.length) + '.' + hash + extension;
+};
+
+const manifest = (cb) => {
+  const manifestFile = 'asset-manifest.json';
+  const hashes = {};
+
+  const walk = (directory) => {
+    fs.readdirSync(paths.dist + directory, { withFileTypes: true }).forEach(entry => {
+      const filePath = directory + entry.name;
+      if (entry.isDirectory()) {
+        walk(filePath + '/');
+      } else if (filePath !== manifestFile && !hashedFilenamePattern.test(filePath)) {
+        const contents = fs.readFileSync(paths.dist + filePath);
+        hashes[filePath] = crypto.createHash('md5').update(contents).digest('hex');
+        fs.writeFileSync(paths.dist + hashedFilename(filePath, hashes[filePath]), contents);
+      }
+    });
+  };
+
+  walk('');
+  fs.writeFileSync(paths.dist + manifestFile, JSON.stringify(hashes, null, 2));
+  cb();
+};
+
+
 const watchFiles = {
   javascripts: (cb) => {
     watch([paths.src + 'javascripts/**/*'], javascripts);
@@ -282,21 +319,24 @@ const lint = {
 };
 
 
-// Default: compile everything
-const defaultTask = parallel(
+// Default: compile everything, then fingerprint it
+const defaultTask = series(
   parallel(
-    copy.govuk_frontend.fonts,
-    copy.govuk_frontend.templates,
-    images,
-    copy.leaflet.js
-  ),
-  series(
-    copy.error_pages,
-    series(
-      javascripts
+    parallel(
+      copy.govuk_frontend.fonts,
+      copy.govuk_frontend.templates,
+      images,
+      copy.leaflet.js
     ),
-    sass
-  )
+    series(
+      copy.error_pages,
+      series(
+        javascripts
+      ),
+      sass
+    )
+  ),
+  manifest
 );
 
 
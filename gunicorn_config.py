@@ -21,6 +21,12 @@ def worker_abort(worker):
         worker.log.error(''.join(traceback.format_stack(stack)))
 
 
+def worker_exit(server, worker):
+    # send any audit events still waiting to go to the API
+    from app.event_handlers import event_queue
+    event_queue.flush_on_exit()
+
+
 def fix_ssl_monkeypatching():
     """
     eventlet works by monkey-patching core IO libraries (such as ssl) to be non-blocking. However, there's currently
@@ -1,3 +1,4 @@
+import fnmatch
 import uuid
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
@@ -43,6 +44,36 @@ class TestClient(FlaskClient):
         self.get(url_for("main.sign_out"))
 
 
+class FakeRedis:
+    """
+    In-memory stand-in for `notifications_utils.clients.redis.RedisClient`, so caching behaviour can be tested
+    without a redis server. Values are stored as bytes, like real redis returns them.
+    """
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None, px=None, nx=False, xx=False):
+        if (nx and key in self.store) or (xx and key not in self.store):
+            return None
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        self.store[key] = value
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def delete_by_pattern(self, pattern):
+        matching_keys = fnmatch.filter(self.store, pattern)
+        self.delete(*matching_keys)
+        return len(matching_keys)
+
+
 def sample_uuid():
     return "6ce466d0-fd6a-11e5-82f5-e0accb9d11a6"
 
@@ -1,3 +1,4 @@
+import sqlite3
 from math import isclose
 
 import pytest
@@ -12,6 +13,12 @@ from app.broadcast_areas.populations import (
     CITY_OF_LONDON,
     estimate_number_of_smartphones_for_population,
 )
+from app.broadcast_areas.repo import (
+    _get_read_only_connection,
+    log_broadcast_areas_query_count,
+    pack_polygons,
+    unpack_polygons,
+)
 
 
 def close_enough(a, b):
@@ -152,6 +159,66 @@ def test_repository_has_all_libraries():
     ] == [(name, name_singular) for _, name, name_singular, _is_group in libraries]
 
 
+def test_repositories_share_a_read_only_connection():
+    connection = _get_read_only_connection(BroadcastAreasRepository().database)
+
+    assert _get_read_only_connection(BroadcastAreasRepository().database) is connection
+
+    with pytest.raises(sqlite3.OperationalError, match='readonly database'):
+        connection.execute('DELETE FROM broadcast_areas')
+
+
+def test_repository_counts_queries_made_during_a_request(notify_admin, mocker):
+    mock_debug = mocker.patch.object(notify_admin.logger, 'debug')
+
+    with notify_admin.test_request_context('/some-page'):
+        broadcast_area_libraries.get_areas(['lad20-E09000009'])
+        broadcast_area_libraries.get_areas(['lad20-E09000009'])
+        log_broadcast_areas_query_count()
+
+    mock_debug.assert_called_once_with('Made 2 broadcast areas database queries for /some-page')
+
+
+def test_rebuilding_library_data_does_not_duplicate_bounds(tmp_path):
+    repo = BroadcastAreasRepository(read_only=False)
+    repo.database = tmp_path / 'broadcast-areas.sqlite3'
+    repo.create_tables()
+
+    for _ in range(2):
+        # what create-broadcast-areas-db.py does with --keep-old-polygons
+        repo.delete_library_data()
+        repo.insert_broadcast_area_bounds([
+            ['wd20-E05004516', (-0.2, 51.5, -0.1, 51.6)],
+            ['wd20-E05009317', (-3.2, 55.9, -3.1, 56.0)],
+        ])
+
+    assert repo.query('SELECT count(*) FROM broadcast_area_bounds') == [(2,)]
+    assert repo.get_ids_of_areas_overlapping_bounds((-0.15, 51.55, -0.15, 51.55)) == ['wd20-E05004516']
+
+
+@pytest.mark.parametrize('polygons', (
+    [],
+    [[[-0.1, 51.5], [-0.2, 51.5], [-0.2, 51.6], [-0.1, 51.5]]],
+    [
+        [[-3.189, 55.952], [-3.181, 55.951], [-3.184, 55.956], [-3.189, 55.952]],
+        [[1.0, 2.0], [3.0, 4.0], [5.0, 6.123456789], [7.0, 8.0], [1.0, 2.0]],
+    ],
+))
+def test_polygons_are_unpacked_to_the_same_coordinates(polygons):
+    assert unpack_polygons(pack_polygons(polygons)) == [
+        [tuple(point) for point in polygon] for polygon in polygons
+    ]
+
+
+def test_simple_polygons_are_read_for_many_areas_at_once():
+    repo = BroadcastAreasRepository()
+
+    areas = repo.get_simple_polygons_for_areas(['wd20-E05004516', 'lad20-E07000087', 'not-an-area'])
+
+    assert sorted(area_id for area_id, _polygons, _utm_crs in areas) == ['lad20-E07000087', 'wd20-E05004516']
+    assert all(polygons for _area_id, polygons, _utm_crs in areas)
+
+
 @pytest.mark.parametrize('library', (
     broadcast_area_libraries
 ))
@@ -196,6 +263,20 @@ def test_count_of_phones_for_all_levels(area_id, area_name, expected_count):
     assert area.count_of_phones == expected_count
 
 
+def test_ancestors_of_many_areas_are_found_with_one_query(mocker):
+    fareham_east, hackney_downs = sorted(broadcast_area_libraries.get_areas(['wd20-E05004516', 'wd20-E05009373']))
+    mock_query = mocker.spy(BroadcastAreasRepository, 'query')
+
+    broadcast_area_libraries.load_ancestors([fareham_east, hackney_downs])
+
+    assert [area.name for area in fareham_east.ancestors] == ['Fareham', 'Hampshire']
+    assert [area.name for area in fareham_east.parent.ancestors] == ['Hampshire']
+    assert fareham_east.parent.parent.ancestors == []
+    assert [area.name for area in hackney_downs.ancestors] == ['Hackney']
+    assert hackney_downs.parent.parent is None
+    assert mock_query.call_count == 1
+
+
 def test_city_of_london_counts_are_not_derived_from_population():
     city_of_london = broadcast_area_libraries.get_areas(['lad20-E09000001'])[0]
 
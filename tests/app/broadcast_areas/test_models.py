@@ -1,6 +1,9 @@
+from math import isclose
+
 import pytest
+from notifications_utils.polygons import Polygons
 
-from app.broadcast_areas.models import CustomBroadcastArea
+from app.broadcast_areas.models import CustomBroadcastArea, PolygonsCache
 from tests.app.broadcast_areas.custom_polygons import BRISTOL, SANTA_A, SKYE
 
 
@@ -18,3 +21,59 @@ def test_custom_broadcast_area_overlapping_electoral_wards(
     )
 
     assert len(custom_area.overlapping_electoral_wards) == expected_wards_length
+
+
+def test_custom_broadcast_area_only_works_out_intersection_of_wards_partly_inside_it(mocker):
+    def square(min_x, min_y, max_x, max_y):
+        return Polygons([[[min_x, min_y], [max_x, min_y], [max_x, max_y], [min_x, max_y], [min_x, min_y]]])
+
+    inside = mocker.Mock(count_of_phones=100, simple_polygons=square(-2.61, 51.44, -2.60, 51.45))
+    partly_inside = mocker.Mock(count_of_phones=100, simple_polygons=square(-2.58, 51.44, -2.57, 51.45))
+    outside = mocker.Mock(count_of_phones=100, simple_polygons=square(-2.50, 51.44, -2.49, 51.45))
+    mock_ratio_of_intersection_with = mocker.spy(Polygons, 'ratio_of_intersection_with')
+
+    custom_area = CustomBroadcastArea(name='foo', polygons=[BRISTOL])
+    custom_area.nearby_electoral_wards = [inside, partly_inside, outside]
+
+    assert custom_area.overlapping_electoral_wards == [inside, partly_inside]
+    assert isclose(custom_area.count_of_phones, 150, rel_tol=0.01)
+    assert mock_ratio_of_intersection_with.call_count == 1
+
+
+def test_polygons_cache_only_loads_areas_it_does_not_have(mocker):
+    load = mocker.Mock(side_effect=lambda area_ids: [(area_id, f'polygons for {area_id}') for area_id in area_ids])
+    cache = PolygonsCache(maxsize=10, load=load)
+
+    assert cache.get_many(['a', 'b']) == {'a': 'polygons for a', 'b': 'polygons for b'}
+    assert cache.get_many(['b', 'c']) == {'b': 'polygons for b', 'c': 'polygons for c'}
+    assert cache.get('a') == 'polygons for a'
+
+    assert load.call_args_list == [
+        mocker.call(['a', 'b']),
+        mocker.call(['c']),
+    ]
+
+
+def test_polygons_cache_drops_least_recently_used_areas(mocker):
+    load = mocker.Mock(side_effect=lambda area_ids: [(area_id, f'polygons for {area_id}') for area_id in area_ids])
+    cache = PolygonsCache(maxsize=2, load=load)
+
+    cache.get('a')
+    cache.get('b')
+    cache.get('a')
+    cache.get('c')
+    cache.get('a')
+    cache.get('b')
+
+    assert load.call_args_list == [
+        mocker.call(['a']),
+        mocker.call(['b']),
+        mocker.call(['c']),
+        mocker.call(['b']),
+    ]
+
+
+def test_polygons_cache_leaves_out_areas_which_do_not_exist(mocker):
+    cache = PolygonsCache(maxsize=10, load=lambda area_ids: [])
+
+    assert cache.get_many(['a']) == {}
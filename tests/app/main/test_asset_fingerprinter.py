@@ -1,4 +1,7 @@
 # coding=utf-8
+import json
+
+import pytest
 
 from app.asset_fingerprinter import AssetFingerprinter
 
@@ -100,6 +103,49 @@ class TestAssetFingerprint(object):
         assert fingerprinter._cache == {}
 
 
+class TestAssetFingerprintWithManifest(object):
+    @pytest.fixture
+    def fingerprinter(self, tmp_path):
+        (tmp_path / 'asset-manifest.json').write_text(json.dumps({
+            'stylesheets/main.css': 'abc123',
+            'fonts/LICENSE': 'def456',
+        }))
+        (tmp_path / 'javascripts').mkdir()
+        (tmp_path / 'javascripts' / 'all.js').write_bytes(b'document.write("Hello world!");')
+        return AssetFingerprinter(filesystem_path=f'{tmp_path}/')
+
+    def test_uses_hash_from_manifest(self, fingerprinter, mocker):
+        get_file_content_mock = mocker.spy(fingerprinter, 'get_asset_file_contents')
+        fingerprinter.load_manifest('asset-manifest.json')
+
+        assert fingerprinter.get_url('stylesheets/main.css') == '/static/stylesheets/main.css?abc123'
+        assert get_file_content_mock.called is False
+
+    def test_hashes_files_missing_from_manifest(self, fingerprinter):
+        fingerprinter.load_manifest('asset-manifest.json')
+
+        assert fingerprinter.get_url('javascripts/all.js') == (
+            '/static/javascripts/all.js?1811012dd23c92285a488de2c1af4e7b'
+        )
+
+    def test_hashes_files_if_manifest_is_missing(self, fingerprinter):
+        fingerprinter.load_manifest('not-there.json', hashed_filenames=True)
+
+        assert fingerprinter.get_url('javascripts/all.js') == (
+            '/static/javascripts/all.js?1811012dd23c92285a488de2c1af4e7b'
+        )
+
+    @pytest.mark.parametrize('asset_path, expected_url', (
+        ('stylesheets/main.css', '/static/stylesheets/main.abc123.css'),
+        ('fonts/LICENSE', '/static/fonts/LICENSE.def456'),
+        ('javascripts/all.js', '/static/javascripts/all.js?1811012dd23c92285a488de2c1af4e7b'),
+    ))
+    def test_hashed_filenames(self, fingerprinter, asset_path, expected_url):
+        fingerprinter.load_manifest('asset-manifest.json', hashed_filenames=True)
+
+        assert fingerprinter.get_url(asset_path) == expected_url
+
+
 class TestAssetFingerprintWithUnicode(object):
     def test_can_read_self(self):
         'Ralph’s apostrophe is a string containing a unicode character'
@@ -4,6 +4,7 @@ import pytest
 from wtforms import ValidationError
 
 from app.main.validators import (
+    CommonlyUsedPassword,
     MustContainAlphanumericCharacters,
     NoCommasInPlaceHolders,
     OnlySMSCharacters,
@@ -126,3 +127,27 @@ def test_if_string_does_not_contain_alphanumeric_characters_raises(string):
 @pytest.mark.parametrize("string", [".A8", "AB.", ".42...."])
 def test_if_string_contains_alphanumeric_characters_does_not_raise(string):
     MustContainAlphanumericCharacters()(None, _gen_mock_field(string))
+
+
+@pytest.mark.parametrize("password", [
+    "password",
+    "PASSWORD",
+    "P4ssw0rd",
+    "pa$$word",
+    "GOV.UK Notify",
+    "gov.uk n0tify",
+    "11111111",
+])
+def test_commonly_used_password_raises(password):
+    with pytest.raises(ValidationError) as error:
+        CommonlyUsedPassword()(None, _gen_mock_field(password))
+
+    assert str(error.value) == "Password is in list of commonly used passwords."
+
+
+@pytest.mark.parametrize("password", [
+    "correct horse battery staple",
+    "password with more words",
+])
+def test_uncommon_password_does_not_raise(password):
+    CommonlyUsedPassword()(None, _gen_mock_field(password))
@@ -8,7 +8,11 @@ from flask import url_for
 from freezegun import freeze_time
 from notifications_python_client.errors import HTTPError
 
-from app.main.views.conversation import get_user_number
+from app.main.views.conversation import (
+    _render_message,
+    get_sms_thread,
+    get_user_number,
+)
 from tests.conftest import (
     SERVICE_ONE_ID,
     _template,
@@ -186,8 +190,12 @@ def test_view_conversation_updates(
         'app.main.views.conversation.service_api_client.get_inbound_sms_by_id',
         side_effect=HTTPError(response=Mock(status_code=404)),
     )
-    mock_get_partials = mocker.patch(
-        'app.main.views.conversation.get_conversation_partials',
+    mock_get_data = mocker.patch(
+        'app.main.views.conversation.get_conversation_data',
+        return_value=[{'notifications': []}, {'data': []}],
+    )
+    mock_render_partials = mocker.patch(
+        'app.main.views.conversation.render_conversation_partials',
         return_value={'messages': 'foo'}
     )
 
@@ -199,7 +207,42 @@ def test_view_conversation_updates(
 
     assert json.loads(response.get_data(as_text=True)) == {'messages': 'foo'}
 
-    mock_get_partials.assert_called_once_with(SERVICE_ONE_ID, '07123 456789')
+    mock_get_data.assert_called_once_with(SERVICE_ONE_ID, '07123 456789')
+    mock_render_partials.assert_called_once_with({'notifications': []}, {'data': []})
+
+
+def test_get_sms_thread_merges_messages_oldest_first():
+    outbound = [
+        {
+            'id': f'outbound-{index}',
+            'created_at': f'2012-01-01T0{index}:00:00',
+            'status': 'delivered',
+            'template': {'content': 'Hello ((name))', 'redact_personalisation': False},
+            'personalisation': {'name': 'Jo'},
+        }
+        for index in (5, 3, 1)
+    ]
+    inbound = [
+        {
+            'id': f'inbound-{index}',
+            'created_at': f'2012-01-01T0{index}:00:00',
+            'notify_number': '07900000002',
+            'content': 'Hi',
+        }
+        for index in (6, 4, 2)
+    ]
+    _render_message.cache_clear()
+
+    thread = list(get_sms_thread(outbound, inbound))
+
+    assert [message['id'] for message in thread] == [
+        'outbound-1', 'inbound-2', 'outbound-3', 'inbound-4', 'outbound-5', 'inbound-6',
+    ]
+    assert [message['inbound'] for message in thread] == [False, True] * 3
+    assert 'Hello Jo' in thread[0]['content']
+    # each distinct message is only rendered once
+    assert _render_message.cache_info().misses == 2
+    assert _render_message.cache_info().hits == 4
 
 
 @freeze_time("2012-01-01 00:00:00")
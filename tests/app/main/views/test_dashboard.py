@@ -398,8 +398,8 @@ def test_view_inbox_updates(
 ):
     service_one['permissions'] += ['inbound_sms']
 
-    mock_get_partials = mocker.patch(
-        'app.main.views.dashboard.get_inbox_partials',
+    mock_render_partials = mocker.patch(
+        'app.main.views.dashboard.render_inbox_partials',
         return_value={'messages': 'foo'},
     )
 
@@ -409,7 +409,7 @@ def test_view_inbox_updates(
 
     assert json.loads(response.get_data(as_text=True)) == {'messages': 'foo'}
 
-    mock_get_partials.assert_called_once_with(SERVICE_ONE_ID)
+    mock_render_partials.assert_called_once_with(SERVICE_ONE_ID, {'has_next': False, 'data': []})
 
 
 @freeze_time("2016-07-01 13:00")
@@ -1,3 +1,6 @@
+import pytest
+
+from tests.conftest import SERVICE_ONE_ID
 
 
 def test_owasp_useful_headers_set(
@@ -52,3 +55,25 @@ def test_headers_non_ascii_characters_are_replaced(
         " *.notifications.service.gov.uk static-logos??.test.com data:;"
         "frame-src 'self' www.youtube-nocookie.com;"
     )
+
+
+@pytest.mark.parametrize('endpoint, expected_cache_control', [
+    ('main.service_dashboard_updates', 'no-cache, private, must-revalidate'),
+    ('main.service_dashboard', 'no-store, no-cache, private, must-revalidate'),
+])
+def test_only_polled_endpoints_can_be_stored_by_the_browser(
+    client_request,
+    mock_get_service_templates,
+    mock_get_template_statistics,
+    mock_get_service_statistics,
+    mock_has_no_jobs,
+    mock_get_annual_usage_for_service,
+    mock_get_free_sms_fragment_limit,
+    mock_get_inbound_sms_summary,
+    mock_get_returned_letter_statistics_with_no_returned_letters,
+    endpoint,
+    expected_cache_control,
+):
+    response = client_request.get_response(endpoint, service_id=SERVICE_ONE_ID)
+
+    assert response.headers['Cache-Control'] == expected_cache_control
@@ -808,6 +808,64 @@ def test_clear_cache_requires_option(
     assert not redis.delete_by_pattern.called
 
 
+def test_clear_temporary_logos_shows_form(
+    client_request,
+    platform_admin_user,
+    mocker,
+):
+    mock_delete = mocker.patch('app.main.views.platform_admin.delete_temp_files_older_than')
+    client_request.login(platform_admin_user)
+
+    page = client_request.get('main.clear_temporary_logos')
+
+    assert not mock_delete.called
+    assert page.select_one('input[name=older_than_hours]')['value'] == '24'
+
+
+def test_clear_temporary_logos_submits_and_tells_you_how_many_were_deleted(
+    client_request,
+    platform_admin_user,
+    mocker,
+):
+    mock_delete = mocker.patch(
+        'app.main.views.platform_admin.delete_temp_files_older_than', return_value=1234
+    )
+    client_request.login(platform_admin_user)
+
+    page = client_request.post(
+        'main.clear_temporary_logos',
+        _data={'older_than_hours': '48'},
+        _expected_status=200
+    )
+
+    mock_delete.assert_called_once_with(48)
+    assert normalize_spaces(page.select_one('div.banner-default').text) == 'Removed 1234 temporary logos'
+
+
+@pytest.mark.parametrize('older_than_hours, expected_error', (
+    ('', 'Error: Cannot be empty'),
+    ('0', 'Error: Must be at least 1'),
+))
+def test_clear_temporary_logos_validates_number_of_hours(
+    client_request,
+    platform_admin_user,
+    mocker,
+    older_than_hours,
+    expected_error,
+):
+    mock_delete = mocker.patch('app.main.views.platform_admin.delete_temp_files_older_than')
+    client_request.login(platform_admin_user)
+
+    page = client_request.post(
+        'main.clear_temporary_logos',
+        _data={'older_than_hours': older_than_hours},
+        _expected_status=200
+    )
+
+    assert normalize_spaces(page.select_one('.govuk-error-message').text) == expected_error
+    assert not mock_delete.called
+
+
 def test_reports_page(
     client_request,
     platform_admin_user,
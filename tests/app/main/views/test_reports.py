@@ -0,0 +1,150 @@
+import json
+
+import pytest
+from flask import url_for
+
+from tests.conftest import SERVICE_ONE_ID, normalize_spaces, set_config
+
+
+@pytest.fixture
+def report_id():
+    return '2c8b9f6a-3f2a-4b8e-9c1d-7a6e5f4d3c2b'
+
+
+@pytest.fixture
+def set_report(fake_redis, report_id, active_user_with_permissions):
+    def _set_report(status, user_id=active_user_with_permissions['id'], writer_alive=True):
+        fake_redis.set(f'report-{report_id}', json.dumps({
+            'id': report_id,
+            'user_id': user_id,
+            'filename': 'report.csv',
+            'status': status,
+        }))
+        if writer_alive:
+            fake_redis.set(f'report-{report_id}-writer', report_id)
+    return _set_report
+
+
+def test_asking_for_a_report_starts_it_in_the_background_if_redis_is_enabled(
+    notify_admin,
+    client_request,
+    fake_redis,
+    mock_get_job,
+    mock_get_service_template,
+    mocker,
+    fake_uuid,
+):
+    mock_spawn = mocker.patch('app.models.report.spawn')
+
+    with set_config(notify_admin, 'REDIS_ENABLED', True):
+        response = client_request.get_response(
+            'main.view_job_csv',
+            service_id=SERVICE_ONE_ID,
+            job_id=fake_uuid,
+            _expected_status=302,
+        )
+
+    report_id = mock_spawn.call_args[0][0].__self__.id
+    assert response.location == url_for('main.view_report', report_id=report_id)
+    assert json.loads(fake_redis.get(f'report-{report_id}'))['status'] == 'pending'
+
+
+@pytest.mark.parametrize('status, expected_message, expected_download_link', [
+    ('pending', 'Notify is preparing your report. This page will update when it’s ready.', None),
+    ('finished', 'Download this report (CSV)', True),
+    ('failed', 'Notify could not prepare your report. Go back and try downloading it again.', None),
+])
+def test_view_report(
+    client_request,
+    set_report,
+    report_id,
+    status,
+    expected_message,
+    expected_download_link,
+):
+    set_report(status)
+
+    page = client_request.get('main.view_report', report_id=report_id)
+
+    assert normalize_spaces(page.select_one('h1').text) == 'report.csv'
+    assert normalize_spaces(page.select_one('.ajax-block-container').text) == expected_message
+    assert bool(page.select_one('[data-module=update-content]')) == (status == 'pending')
+
+    if expected_download_link:
+        assert page.select_one('.ajax-block-container a')['href'] == url_for(
+            'main.download_report', report_id=report_id,
+        )
+
+
+def test_view_report_shows_pending_report_as_failed_if_its_writer_has_gone_away(
+    client_request,
+    set_report,
+    report_id,
+):
+    set_report('pending', writer_alive=False)
+
+    page = client_request.get('main.view_report', report_id=report_id)
+
+    assert normalize_spaces(page.select_one('.ajax-block-container').text) == (
+        'Notify could not prepare your report. Go back and try downloading it again.'
+    )
+    assert not page.select_one('[data-module=update-content]')
+
+
+def test_view_report_updates(
+    client_request,
+    set_report,
+    report_id,
+):
+    set_report('finished')
+
+    response = client_request.get_response('main.view_report_updates', report_id=report_id)
+
+    assert 'Download this report' in json.loads(response.get_data(as_text=True))['status']
+
+
+def test_download_report_redirects_to_s3(
+    client_request,
+    set_report,
+    report_id,
+    mocker,
+):
+    set_report('finished')
+    mock_get_download_url = mocker.patch(
+        'app.models.report.get_report_download_url',
+        return_value='https://s3.example.com/reports/report.csv?signature=1234',
+    )
+
+    client_request.get(
+        'main.download_report',
+        report_id=report_id,
+        _expected_redirect='https://s3.example.com/reports/report.csv?signature=1234',
+    )
+
+    mock_get_download_url.assert_called_once_with(report_id, 'report.csv')
+
+
+def test_download_report_404s_if_report_not_finished(
+    client_request,
+    set_report,
+    report_id,
+):
+    set_report('pending')
+
+    client_request.get('main.download_report', report_id=report_id, _expected_status=404)
+
+
+@pytest.mark.parametrize('endpoint', [
+    'main.view_report',
+    'main.view_report_updates',
+    'main.download_report',
+])
+def test_reports_404_for_other_users(
+    client_request,
+    set_report,
+    report_id,
+    endpoint,
+):
+    set_report('finished', user_id='a7b6c5d4-e3f2-4a1b-8c9d-0e1f2a3b4c5d')
+
+    client_request.get(endpoint, report_id=report_id, _expected_status=404)
@@ -28,6 +28,7 @@ from xlrd.xldate import (
     XLDateTooLarge,
 )
 
+import app.utils.csv
 from tests import (
     template_json,
     validate_route_permission,
@@ -397,6 +398,11 @@ def test_upload_files_in_different_formats(
     mock_s3_upload,
     fake_uuid,
 ):
+    uploaded_data = []
+    mock_s3_upload.side_effect = lambda service_id, filedata, region, metadata: (
+        uploaded_data.append(filedata['data'].read().decode('utf-8')) or fake_uuid
+    )
+
     with open(filename, 'rb') as uploaded:
         page = client_request.post(
             'main.send_messages',
@@ -408,17 +414,14 @@ def test_upload_files_in_different_formats(
         )
 
     if acceptable_file:
-        assert mock_s3_upload.call_args[0][1]['data'].strip() == (
+        assert uploaded_data[0].strip() == (
             "phone number,name,favourite colour,fruit\r\n"
             "07739 468 050,Pete,Coral,tomato\r\n"
             "07527 125 974,Not Pete,Magenta,Avacado\r\n"
             "07512 058 823,Still Not Pete,Crimson,Pear"
         )
-        mock_s3_set_metadata.assert_called_once_with(
-            SERVICE_ONE_ID,
-            fake_uuid,
-            original_file_name=filename
-        )
+        assert mock_s3_upload.call_args[1]['metadata'] == {'original_file_name': filename}
+        assert not mock_s3_set_metadata.called
     else:
         assert not mock_s3_upload.called
         assert normalize_spaces(page.select_one('.banner-dangerous').text) == (
@@ -450,10 +453,10 @@ def test_send_messages_sanitises_and_truncates_file_name_for_metadata(
     )
 
     assert len(
-        mock_s3_set_metadata.call_args_list[0][1]['original_file_name']
+        mock_s3_upload.call_args_list[0][1]['metadata']['original_file_name']
     ) < len(filename)
 
-    assert mock_s3_set_metadata.call_args_list[0][1]['original_file_name'].startswith('?')
+    assert mock_s3_upload.call_args_list[0][1]['metadata']['original_file_name'].startswith('?')
 
 
 @pytest.mark.parametrize('exception, expected_error_message', [
@@ -496,7 +499,7 @@ def test_shows_error_if_parsing_exception(
         raise exception()
 
     mocker.patch(
-        'app.main.views.send.Spreadsheet.from_file',
+        'app.main.views.send.Spreadsheet.spool_csv_from_file',
         side_effect=_raise_exception_or_partial_exception
     )
 
@@ -1261,6 +1264,45 @@ def test_404_for_previewing_a_row_out_of_range(
     )
 
 
+def test_previewing_rows_only_validates_the_file_once(
+    client_request,
+    mocker,
+    fake_redis,
+    mock_get_live_service,
+    mock_get_service_template_with_placeholders,
+    mock_get_users_by_service,
+    mock_get_service_statistics,
+    mock_get_job_doesnt_exist,
+    mock_get_jobs,
+    mock_s3_get_metadata,
+    mock_s3_set_metadata,
+    fake_uuid,
+):
+    mock_validate_csv = mocker.spy(app.utils.csv, '_validate_csv')
+    mocker.patch('app.main.views.send.s3download', return_value="""
+        phone number,name
+        07700900001, A
+        07700900002, B
+        07700900003, C
+    """)
+
+    for row_index, expected_recipient in (
+        (2, 'To: 07700900001'),
+        (3, 'To: 07700900002'),
+        (4, 'To: 07700900003'),
+    ):
+        page = client_request.get(
+            'main.check_messages',
+            service_id=SERVICE_ONE_ID,
+            template_id=fake_uuid,
+            upload_id=fake_uuid,
+            row_index=row_index,
+        )
+        assert page.select_one('.sms-message-recipient').text.strip() == expected_recipient
+
+    assert mock_validate_csv.call_count == 1
+
+
 @pytest.mark.parametrize('template_type', ['sms', 'email', 'letter'])
 def test_send_one_off_step_redirects_to_start_if_session_not_setup(
     mocker,
@@ -3717,6 +3759,7 @@ def test_check_messages_shows_over_max_row_error(
     mock_recipients = mocker.patch('app.main.views.send.RecipientCSV').return_value
     mock_recipients.max_rows = 11111
     mock_recipients.__len__.return_value = 99999
+    mock_recipients.recipient_column_headers = ['phone number']
     mock_recipients.too_many_rows.return_value = True
 
     with client_request.session_transaction() as session:
@@ -4395,11 +4438,9 @@ def test_send_from_contact_list(
         SERVICE_ONE_ID, fake_uuid, bucket='test-contact-list'
     )
     mock_upload.assert_called_once_with(
-        SERVICE_ONE_ID, {'data': 'contents'}, ANY
-    )
-    mock_set_metadata.assert_called_once_with(
-        SERVICE_ONE_ID, new_uuid, example_key='example value'
+        SERVICE_ONE_ID, {'data': 'contents'}, ANY, metadata={'example_key': 'example value'}
     )
+    assert not mock_set_metadata.called
 
 
 def test_send_to_myself_sets_placeholder_and_redirects_for_email(
@@ -208,16 +208,12 @@ def test_upload_csv_file_shows_error_banner(
     )
     mock_upload.assert_called_once_with(
         SERVICE_ONE_ID,
-        {'data': '', 'file_name': 'invalid.csv'},
+        {'data': ANY, 'file_name': 'invalid.csv'},
         ANY,
         bucket='test-contact-list',
+        metadata={'original_file_name': 'invalid.csv'},
     )
-    mock_set_metadata.assert_called_once_with(
-        SERVICE_ONE_ID,
-        fake_uuid,
-        bucket='test-contact-list',
-        original_file_name='invalid.csv'
-    )
+    assert not mock_set_metadata.called
     mock_download.assert_called_once_with(
         SERVICE_ONE_ID,
         fake_uuid,
@@ -299,8 +295,8 @@ def test_upload_csv_file_sanitises_and_truncates_file_name_in_metadata(
     mock_get_users_by_service,
     fake_uuid,
 ):
-    mocker.patch('app.models.contact_list.s3upload', return_value=fake_uuid)
-    mock_set_metadata = mocker.patch('app.models.contact_list.set_metadata_on_csv_upload')
+    mock_upload = mocker.patch('app.models.contact_list.s3upload', return_value=fake_uuid)
+    mocker.patch('app.models.contact_list.set_metadata_on_csv_upload')
     mocker.patch('app.models.contact_list.s3download', return_value='\n'.join(
         ['phone number'] + (['07700900986'] * 100_001)
     ))
@@ -316,10 +312,10 @@ def test_upload_csv_file_sanitises_and_truncates_file_name_in_metadata(
     )
 
     assert len(
-        mock_set_metadata.call_args_list[0][1]['original_file_name']
+        mock_upload.call_args_list[0][1]['metadata']['original_file_name']
     ) < len(filename)
 
-    assert mock_set_metadata.call_args_list[0][1]['original_file_name'].startswith('?')
+    assert mock_upload.call_args_list[0][1]['metadata']['original_file_name'].startswith('?')
 
 
 def test_upload_csv_shows_trial_mode_error(
@@ -131,3 +131,37 @@ def test_combining_multiple_areas_keeps_same_bounds(area_ids, approx_bounds):
     ] == (
         approx_bounds
     )
+
+
+def test_area_estimates_are_shared_by_broadcasts_with_the_same_areas(notify_admin, mocker, fake_redis):
+    mock_get_polygons_from_areas = mocker.spy(BroadcastMessage, 'get_polygons_from_areas')
+
+    first = BroadcastMessage(broadcast_message_json(area_ids=['wd20-E05009372', 'wd20-E05009374']))
+    second = BroadcastMessage(broadcast_message_json(area_ids=['wd20-E05009374', 'wd20-E05009372']))
+
+    assert first.count_of_phones_likely == second.count_of_phones_likely
+    assert first.count_of_phones == second.count_of_phones
+    assert (
+        first.simple_polygons_with_bleed.as_coordinate_pairs_lat_long
+        == second.simple_polygons_with_bleed.as_coordinate_pairs_lat_long
+    )
+    assert [
+        call_args[1]['area_attribute'] for call_args in mock_get_polygons_from_areas.call_args_list
+    ] == [
+        'simple_polygons_with_bleed',
+        # the simple polygons are needed by the first broadcast to estimate the count of phones
+        'simple_polygons',
+    ]
+
+
+def test_adding_areas_works_out_estimates_for_the_new_areas(notify_admin, mocker, fake_redis):
+    mocker.patch('app.models.broadcast_message.broadcast_message_api_client.update_broadcast_message')
+    broadcast_message = BroadcastMessage(broadcast_message_json(area_ids=['wd20-E05009372']))
+
+    broadcast_message.add_areas('wd20-E05009374')
+
+    mock_get_polygons_from_areas = mocker.spy(BroadcastMessage, 'get_polygons_from_areas')
+    reloaded = BroadcastMessage(broadcast_message_json(areas=broadcast_message._dict['areas']))
+
+    assert reloaded.count_of_phones_likely > 0
+    assert mock_get_polygons_from_areas.call_args_list == []
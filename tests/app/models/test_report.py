@@ -0,0 +1,210 @@
+import json
+
+import pytest
+from werkzeug.exceptions import NotFound
+
+from app.models.report import Report
+
+
+def _write_csv(**kwargs):
+    yield 'Name,Value\r\n'
+    for name, value in sorted(kwargs.items()):
+        yield f'{name},{value}\r\n'
+
+
+@pytest.fixture
+def mock_spawn(mocker):
+    return mocker.patch('app.models.report.spawn')
+
+
+@pytest.fixture
+def mock_spawn_after(mocker):
+    return mocker.patch('app.models.report.spawn_after')
+
+
+@pytest.fixture
+def mock_current_user(mocker, fake_uuid):
+    return mocker.patch('app.models.report.current_user', id=fake_uuid)
+
+
+def test_start_writes_report_in_background(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_current_user,
+    fake_uuid,
+):
+    report = Report.start(_write_csv, filename='report.csv', service_id='1234')
+
+    assert report.status == Report.PENDING
+    assert report.filename == 'report.csv'
+    assert report.user_id == fake_uuid
+    assert json.loads(fake_redis.get(f'report-{report.id}')) == {
+        'id': report.id,
+        'user_id': fake_uuid,
+        'filename': 'report.csv',
+        'status': 'pending',
+    }
+    mock_spawn.assert_called_once_with(report._write, notify_admin, _write_csv, {'service_id': '1234'})
+
+
+def test_start_returns_the_same_report_until_it_fails(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_current_user,
+):
+    report = Report.start(_write_csv, filename='report.csv', service_id='1234')
+
+    assert Report.start(_write_csv, filename='other.csv', service_id='1234').id == report.id
+    assert Report.start(_write_csv, filename='report.csv', service_id='5678').id != report.id
+    assert mock_spawn.call_count == 2
+
+    report.status = Report.FAILED
+    report._save()
+    fake_redis.delete(f'report-{report.id}-writer')
+
+    assert Report.start(_write_csv, filename='report.csv', service_id='1234').id == report.id
+    assert mock_spawn.call_count == 3
+
+
+def test_start_only_spawns_one_writer_for_a_report(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_current_user,
+):
+    report = Report.start(_write_csv, filename='report.csv', service_id='1234')
+    report.status = Report.FAILED
+    report._save()
+
+    # another request has claimed the report but not saved it as pending yet
+    assert fake_redis.get(f'report-{report.id}-writer')
+
+    assert Report.start(_write_csv, filename='report.csv', service_id='1234').status == Report.PENDING
+    assert mock_spawn.call_count == 1
+
+
+def test_pending_report_fails_if_its_writer_goes_away(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_current_user,
+):
+    report = Report.start(_write_csv, filename='report.csv', service_id='1234')
+
+    assert Report.from_id(report.id).status == Report.PENDING
+
+    fake_redis.delete(f'report-{report.id}-writer')
+
+    assert Report.from_id(report.id).status == Report.FAILED
+    assert Report.start(_write_csv, filename='report.csv', service_id='1234').id == report.id
+    assert mock_spawn.call_count == 2
+    assert Report.from_id(report.id).status == Report.PENDING
+
+
+def test_write_sends_heartbeats_until_report_is_written(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_spawn_after,
+    mock_current_user,
+    mocker,
+):
+    mocker.patch('app.models.report.upload_report')
+
+    report = Report.start(_write_csv, filename='report.csv', service_id='1234')
+    report._write(notify_admin, _write_csv, {'service_id': '1234'})
+
+    mock_spawn.assert_called_with(report._send_heartbeats, notify_admin)
+    mock_spawn.return_value.kill.assert_called_once_with()
+    assert fake_redis.get(f'report-{report.id}-writer') is None
+
+
+def test_start_gives_each_user_their_own_report(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_current_user,
+    mocker,
+):
+    report = Report.start(_write_csv, filename='report.csv', service_id='1234')
+
+    mocker.patch('app.models.report.current_user', id='5678')
+
+    assert Report.start(_write_csv, filename='report.csv', service_id='1234').id != report.id
+
+
+def test_write_uploads_report_and_marks_it_finished(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_spawn_after,
+    mock_current_user,
+    mocker,
+):
+    uploaded = {}
+
+    def _upload_report(report_id, fileobj):
+        uploaded[report_id] = fileobj.read()
+
+    mocker.patch('app.models.report.upload_report', side_effect=_upload_report)
+
+    report = Report.start(_write_csv, filename='report.csv', service_id='1234')
+    report._write(notify_admin, _write_csv, {'service_id': '1234'})
+
+    assert uploaded == {report.id: b'Name,Value\r\nservice_id,1234\r\n'}
+    assert Report._get(report.id).status == Report.FINISHED
+    mock_spawn_after.assert_called_once_with(Report.FILE_TTL_IN_SECONDS, report._delete_old_files, notify_admin)
+
+
+def test_write_marks_report_failed_if_it_cannot_be_written(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_spawn_after,
+    mock_current_user,
+    mocker,
+):
+    mock_upload_report = mocker.patch('app.models.report.upload_report')
+
+    def _fails(**kwargs):
+        yield 'Name,Value\r\n'
+        raise ValueError
+
+    report = Report.start(_fails, filename='report.csv')
+    report._write(notify_admin, _fails, {})
+
+    assert mock_upload_report.called is False
+    assert Report._get(report.id).status == Report.FAILED
+    assert mock_spawn_after.called is False
+
+
+def test_finished_report_files_are_deleted_once_they_cannot_be_downloaded(
+    notify_admin,
+    mocker,
+    fake_uuid,
+):
+    mock_delete_reports_older_than = mocker.patch('app.models.report.delete_reports_older_than')
+
+    Report({'id': fake_uuid})._delete_old_files(notify_admin)
+
+    assert Report.FILE_TTL_IN_SECONDS > Report.FINISHED_TTL_IN_SECONDS
+    mock_delete_reports_older_than.assert_called_once_with(Report.FILE_TTL_IN_SECONDS)
+
+
+def test_from_id_only_finds_reports_for_the_user_who_asked_for_them(
+    notify_admin,
+    fake_redis,
+    mock_spawn,
+    mock_current_user,
+    mocker,
+):
+    report = Report.start(_write_csv, filename='report.csv')
+
+    assert Report.from_id(report.id).filename == 'report.csv'
+
+    mocker.patch('app.models.report.current_user', id='5678')
+
+    with pytest.raises(NotFound):
+        Report.from_id(report.id)
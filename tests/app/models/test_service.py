@@ -1,4 +1,5 @@
 import pytest
+from werkzeug.exceptions import NotFound
 
 from app.models.organisation import Organisation
 from app.models.service import Service
@@ -59,7 +60,7 @@ def test_organisation_name_goes_into_cache(mocker, service_one):
     mock_redis_set.assert_called_once_with(
         f'organisation-{ORGANISATION_ID}-name',
         '"Test Organisation"',
-        ex=604800,
+        ex=3600,
     )
 
 
@@ -111,3 +112,20 @@ def test_has_templates_of_type_includes_folders(
     )
 
     assert Service(service_one).has_templates_of_type('sms')
+
+
+def test_get_template_folder(
+    mocker,
+    service_one,
+):
+    mocker.patch(
+        'app.template_folder_api_client.get_template_folders',
+        return_value=[create_folder(id='1'), create_folder(id='2')],
+    )
+    service = Service(service_one)
+
+    assert service.get_template_folder(None) == {'id': None, 'name': 'Templates', 'parent_id': None}
+    assert service.get_template_folder('2') == create_folder(id='2')
+
+    with pytest.raises(NotFound):
+        service.get_template_folder('3')
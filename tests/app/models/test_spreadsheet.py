@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
 
 import pytest
@@ -40,3 +41,47 @@ def test_spreadsheet_checks_for_bad_arguments(args, kwargs):
     with pytest.raises(TypeError) as exception:
         Spreadsheet(*args, **kwargs)
     assert str(exception.value) == 'Spreadsheet must be created from either rows or CSV data'
+
+
+@pytest.mark.parametrize('filename', (
+    'EXCEL_95.XLS',
+    'excel 2007 with macro support.xlsm',
+    'excel 2007.xlsx',
+    'excel_97.xls',
+    'newline_unix.csv',
+    'newline_windows.csv',
+    'open document spreadsheet.ods',
+    'tab separated.tsv',
+))
+def test_spooled_csv_matches_csv_data_from_file(filename):
+    path = str(Path.cwd() / 'tests' / 'spreadsheet_files' / filename)
+
+    with open(path, 'rb') as uploaded:
+        expected_csv_data = Spreadsheet.from_file(uploaded, filename=filename).as_csv_data
+
+    with open(path, 'rb') as uploaded, Spreadsheet.spool_csv_from_file(uploaded, filename=filename) as spooled_csv:
+        assert spooled_csv.read().decode('utf-8') == expected_csv_data
+
+
+def test_spooled_csv_normalises_newlines():
+    with Spreadsheet.spool_csv_from_file(
+        BytesIO('a,b\r1,2\n\n3,4\r\n'.encode('utf-8')),
+        filename='example.csv',
+    ) as spooled_csv:
+        assert spooled_csv.read() == b'a,b\r\n1,2\r\n\r\n3,4'
+
+
+def test_spooled_csv_is_written_to_disk_when_too_big_for_memory(mocker):
+    mocker.patch.object(Spreadsheet, 'SPOOLED_CSV_MAX_MEMORY_SIZE', 10)
+
+    with Spreadsheet.spool_csv_from_file(
+        BytesIO('phone number\r\n07700900001\r\n07700900002'.encode('utf-8')),
+        filename='example.csv',
+    ) as spooled_csv:
+        assert spooled_csv._rolled
+        assert spooled_csv.read() == b'phone number\r\n07700900001\r\n07700900002'
+
+
+def test_spooled_csv_raises_for_files_which_are_not_utf8():
+    with pytest.raises(UnicodeDecodeError):
+        Spreadsheet.spool_csv_from_file(BytesIO(b'\xff\xfe'), filename='example.csv')
@@ -5,6 +5,7 @@ import pytest
 from app.models.service import Service
 from app.models.template_list import TemplateList
 from app.models.user import User
+from tests.conftest import create_template
 
 INV_PARENT_FOLDER_ID = '7e979e79-d970-43a5-ac69-b625a8d147b0'
 INV_CHILD_1_FOLDER_ID = '92ee1ee0-e4ee-4dcc-b1a7-a5da9ebcfa2b'
@@ -123,3 +124,39 @@ def test_template_list_yields_all_folders_without_user(
         "2's Visible grandchild",
         "2's Visible child",
     )
+
+
+def test_template_list_only_shows_folders_containing_templates_of_type(
+    mocker,
+    service_one,
+):
+    mocker.patch(
+        'app.service_api_client.get_service_templates',
+        return_value={'data': [
+            create_template(folder='grandchild-1', template_type='email', name='Email template'),
+            create_template(folder='child-2', template_type='sms', name='Text template'),
+            create_template(folder=None, template_type='sms', name='Top level text template'),
+        ]}
+    )
+    mocker.patch(
+        'app.template_folder_api_client.get_template_folders',
+        return_value=[
+            {'id': 'parent-1', 'name': 'Parent 1', 'parent_id': None},
+            {'id': 'child-1', 'name': 'Child 1', 'parent_id': 'parent-1'},
+            {'id': 'grandchild-1', 'name': 'Grandchild 1', 'parent_id': 'child-1'},
+            {'id': 'parent-2', 'name': 'Parent 2', 'parent_id': None},
+            {'id': 'child-2', 'name': 'Child 2', 'parent_id': 'parent-2'},
+        ],
+    )
+
+    template_list = TemplateList(service=Service(service_one), template_type='email')
+
+    assert [item.name for item in template_list] == [
+        'Parent 1', 'Child 1', 'Grandchild 1', 'Email template',
+    ]
+    assert template_list.is_folder_visible('parent-1', 'email')
+    assert not template_list.is_folder_visible('parent-2', 'email')
+    assert template_list.is_folder_visible('parent-2', ['sms', 'letter'])
+    assert [
+        template['name'] for template in template_list.get_templates(['sms', 'email'], 'child-2')
+    ] == ['Text template']
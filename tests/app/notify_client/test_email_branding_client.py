@@ -23,7 +23,7 @@ def test_get_email_branding(mocker, fake_uuid):
     mock_redis_set.assert_called_once_with(
         'email_branding-{}'.format(fake_uuid),
         '{"foo": "bar"}',
-        ex=604800,
+        ex=86400,
     )
 
 
@@ -47,7 +47,7 @@ def test_get_all_email_branding(mocker):
     mock_redis_set.assert_called_once_with(
         'email_branding',
         '[1, 2, 3]',
-        ex=604800,
+        ex=86400,
     )
 
 
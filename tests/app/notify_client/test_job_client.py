@@ -31,7 +31,7 @@ def test_client_creates_job_data_correctly(mocker, fake_uuid):
     mock_redis_set.assert_called_once_with(
         'has_jobs-{}'.format(service_id),
         b'true',
-        ex=604800,
+        ex=3600,
     )
 
 
@@ -353,7 +353,7 @@ def test_has_jobs_sets_cache(
     mock_redis_set.assert_called_once_with(
         'has_jobs-{}'.format(fake_uuid),
         expected_cache_value,
-        ex=604800,
+        ex=3600,
     )
 
 
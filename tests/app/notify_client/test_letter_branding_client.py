@@ -18,7 +18,7 @@ def test_get_letter_branding(mocker, fake_uuid):
     mock_redis_set.assert_called_once_with(
         'letter_branding-{}'.format(fake_uuid),
         '{"foo": "bar"}',
-        ex=604800,
+        ex=86400,
     )
 
 
@@ -34,7 +34,7 @@ def test_get_all_letter_branding(mocker):
     mock_redis_set.assert_called_once_with(
         'letter_branding',
         '[1, 2, 3]',
-        ex=604800,
+        ex=86400,
     )
 
 
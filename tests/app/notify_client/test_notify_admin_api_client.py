@@ -3,12 +3,15 @@ from unittest.mock import patch
 
 import pytest
 import werkzeug
+from prometheus_client import REGISTRY
 
 from app.models.service import Service
 from app.notify_client import NotifyAdminAPIClient
 from app.notify_client.notification_api_client import notification_api_client
+from app.notify_client.service_api_client import service_api_client
 from tests import service_json
 from tests.conftest import (
+    SERVICE_ONE_ID,
     create_api_user_active,
     create_platform_admin_user,
     set_config,
@@ -120,3 +123,102 @@ def test_get_notification_status_by_service(mocker):
         url='service/monthly-data-by-service',
         params={'start_date': '2019-04-01', 'end_date': '2019-04-30'}
     )
+
+
+def _cache_lookups(key_family, result):
+    return REGISTRY.get_sample_value(
+        'admin_api_client_cache_lookups_total',
+        {'key_family': key_family, 'result': result},
+    ) or 0
+
+
+def test_cache_reads_through_to_api_once_then_serves_from_redis(mocker, fake_redis):
+    mock_api_get = mocker.patch(
+        'app.notify_client.NotifyAdminAPIClient.get',
+        return_value={'data': {'id': SERVICE_ONE_ID}},
+    )
+    hits_before = _cache_lookups('service-{service_id}', 'hit')
+    misses_before = _cache_lookups('service-{service_id}', 'miss')
+
+    assert service_api_client.get_service(SERVICE_ONE_ID) == {'data': {'id': SERVICE_ONE_ID}}
+    assert service_api_client.get_service(SERVICE_ONE_ID) == {'data': {'id': SERVICE_ONE_ID}}
+
+    assert mock_api_get.call_count == 1
+    assert fake_redis.get(f'service-{SERVICE_ONE_ID}') == f'{{"data": {{"id": "{SERVICE_ONE_ID}"}}}}'.encode()
+    assert _cache_lookups('service-{service_id}', 'hit') == hits_before + 1
+    assert _cache_lookups('service-{service_id}', 'miss') == misses_before + 1
+
+
+def test_cache_is_invalidated_by_matching_write(notify_admin, mocker, fake_redis):
+    mocker.patch('app.notify_client.current_user', id='1')
+    mocker.patch('notifications_python_client.base.BaseAPIClient.request')
+    fake_redis.set(f'service-{SERVICE_ONE_ID}', '{"data": {}}')
+    fake_redis.set(f'service-{SERVICE_ONE_ID}-template-1234-version-None', '{"data": {}}')
+    fake_redis.set('service-other-service-id', '{"data": {}}')
+
+    service_api_client.update_reply_to_email_address(SERVICE_ONE_ID, '1234', 'test@example.gov')
+
+    assert set(fake_redis.store) == {'service-other-service-id'}
+
+
+def test_get_is_memoised_within_a_request(notify_admin):
+    api_client = NotifyAdminAPIClient()
+
+    with notify_admin.test_request_context():
+        with patch.object(api_client, 'request', return_value={'data': {'name': 'foo'}}) as request:
+            first_response = api_client.get('/service/1234', params={'a': 1, 'b': 2})
+            first_response['data']['name'] = 'changed by caller'
+            second_response = api_client.get('/service/1234', params={'b': 2, 'a': 1})
+
+    assert request.call_count == 1
+    assert second_response == {'data': {'name': 'foo'}}
+
+
+def test_get_is_not_memoised_for_different_params(notify_admin):
+    api_client = NotifyAdminAPIClient()
+
+    with notify_admin.test_request_context():
+        with patch.object(api_client, 'request') as request:
+            api_client.get('/service/1234', params={'page': 1})
+            api_client.get('/service/1234', params={'page': 2})
+            api_client.get('/service/1234')
+
+    assert request.call_count == 3
+
+
+def test_get_is_not_memoised_across_requests(notify_admin):
+    api_client = NotifyAdminAPIClient()
+
+    with patch.object(api_client, 'request') as request:
+        with notify_admin.test_request_context():
+            api_client.get('/service/1234')
+        with notify_admin.test_request_context():
+            api_client.get('/service/1234')
+        api_client.get('/service/1234')
+
+    assert request.call_count == 3
+
+
+@pytest.mark.parametrize('write_url, get_is_repeated', [
+    (f'/service/{SERVICE_ONE_ID}', True),
+    (f'/service/{SERVICE_ONE_ID}/archive', True),
+    (f'/service/{SERVICE_ONE_ID}/users/6ce466d0-fd6a-11e5-82f5-e0accb9d11a6', True),
+    ('/service', True),
+    ('/user/6ce466d0-fd6a-11e5-82f5-e0accb9d11a6', False),
+    ('/organisation/1234', False),
+])
+@pytest.mark.parametrize('method', ['post', 'put', 'delete'])
+def test_write_to_overlapping_path_clears_memoised_get(notify_admin, mocker, method, write_url, get_is_repeated):
+    mocker.patch('app.notify_client.current_user', platform_admin=False)
+    api_client = NotifyAdminAPIClient()
+
+    with notify_admin.test_request_context() as request_context:
+        request_context.service = None
+        with patch.object(api_client, 'request') as request:
+            api_client.get(f'/service/{SERVICE_ONE_ID}')
+            getattr(api_client, method)(write_url, {})
+            api_client.get(f'/service/{SERVICE_ONE_ID}')
+
+    assert [call[0][0] for call in request.call_args_list] == (
+        ['GET', method.upper(), 'GET'] if get_is_repeated else ['GET', method.upper()]
+    )
@@ -44,12 +44,12 @@ from app import organisations_client
                 call(
                     'organisations',
                     '[{"domains": ["x", "y", "z"]}]',
-                    ex=604800,
+                    ex=3600,
                 ),
                 call(
                     'domains',
                     '["x", "y", "z"]',
-                    ex=604800
+                    ex=3600
                 ),
             ],
             'from api',
@@ -85,7 +85,7 @@ from app import organisations_client
                 call(
                     'organisations',
                     '[{"domains": ["x", "y", "z"]}]',
-                    ex=604800,
+                    ex=3600,
                 ),
             ],
             'from api',
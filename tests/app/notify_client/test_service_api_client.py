@@ -188,7 +188,7 @@ def test_client_returns_count_of_service_templates(
                 call(
                     'service-{}'.format(SERVICE_ONE_ID),
                     '{"data_from": "api"}',
-                    ex=604800,
+                    ex=3600,
                 )
             ],
             {'data_from': 'api'},
@@ -218,7 +218,7 @@ def test_client_returns_count_of_service_templates(
                 call(
                     'service-{}-template-{}-version-None'.format(SERVICE_ONE_ID, FAKE_TEMPLATE_ID),
                     '{"data_from": "api"}',
-                    ex=604800,
+                    ex=86400,
                 ),
             ],
             {'data_from': 'api'},
@@ -248,7 +248,7 @@ def test_client_returns_count_of_service_templates(
                 call(
                     'service-{}-template-{}-version-1'.format(SERVICE_ONE_ID, FAKE_TEMPLATE_ID),
                     '{"data_from": "api"}',
-                    ex=604800,
+                    ex=86400,
                 ),
             ],
             {'data_from': 'api'},
@@ -278,7 +278,7 @@ def test_client_returns_count_of_service_templates(
                 call(
                     'service-{}-templates'.format(SERVICE_ONE_ID),
                     '{"data_from": "api"}',
-                    ex=604800,
+                    ex=86400,
                 )
             ],
             {'data_from': 'api'},
@@ -308,7 +308,7 @@ def test_client_returns_count_of_service_templates(
                 call(
                     'service-{}-template-{}-versions'.format(SERVICE_ONE_ID, FAKE_TEMPLATE_ID),
                     '{"data_from": "api"}',
-                    ex=604800,
+                    ex=86400,
                 ),
             ],
             {'data_from': 'api'},
@@ -327,7 +327,7 @@ def test_client_returns_count_of_service_templates(
                 call(
                     'service-{}-returned-letters-summary'.format(SERVICE_ONE_ID),
                     '{"data_from": "api"}',
-                    ex=604800,
+                    ex=3600,
                 )
             ],
             {'data_from': 'api'},
@@ -346,7 +346,7 @@ def test_client_returns_count_of_service_templates(
                 call(
                     'service-{}-returned-letters-statistics'.format(SERVICE_ONE_ID),
                     '{"data_from": "api"}',
-                    ex=604800,
+                    ex=3600,
                 )
             ],
             {'data_from': 'api'},
@@ -148,7 +148,7 @@ def test_client_converts_admin_permissions_to_db_permissions_on_add_to_service(n
                 call(
                     'user-{}'.format(user_id),
                     '{"data": "from api"}',
-                    ex=604800
+                    ex=3600
                 )
             ],
             'from api',
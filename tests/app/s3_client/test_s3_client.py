@@ -0,0 +1,41 @@
+from botocore.stub import Stubber
+from prometheus_client import REGISTRY
+
+from app.s3_client import get_s3_resource
+
+
+def test_get_s3_resource_is_shared(notify_admin):
+    assert get_s3_resource('eu-west-1') is get_s3_resource('eu-west-1')
+    assert get_s3_resource('eu-west-1') is not get_s3_resource('eu-west-2')
+
+
+def test_get_s3_resource_defaults_to_aws_region(notify_admin, mocker):
+    mocker.patch.dict(notify_admin.config, {'AWS_REGION': 'eu-west-1'})
+
+    assert get_s3_resource() is get_s3_resource('eu-west-1')
+
+
+def test_get_s3_resource_uses_configured_connection_pool(notify_admin):
+    client_config = get_s3_resource('eu-west-1').meta.client.meta.config
+
+    assert client_config.max_pool_connections == notify_admin.config['S3_MAX_POOL_CONNECTIONS']
+    assert client_config.connect_timeout == notify_admin.config['S3_CONNECT_TIMEOUT_IN_SECONDS']
+    assert client_config.read_timeout == notify_admin.config['S3_READ_TIMEOUT_IN_SECONDS']
+    assert client_config.retries['total_max_attempts'] == notify_admin.config['S3_MAX_ATTEMPTS']
+
+
+def test_s3_requests_are_timed(notify_admin):
+    s3 = get_s3_resource('eu-west-1')
+
+    def get_count():
+        return REGISTRY.get_sample_value(
+            'admin_s3_request_duration_seconds_count', {'operation': 'HeadObject'}
+        ) or 0
+
+    count_before = get_count()
+
+    with Stubber(s3.meta.client) as stubber:
+        stubber.add_response('head_object', {'Metadata': {'foo': 'bar'}}, {'Bucket': 'bucket', 'Key': 'key'})
+        assert s3.Object('bucket', 'key').metadata == {'foo': 'bar'}
+
+    assert get_count() == count_before + 1
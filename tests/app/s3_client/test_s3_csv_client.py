@@ -1,6 +1,14 @@
+from io import BytesIO
 from unittest.mock import Mock
 
-from app.s3_client.s3_csv_client import set_metadata_on_csv_upload
+import pytest
+
+from app.s3_client.s3_csv_client import (
+    MULTIPART_CHUNK_SIZE,
+    get_csv_metadata,
+    s3upload,
+    set_metadata_on_csv_upload,
+)
 
 
 def test_sets_metadata(client_request, mocker):
@@ -19,3 +27,92 @@ def test_sets_metadata(client_request, mocker):
         MetadataDirective='REPLACE',
         ServerSideEncryption='AES256',
     )
+
+
+def test_s3upload_uploads_strings_with_a_single_request(client_request, mocker, fake_uuid):
+    mocker.patch('app.s3_client.s3_csv_client.uuid.uuid4', return_value=fake_uuid)
+    mock_utils_s3upload = mocker.patch('app.s3_client.s3_csv_client.utils_s3upload')
+    mock_s3upload_fileobj = mocker.patch('app.s3_client.s3_csv_client.s3upload_fileobj')
+
+    assert s3upload('1234', {'data': 'phone number\r\n07700900001'}, 'eu-west-1') == fake_uuid
+
+    mock_utils_s3upload.assert_called_once_with(
+        filedata='phone number\r\n07700900001',
+        region='eu-west-1',
+        bucket_name='test-notifications-csv-upload',
+        file_location='service-1234-notify/{}.csv'.format(fake_uuid),
+        metadata={},
+    )
+    assert mock_s3upload_fileobj.called is False
+
+
+def test_s3upload_streams_files_in_parts(client_request, mocker, fake_uuid):
+    mocker.patch('app.s3_client.s3_csv_client.uuid.uuid4', return_value=fake_uuid)
+    mock_utils_s3upload = mocker.patch('app.s3_client.s3_csv_client.utils_s3upload')
+    mock_resource = mocker.patch('app.s3_client.s3_csv_client.get_s3_resource')
+    csv_file = BytesIO(b'phone number\r\n07700900001')
+
+    assert s3upload('1234', {'data': csv_file}, 'eu-west-1', bucket='test-contact-list') == fake_uuid
+
+    mock_resource.assert_called_once_with('eu-west-1')
+    mock_resource.return_value.Object.assert_called_once_with(
+        'test-contact-list',
+        'service-1234-notify/{}.csv'.format(fake_uuid),
+    )
+    mock_upload_fileobj = mock_resource.return_value.Object.return_value.upload_fileobj
+    assert mock_upload_fileobj.call_args[0] == (csv_file,)
+    assert mock_upload_fileobj.call_args[1]['ExtraArgs'] == {
+        'ServerSideEncryption': 'AES256',
+        'ContentType': 'binary/octet-stream',
+        'Metadata': {},
+    }
+    assert mock_upload_fileobj.call_args[1]['Config'].multipart_chunksize == MULTIPART_CHUNK_SIZE
+    assert mock_utils_s3upload.called is False
+
+
+def test_s3upload_sets_metadata_without_copying_the_file(client_request, mocker):
+    mock_utils_s3upload = mocker.patch('app.s3_client.s3_csv_client.utils_s3upload')
+    mock_get_csv_upload = mocker.patch('app.s3_client.s3_csv_client.get_csv_upload')
+
+    upload_id = s3upload('1234', {'data': 'phone number'}, 'eu-west-1', metadata={'original_file_name': 'a.csv'})
+
+    assert mock_utils_s3upload.call_args[1]['metadata'] == {'original_file_name': 'a.csv'}
+    assert get_csv_metadata('1234', upload_id) == {'original_file_name': 'a.csv'}
+
+    set_metadata_on_csv_upload('1234', upload_id, original_file_name='a.csv')
+
+    assert mock_get_csv_upload.called is False
+
+
+def test_get_csv_metadata_does_not_download_the_file(client_request, mocker):
+    mocked_s3_object = Mock(metadata={'original_file_name': 'a.csv'})
+    mocked_get_s3_object = mocker.patch(
+        'app.s3_client.s3_csv_client.get_csv_upload',
+        return_value=mocked_s3_object,
+    )
+
+    assert get_csv_metadata('1234', '5678') == {'original_file_name': 'a.csv'}
+    assert get_csv_metadata('1234', '5678') == {'original_file_name': 'a.csv'}
+
+    mocked_get_s3_object.assert_called_once_with('1234', '5678', None)
+    assert mocked_s3_object.get.called is False
+
+
+@pytest.mark.parametrize('new_metadata, expected_copies', (
+    ({'original_file_name': 'a.csv', 'valid': True}, 0),
+    ({'original_file_name': 'a.csv', 'valid': False}, 1),
+    ({'original_file_name': 'a.csv'}, 1),
+))
+def test_set_metadata_only_copies_the_file_if_metadata_has_changed(
+    client_request,
+    mocker,
+    new_metadata,
+    expected_copies,
+):
+    mocked_s3_object = Mock(metadata={'original_file_name': 'a.csv', 'valid': 'True'})
+    mocker.patch('app.s3_client.s3_csv_client.get_csv_upload', return_value=mocked_s3_object)
+
+    get_csv_metadata('1234', '5678')
+    set_metadata_on_csv_upload('1234', '5678', **new_metadata)
+
+    assert mocked_s3_object.copy_from.call_count == expected_copies
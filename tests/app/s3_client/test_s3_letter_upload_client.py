@@ -7,6 +7,7 @@ import pytest
 from flask import current_app
 from moto import mock_s3
 
+from app.s3_client import _get_s3_resource
 from app.s3_client.s3_letter_upload_client import (
     LetterMetadata,
     LetterNotFoundError,
@@ -106,6 +107,8 @@ def test_get_letter_s3_object_raises_custom_error(
     will_raise_custom_error,
     expected_exception
 ):
+    # The shared resource may have been created outside of moto by an earlier test
+    _get_s3_resource.cache_clear()
     bucket_name = current_app.config['TRANSIENT_UPLOADED_LETTERS']
     s3 = boto3.client('s3', region_name='us-west-2')
 
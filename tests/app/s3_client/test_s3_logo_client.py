@@ -1,7 +1,8 @@
 from collections import namedtuple
-from unittest.mock import call
+from datetime import datetime, timezone
 
 import pytest
+from freezegun import freeze_time
 
 from app.s3_client.s3_logo_client import (
     EMAIL_LOGO_LOCATION_STRUCTURE,
@@ -12,6 +13,8 @@ from app.s3_client.s3_logo_client import (
     delete_email_temp_files_created_by,
     delete_letter_temp_file,
     delete_letter_temp_files_created_by,
+    delete_s3_objects,
+    delete_temp_files_older_than,
     letter_filename_for_db,
     permanent_email_logo_name,
     persist_logo,
@@ -126,26 +129,91 @@ def test_delete_email_temp_files_created_by_user(client_request, mocker, fake_uu
     obj = namedtuple("obj", ["key"])
     objs = [obj(key='test1'), obj(key='test2')]
 
-    mocker.patch('app.s3_client.s3_logo_client.get_s3_objects_filter_by_prefix', return_value=objs)
-    mocked_delete_s3_object = mocker.patch('app.s3_client.s3_logo_client.delete_s3_object')
+    mock_get_objects = mocker.patch(
+        'app.s3_client.s3_logo_client.get_s3_objects_filter_by_prefix', return_value=objs
+    )
+    mocked_delete_s3_objects = mocker.patch('app.s3_client.s3_logo_client.delete_s3_objects')
 
     delete_email_temp_files_created_by(fake_uuid)
 
-    for index, arg in enumerate(mocked_delete_s3_object.call_args_list):
-        assert arg == call(objs[index].key)
+    mock_get_objects.assert_called_once_with(TEMP_TAG.format(user_id=fake_uuid))
+    assert list(mocked_delete_s3_objects.call_args[0][0]) == ['test1', 'test2']
 
 
 def test_delete_letter_temp_files_created_by_user(mocker, fake_uuid):
     obj = namedtuple("obj", ["key"])
     objs = [obj(key='test1'), obj(key='test2')]
 
-    mocker.patch('app.s3_client.s3_logo_client.get_s3_objects_filter_by_prefix', return_value=objs)
-    mocked_delete_s3_object = mocker.patch('app.s3_client.s3_logo_client.delete_s3_object')
+    mock_get_objects = mocker.patch(
+        'app.s3_client.s3_logo_client.get_s3_objects_filter_by_prefix', return_value=objs
+    )
+    mocked_delete_s3_objects = mocker.patch('app.s3_client.s3_logo_client.delete_s3_objects')
 
     delete_letter_temp_files_created_by(fake_uuid)
 
-    for index, arg in enumerate(mocked_delete_s3_object.call_args_list):
-        assert arg == call(objs[index].key)
+    mock_get_objects.assert_called_once_with(LETTER_TEMP_TAG.format(user_id=fake_uuid))
+    assert list(mocked_delete_s3_objects.call_args[0][0]) == ['test1', 'test2']
+
+
+def test_delete_s3_objects_deletes_in_batches(client_request, mocker):
+    mock_bucket = mocker.patch('app.s3_client.s3_logo_client.get_s3_resource').return_value.Bucket
+    mock_bucket.return_value.delete_objects.return_value = {}
+
+    assert delete_s3_objects(f'temp-{i}' for i in range(2500)) == 2500
+
+    mock_bucket.assert_called_once_with('public-logos-test')
+    assert [
+        [obj['Key'] for obj in call_args[1]['Delete']['Objects']]
+        for call_args in mock_bucket.return_value.delete_objects.call_args_list
+    ] == [
+        [f'temp-{i}' for i in range(0, 1000)],
+        [f'temp-{i}' for i in range(1000, 2000)],
+        [f'temp-{i}' for i in range(2000, 2500)],
+    ]
+
+
+def test_delete_s3_objects_does_nothing_if_there_are_no_objects(client_request, mocker):
+    mock_bucket = mocker.patch('app.s3_client.s3_logo_client.get_s3_resource').return_value.Bucket
+
+    assert delete_s3_objects([]) == 0
+
+    assert mock_bucket.return_value.delete_objects.called is False
+
+
+def test_delete_s3_objects_raises_if_any_objects_are_not_deleted(client_request, mocker):
+    mock_bucket = mocker.patch('app.s3_client.s3_logo_client.get_s3_resource').return_value.Bucket
+    mock_bucket.return_value.delete_objects.return_value = {
+        'Errors': [{'Key': 'temp-1', 'Code': 'AccessDenied', 'Message': 'Access Denied'}],
+    }
+
+    with pytest.raises(RuntimeError):
+        delete_s3_objects(['temp-1', 'temp-2'])
+
+
+@freeze_time('2021-01-02 12:00')
+def test_delete_temp_files_older_than(client_request, mocker):
+    obj = namedtuple("obj", ["key", "last_modified"])
+    objs = {
+        'temp-': [
+            obj(key='temp-1_old.png', last_modified=datetime(2021, 1, 1, 11, 59, tzinfo=timezone.utc)),
+            obj(key='temp-1_new.png', last_modified=datetime(2021, 1, 1, 12, 1, tzinfo=timezone.utc)),
+        ],
+        'letters/static/images/letter-template/temp-': [
+            obj(
+                key='letters/static/images/letter-template/temp-1_old.svg',
+                last_modified=datetime(2020, 12, 1, 0, 0, tzinfo=timezone.utc),
+            ),
+        ],
+    }
+    mocker.patch('app.s3_client.s3_logo_client.get_s3_objects_filter_by_prefix', side_effect=objs.get)
+    mock_delete_s3_objects = mocker.patch('app.s3_client.s3_logo_client.delete_s3_objects', return_value=2)
+
+    assert delete_temp_files_older_than(24) == 2
+
+    assert list(mock_delete_s3_objects.call_args[0][0]) == [
+        'temp-1_old.png',
+        'letters/static/images/letter-template/temp-1_old.svg',
+    ]
 
 
 def test_delete_single_email_temp_file(client_request, mocker, upload_filename):
@@ -0,0 +1,79 @@
+from collections import namedtuple
+from datetime import datetime, timezone
+from io import BytesIO
+
+import pytest
+from freezegun import freeze_time
+
+from app.s3_client.s3_report_client import (
+    delete_reports_older_than,
+    get_report_download_url,
+    upload_report,
+)
+
+
+def test_upload_report(notify_admin, mocker, fake_uuid):
+    mock_s3upload_fileobj = mocker.patch('app.s3_client.s3_report_client.s3upload_fileobj')
+    report_file = BytesIO(b'a,b\r\n')
+
+    upload_report(fake_uuid, report_file)
+
+    mock_s3upload_fileobj.assert_called_once_with(
+        fileobj=report_file,
+        region=notify_admin.config['AWS_REGION'],
+        bucket_name='test-notifications-csv-upload',
+        file_location=f'reports/{fake_uuid}.csv',
+    )
+
+
+def test_get_report_download_url(notify_admin, mocker, fake_uuid):
+    mock_get_s3_resource = mocker.patch('app.s3_client.s3_report_client.get_s3_resource')
+    mock_generate_presigned_url = mock_get_s3_resource.return_value.meta.client.generate_presigned_url
+    mock_generate_presigned_url.return_value = 'https://example.com/report.csv'
+
+    assert get_report_download_url(fake_uuid, 'Service – 1 January report.csv') == 'https://example.com/report.csv'
+
+    mock_generate_presigned_url.assert_called_once_with(
+        'get_object',
+        Params={
+            'Bucket': 'test-notifications-csv-upload',
+            'Key': f'reports/{fake_uuid}.csv',
+            'ResponseContentType': 'text/csv; charset=utf-8',
+            'ResponseContentDisposition': (
+                "attachment; filename*=UTF-8''Service%20%E2%80%93%201%20January%20report.csv"
+            ),
+        },
+        ExpiresIn=60,
+    )
+
+
+@freeze_time('2021-01-01 12:00')
+def test_delete_reports_older_than(notify_admin, mocker):
+    obj = namedtuple('obj', ['key', 'last_modified'])
+    mock_bucket = mocker.patch('app.s3_client.s3_report_client.get_s3_resource').return_value.Bucket.return_value
+    mock_bucket.objects.filter.return_value = [
+        obj(key='reports/old.csv', last_modified=datetime(2021, 1, 1, 11, 44, tzinfo=timezone.utc)),
+        obj(key='reports/new.csv', last_modified=datetime(2021, 1, 1, 11, 46, tzinfo=timezone.utc)),
+    ]
+    mock_bucket.delete_objects.return_value = {}
+
+    assert delete_reports_older_than(15 * 60) == 1
+
+    mock_bucket.objects.filter.assert_called_once_with(Prefix='reports/')
+    mock_bucket.delete_objects.assert_called_once_with(Delete={
+        'Objects': [{'Key': 'reports/old.csv'}],
+        'Quiet': True,
+    })
+
+
+def test_delete_reports_older_than_raises_if_some_were_not_deleted(notify_admin, mocker):
+    mock_bucket = mocker.patch('app.s3_client.s3_report_client.get_s3_resource').return_value.Bucket.return_value
+    mock_bucket.objects.filter.return_value = [
+        namedtuple('obj', ['key', 'last_modified'])('reports/old.csv', datetime(2020, 1, 1, tzinfo=timezone.utc)),
+    ]
+    mock_bucket.delete_objects.return_value = {
+        'Errors': [{'Key': 'reports/old.csv', 'Code': 'AccessDenied', 'Message': 'Access Denied'}],
+    }
+
+    with pytest.raises(RuntimeError):
+        delete_reports_older_than(15 * 60)
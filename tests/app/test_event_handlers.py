@@ -1,7 +1,10 @@
 import uuid
 from unittest.mock import ANY
 
+import pytest
+
 from app.event_handlers import (
+    EventQueue,
     create_add_user_to_service_event,
     create_archive_service_event,
     create_archive_user_event,
@@ -15,6 +18,7 @@ from app.event_handlers import (
     on_user_logged_in,
 )
 from app.models.user import User
+from tests.conftest import set_config
 
 
 def event_dict(**extra):
@@ -144,3 +148,67 @@ def test_set_user_permissions(client_request, mock_events):
 
     create_set_user_permissions_event(**kwargs)
     mock_events.assert_called_with('set_user_permissions', event_dict(**kwargs))
+
+
+@pytest.fixture
+def event_queue(notify_admin, mocker):
+    mocker.patch.object(EventQueue, 'RETRY_DELAY_IN_SECONDS', 0)
+    queue = EventQueue()
+    queue.init_app(notify_admin)
+    with set_config(notify_admin, 'SEND_EVENTS_IN_BACKGROUND', True):
+        yield queue
+
+
+def test_event_queue_sends_events_in_background(event_queue, mock_events):
+    event_queue.put('sucessful_login', {'user_id': '1'})
+
+    assert not mock_events.called
+
+    event_queue._sender.wait()
+
+    mock_events.assert_called_once_with('sucessful_login', {'user_id': '1'})
+    assert event_queue._sender is None
+    assert not event_queue.events
+
+
+def test_event_queue_retries_failed_events(event_queue, mock_events):
+    mock_events.side_effect = [Exception('API down'), {'some': 'data'}]
+
+    event_queue.put('sucessful_login', {'user_id': '1'})
+    event_queue._sender.wait()
+
+    assert mock_events.call_count == 2
+    assert not event_queue.events
+
+
+def test_event_queue_gives_up_after_max_attempts(event_queue, mock_events):
+    mock_events.side_effect = Exception('API down')
+
+    event_queue.put('sucessful_login', {'user_id': '1'})
+    event_queue._sender.wait()
+
+    assert mock_events.call_count == EventQueue.MAX_ATTEMPTS
+    assert not event_queue.events
+
+
+def test_event_queue_sends_events_in_batches(event_queue, mock_events, mocker):
+    mocker.patch.object(EventQueue, 'MAX_BATCH_SIZE', 2)
+    event_queue.events.extend(('sucessful_login', {'user_id': str(i)}, 1) for i in range(3))
+
+    assert event_queue.flush() == 0
+
+    assert mock_events.call_count == 2
+    assert list(event_queue.events) == [('sucessful_login', {'user_id': '2'}, 1)]
+
+
+def test_event_queue_flush_on_exit_sends_everything_left(event_queue, mock_events):
+    event_queue.put('sucessful_login', {'user_id': '1'})
+    event_queue.put('sucessful_login', {'user_id': '2'})
+
+    event_queue.flush_on_exit()
+
+    assert mock_events.call_count == 2
+    assert not event_queue.events
+
+    event_queue._sender.wait()
+    assert mock_events.call_count == 2
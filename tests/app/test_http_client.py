@@ -0,0 +1,97 @@
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.http_client import CircuitOpenError, PooledHTTPClient
+
+
+def test_post_reuses_session_and_times_out(notify_admin, requests_mock):
+    client = PooledHTTPClient('test-service')
+    requests_mock.post('http://example.com/preview.png', content=b'png')
+
+    client.post('http://example.com/preview.png', json={'foo': 'bar'})
+    session = client._get_session(False)
+    client.post('http://example.com/preview.png', json={'foo': 'bar'})
+
+    assert client._get_session(False) is session
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.json() == {'foo': 'bar'}
+    assert requests_mock.last_request.timeout == (
+        notify_admin.config['HTTP_CONNECT_TIMEOUT_IN_SECONDS'],
+        notify_admin.config['HTTP_READ_TIMEOUT_IN_SECONDS'],
+    )
+
+
+@pytest.mark.parametrize('idempotent, expected_retries', [
+    (True, 2),
+    (False, 0),
+])
+def test_only_idempotent_requests_are_retried(notify_admin, idempotent, expected_retries):
+    adapter = PooledHTTPClient('test-service')._get_session(idempotent).get_adapter('https://example.com')
+
+    assert adapter.max_retries.total == expected_retries
+    assert adapter._pool_maxsize == notify_admin.config['HTTP_MAX_POOL_CONNECTIONS']
+
+
+def test_requests_are_timed(notify_admin, requests_mock):
+    requests_mock.post('http://example.com/precompiled/sanitise', status_code=200)
+
+    def get_count():
+        return REGISTRY.get_sample_value(
+            'admin_http_request_duration_seconds_count',
+            {'service': 'test-service', 'path': '/precompiled/sanitise'},
+        ) or 0
+
+    count_before = get_count()
+
+    PooledHTTPClient('test-service').post('http://example.com/precompiled/sanitise?upload_id=1')
+
+    assert get_count() == count_before + 1
+
+
+def test_circuit_opens_after_consecutive_failures(notify_admin, requests_mock):
+    client = PooledHTTPClient('test-service')
+    requests_mock.post('http://example.com/preview.png', status_code=500)
+
+    for _ in range(PooledHTTPClient.CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        assert client.post('http://example.com/preview.png').status_code == 500
+
+    with pytest.raises(CircuitOpenError):
+        client.post('http://example.com/preview.png')
+
+    assert requests_mock.call_count == PooledHTTPClient.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+
+
+def test_success_resets_failure_count(notify_admin, requests_mock):
+    client = PooledHTTPClient('test-service')
+    requests_mock.post('http://example.com/fails', status_code=503)
+    requests_mock.post('http://example.com/works', status_code=200)
+
+    for _ in range(PooledHTTPClient.CIRCUIT_BREAKER_FAILURE_THRESHOLD - 1):
+        client.post('http://example.com/fails')
+    client.post('http://example.com/works')
+    client.post('http://example.com/fails')
+
+    assert client.post('http://example.com/works').status_code == 200
+
+
+def test_circuit_lets_requests_through_after_reset_time(notify_admin, requests_mock):
+    client = PooledHTTPClient('test-service')
+    requests_mock.post('http://example.com/preview.png', status_code=502)
+
+    for _ in range(PooledHTTPClient.CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        client.post('http://example.com/preview.png')
+
+    client._circuit_opened_at = time.monotonic() - PooledHTTPClient.CIRCUIT_BREAKER_RESET_AFTER_IN_SECONDS
+
+    # still failing, so the circuit opens again straight away
+    assert client.post('http://example.com/preview.png').status_code == 502
+    with pytest.raises(CircuitOpenError):
+        client.post('http://example.com/preview.png')
+
+    client._circuit_opened_at = time.monotonic() - PooledHTTPClient.CIRCUIT_BREAKER_RESET_AFTER_IN_SECONDS
+    requests_mock.post('http://example.com/preview.png', status_code=200)
+
+    assert client.post('http://example.com/preview.png').status_code == 200
+    assert client.post('http://example.com/preview.png').status_code == 200
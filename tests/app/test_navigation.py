@@ -63,6 +63,7 @@ EXCLUDED_ENDPOINTS = tuple(map(Navigation.get_endpoint_with_blueprint, {
     'choose_template',
     'choose_template_to_copy',
     'clear_cache',
+    'clear_temporary_logos',
     'confirm_edit_user_email',
     'confirm_edit_user_mobile_number',
     'confirm_redact_template',
@@ -89,6 +90,7 @@ EXCLUDED_ENDPOINTS = tuple(map(Navigation.get_endpoint_with_blueprint, {
     'download_contact_list',
     'download_notifications_csv',
     'download_organisation_usage_report',
+    'download_report',
     'edit_and_format_messages',
     'edit_data_retention',
     'edit_organisation_agreement',
@@ -350,6 +352,8 @@ EXCLUDED_ENDPOINTS = tuple(map(Navigation.get_endpoint_with_blueprint, {
     'view_provider',
     'view_providers',
     'view_rejected_broadcast',
+    'view_report',
+    'view_report_updates',
     'view_template',
     'view_template_version',
     'view_template_versions',
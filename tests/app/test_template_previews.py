@@ -1,4 +1,5 @@
 import base64
+import os
 from functools import partial
 from unittest.mock import Mock
 
@@ -8,9 +9,11 @@ from notifications_utils.template import LetterPreviewTemplate
 from app import load_service_before_request
 from app.template_previews import (
     TemplatePreview,
+    _evict_from_disk_cache,
     get_page_count_for_letter,
     sanitise_letter,
 )
+from tests.conftest import set_config
 
 
 @pytest.mark.parametrize('partial_call, expected_page_argument', [
@@ -64,7 +67,7 @@ def test_from_database_object_makes_request(
     load_service_before_request()
 
     resp = Mock(content='a', status_code='b', headers={'c': 'd'})
-    request_mock = mocker.patch('app.template_previews.requests.post', return_value=resp)
+    request_mock = mocker.patch('app.template_previews.template_preview_client.post', return_value=resp)
     mocker.patch('app.template_previews.current_service', letter_branding=letter_branding)
     template = mock_get_service_letter_template('123', '456')['data']
 
@@ -82,7 +85,85 @@ def test_from_database_object_makes_request(
     }
     headers = {'Authorization': 'Token my-secret-key'}
 
-    request_mock.assert_called_once_with(expected_url, json=data, headers=headers)
+    request_mock.assert_called_once_with(expected_url, json=data, headers=headers, idempotent=True)
+
+
+def test_from_database_object_caches_successful_previews_on_disk(
+    mocker,
+    client_request,
+    tmp_path,
+    mock_get_service_letter_template,
+):
+    resp = Mock(content=b'png', status_code=200, headers={'Content-Type': 'image/png'})
+    request_mock = mocker.patch('app.template_previews.template_preview_client.post', return_value=resp)
+    mocker.patch('app.template_previews.current_service', letter_branding=None)
+    template = mock_get_service_letter_template('123', '456')['data']
+
+    with set_config(client_request.app, 'TEMPLATE_PREVIEW_CACHE_DIRECTORY', str(tmp_path)):
+        first = TemplatePreview.from_database_object(template, 'png', page=2)
+        second = TemplatePreview.from_database_object(template, 'png', page=2)
+        TemplatePreview.from_database_object(template, 'png', page=3)
+        TemplatePreview.from_database_object(template, 'png', {'name': 'Jo'}, page=2)
+
+    assert first[:2] == second[:2] == (b'png', 200)
+    assert list(first[2]) == list(second[2]) == [('Content-Type', 'image/png')]
+    # only the repeated preview is served from the cache
+    assert request_mock.call_count == 3
+
+
+def test_from_database_object_does_not_cache_errors(
+    mocker,
+    client_request,
+    tmp_path,
+    mock_get_service_letter_template,
+):
+    resp = Mock(content=b'error', status_code=500, headers={'Content-Type': 'text/plain'})
+    request_mock = mocker.patch('app.template_previews.template_preview_client.post', return_value=resp)
+    mocker.patch('app.template_previews.current_service', letter_branding=None)
+    template = mock_get_service_letter_template('123', '456')['data']
+
+    with set_config(client_request.app, 'TEMPLATE_PREVIEW_CACHE_DIRECTORY', str(tmp_path)):
+        TemplatePreview.from_database_object(template, 'png')
+        ret = TemplatePreview.from_database_object(template, 'png')
+
+    assert ret[:2] == (b'error', 500)
+    assert request_mock.call_count == 2
+    assert not list(tmp_path.rglob('*'))
+
+
+def test_from_database_object_uses_redis_cache_when_enabled(
+    mocker,
+    client_request,
+    tmp_path,
+    fake_redis,
+    mock_get_service_letter_template,
+):
+    resp = Mock(content=b'{"count": 2}', status_code=200, headers={'Content-Type': 'application/json'})
+    request_mock = mocker.patch('app.template_previews.template_preview_client.post', return_value=resp)
+    mocker.patch('app.template_previews.current_service', letter_branding=None)
+    template = mock_get_service_letter_template('123', '456')['data']
+
+    with set_config(client_request.app, 'TEMPLATE_PREVIEW_REDIS_CACHE_ENABLED', True):
+        assert get_page_count_for_letter(template) == 2
+        assert len(fake_redis.store) == 1
+
+        # another instance, with nothing on its disk yet
+        with set_config(client_request.app, 'TEMPLATE_PREVIEW_CACHE_DIRECTORY', str(tmp_path)):
+            assert get_page_count_for_letter(template) == 2
+            assert len(list(tmp_path.rglob('*'))) == 2  # the file and its directory
+
+    assert request_mock.call_count == 1
+
+
+def test_evict_from_disk_cache_removes_least_recently_used_files(tmp_path):
+    for age, name in enumerate(('newest', 'middle', 'oldest')):
+        path = tmp_path / name
+        path.write_bytes(b'x' * 10)
+        os.utime(path, (1000 - age, 1000 - age))
+
+    _evict_from_disk_cache(str(tmp_path), max_size_in_bytes=20)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['middle', 'newest']
 
 
 @pytest.mark.parametrize('page_number, expected_url', [
@@ -92,7 +173,7 @@ def test_from_database_object_makes_request(
 def test_from_valid_pdf_file_makes_request(mocker, page_number, expected_url):
     mocker.patch('app.template_previews.extract_page_from_pdf', return_value=b'pdf page')
     request_mock = mocker.patch(
-        'app.template_previews.requests.post',
+        'app.template_previews.template_preview_client.post',
         return_value=Mock(content='a', status_code='b', headers={'c': 'd'})
     )
 
@@ -103,13 +184,14 @@ def test_from_valid_pdf_file_makes_request(mocker, page_number, expected_url):
         expected_url,
         data=base64.b64encode(b'pdf page').decode('utf-8'),
         headers={'Authorization': 'Token my-secret-key'},
+        idempotent=True,
     )
 
 
 def test_from_invalid_pdf_file_makes_request(mocker):
     mocker.patch('app.template_previews.extract_page_from_pdf', return_value=b'pdf page')
     request_mock = mocker.patch(
-        'app.template_previews.requests.post',
+        'app.template_previews.template_preview_client.post',
         return_value=Mock(content='a', status_code='b', headers={'c': 'd'})
     )
 
@@ -120,6 +202,7 @@ def test_from_invalid_pdf_file_makes_request(mocker):
         'http://localhost:9999/precompiled/overlay.png?page_number=1',
         data=b'pdf page',
         headers={'Authorization': 'Token my-secret-key'},
+        idempotent=True,
     )
 
 
@@ -153,7 +236,7 @@ def test_page_count_unpacks_from_json_response(
 
 
 def test_from_example_template_makes_request(mocker):
-    request_mock = mocker.patch('app.template_previews.requests.post')
+    request_mock = mocker.patch('app.template_previews.template_preview_client.post')
     template = {}
     filename = 'geo'
 
@@ -165,7 +248,8 @@ def test_from_example_template_makes_request(mocker):
         json={'values': None,
               'template': template,
               'filename': filename,
-              'letter_contact_block': None}
+              'letter_contact_block': None},
+        idempotent=True,
     )
 
 
@@ -179,7 +263,7 @@ def test_sanitise_letter_calls_template_preview_sanitise_endoint_with_file(
     query_param_value,
     fake_uuid,
 ):
-    request_mock = mocker.patch('app.template_previews.requests.post')
+    request_mock = mocker.patch('app.template_previews.template_preview_client.post')
 
     sanitise_letter(
         'pdf_data',
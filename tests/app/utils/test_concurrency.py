@@ -0,0 +1,59 @@
+from functools import partial
+
+import pytest
+from flask import request
+
+from app.notify_client import NotifyAdminAPIClient
+from app.utils.concurrency import call_in_background, run_concurrently
+
+
+def test_run_concurrently_returns_results_in_order(notify_admin):
+    assert run_concurrently(
+        partial(sum, [1, 2]),
+        partial(max, [3, 4]),
+        partial(min, [5, 6]),
+    ) == [3, 4, 5]
+
+
+def test_run_concurrently_keeps_request_context_and_trace_headers(notify_admin):
+    api_client = NotifyAdminAPIClient()
+    api_client.init_app(notify_admin)
+
+    with notify_admin.test_request_context() as request_context:
+        first_headers, second_headers = run_concurrently(
+            partial(api_client.generate_headers, 'api_token'),
+            partial(api_client.generate_headers, 'api_token'),
+        )
+
+    for headers in (first_headers, second_headers):
+        assert headers['X-B3-TraceId'] == request_context.request.request_id
+        assert headers['X-B3-SpanId'] == request_context.request.span_id
+
+
+def test_run_concurrently_raises_first_exception_after_all_calls_finish(notify_admin):
+    finished = []
+
+    def _fails():
+        raise ValueError('first')
+
+    def _succeeds():
+        finished.append(True)
+
+    with pytest.raises(ValueError, match='first'):
+        run_concurrently(_fails, _succeeds)
+
+    assert finished == [True]
+
+
+def test_call_in_background_keeps_request_context_and_raises_on_wait(notify_admin):
+    def _fails():
+        raise ValueError('failed')
+
+    with notify_admin.test_request_context('/some-path'):
+        green_thread = call_in_background(lambda: request.path)
+        failing_green_thread = call_in_background(_fails)
+
+        assert green_thread.wait() == '/some-path'
+
+        with pytest.raises(ValueError, match='failed'):
+            failing_green_thread.wait()
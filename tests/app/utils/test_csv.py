@@ -3,8 +3,16 @@ from csv import DictReader
 from io import StringIO
 
 import pytest
+from notifications_utils.recipients import RecipientCSV
 
-from app.utils.csv import generate_notifications_csv, get_errors_for_csv
+import app.utils.csv
+from app.utils.csv import (
+    generate_notifications_csv,
+    get_csv_rows,
+    get_csv_validation,
+    get_errors_for_csv,
+)
+from app.utils.templates import get_sample_template
 from tests.conftest import fake_uuid
 
 
@@ -211,6 +219,86 @@ def test_generate_notifications_csv_calls_twice_if_next_link(
     assert mock_get_notifications.mock_calls[1][2]['page'] == 2
 
 
+def test_generate_notifications_csv_sends_rows_in_chunks(
+    notify_admin,
+    mocker,
+):
+    mocker.patch.object(app.utils.csv, 'NOTIFICATIONS_CSV_CHUNK_SIZE', 200)
+    mocker.patch(
+        'app.notification_api_client.get_notifications_for_service',
+        side_effect=_get_notifications_csv(rows=10, job_id=None, job_name=None)
+    )
+
+    header, *chunks = generate_notifications_csv(service_id='1234')
+
+    assert header == 'Recipient,Reference,Template,Type,Sent by,Sent by email,Job,Status,Time\n'
+    assert len(chunks) == 3
+    assert all(chunk.endswith('\r\n') for chunk in chunks)
+    assert ''.join(chunks) == 'foo@bar.com,ref 1234,foo,sms,,,,Delivered,1943-04-19 12:00:00\r\n' * 10
+
+
+def test_generate_notifications_csv_reads_original_rows_like_recipient_csv(
+    notify_admin,
+    mocker,
+    _get_notifications_csv_mock,
+):
+    mocker.patch(
+        'app.s3_client.s3_csv_client.s3download',
+        return_value=(
+            '\r\n'
+            'phone number,name,missing\r\n'
+            ' 07700900123 , \u200bSomeone\u200b\r\n'
+            '07700900456\r\n'
+        ),
+    )
+
+    assert list(DictReader(StringIO(''.join(
+        generate_notifications_csv(service_id='1234', job_id=fake_uuid, template_type='sms')
+    )))) == [{
+        'Row number': '1',
+        'phone number': '07700900123',
+        'name': 'Someone',
+        'missing': 'None',
+        'Template': 'foo',
+        'Type': 'sms',
+        'Job': 'bar.csv',
+        'Status': 'Delivered',
+        'Time': '1943-04-19 12:00:00',
+    }]
+
+
+def test_generate_notifications_csv_collects_repeated_columns_like_recipient_csv(
+    notify_admin,
+    mocker,
+    _get_notifications_csv_mock,
+):
+    file_data = (
+        'Phone Number,name,name,phone number\r\n'
+        '07700900123,Jo,Smith,07700900456\r\n'
+    )
+    mocker.patch('app.s3_client.s3_csv_client.s3download', return_value=file_data)
+    original_upload = RecipientCSV(file_data, template=get_sample_template('sms'))
+
+    rows = list(DictReader(StringIO(''.join(
+        generate_notifications_csv(service_id='1234', job_id=fake_uuid, template_type='sms')
+    ))))
+
+    assert rows == [{
+        'Row number': '1',
+        'Phone Number': '07700900456',
+        'name': "['Jo', 'Smith']",
+        'phone number': '07700900456',
+        'Template': 'foo',
+        'Type': 'sms',
+        'Job': 'bar.csv',
+        'Status': 'Delivered',
+        'Time': '1943-04-19 12:00:00',
+    }]
+    assert [rows[0][header] for header in original_upload.column_headers] == [
+        str(original_upload[0].get(header).data) for header in original_upload.column_headers
+    ]
+
+
 MockRecipients = namedtuple(
     'RecipientCSV',
     [
@@ -318,3 +406,71 @@ def test_get_errors_for_csv(
         ),
         template_type
     ) == expected_errors
+
+
+def test_get_csv_validation_only_validates_each_upload_once(fake_redis, mocker, fake_uuid):
+    validate_csv = mocker.spy(app.utils.csv, '_validate_csv')
+    recipients = RecipientCSV(
+        'phone number\n07700900001\n07700900002',
+        template=get_sample_template('sms'),
+    )
+
+    for _ in range(2):
+        assert get_csv_validation(fake_uuid, recipients, validated_against=['version 1']) == {
+            'ok': True,
+            'has_errors': False,
+            'row_errors': [],
+            'count_of_recipients': 2,
+            'count_of_displayed_recipients': 2,
+            'first_recipient_column': 'phone number',
+            'header_line_count': 1,
+            'multiline_rows': [],
+        }
+
+    assert validate_csv.call_count == 1
+
+    get_csv_validation(fake_uuid, recipients, validated_against=['version 2'])
+
+    assert validate_csv.call_count == 2
+
+
+def test_get_csv_validation_counts_errors(fake_redis, fake_uuid):
+    validation = get_csv_validation(
+        fake_uuid,
+        RecipientCSV(
+            'phone number\n07700900001\nnot a phone number',
+            template=get_sample_template('sms'),
+        ),
+        validated_against=[],
+    )
+
+    assert validation['ok'] is False
+    assert validation['has_errors'] is True
+    assert validation['row_errors'] == ['fix 1 phone number']
+
+
+@pytest.mark.parametrize('start, stop, expected_rows', (
+    (0, 1, ['07700900001']),
+    (1, 2, ['07700900002']),
+    (2, 4, ['07700900003', '07700900004']),
+    (0, 50, ['07700900001', '07700900002', '07700900003', '07700900004']),
+))
+def test_get_csv_rows_finds_rows_which_take_up_more_than_one_line(fake_uuid, start, stop, expected_rows):
+    recipients = RecipientCSV(
+        'phone number,name\n'
+        '07700900001,A\n'
+        '07700900002,"B\nB"\n'
+        '07700900003,C\n'
+        '07700900004,D\n',
+        template=get_sample_template('sms'),
+    )
+    validation = get_csv_validation(fake_uuid, recipients, validated_against=[])
+
+    assert validation['multiline_rows'] == [[1, 2]]
+
+    assert [
+        row['phone number'].data for row in RecipientCSV(
+            get_csv_rows(recipients.file_data, validation, start, stop),
+            template=get_sample_template('sms'),
+        ).rows
+    ] == expected_rows
@@ -0,0 +1,81 @@
+import hashlib
+import json
+
+import pytest
+
+from app.utils.polling import partials_response
+
+
+@pytest.fixture
+def render_partials(mocker):
+    return mocker.Mock(return_value={'counts': '<p>1 sent</p>'})
+
+
+def test_partials_response_has_etag_from_content(notify_admin, mocker, render_partials):
+    mocker.patch('app.utils.polling.current_user', id='1234')
+
+    with notify_admin.test_request_context('/services/abc/jobs/def.json'):
+        response = partials_response(render_partials, upstream_data={'id': 'def'})
+
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {'counts': '<p>1 sent</p>'}
+    assert response.get_etag() == (hashlib.sha256(response.get_data()).hexdigest(), False)
+
+
+def test_partials_response_returns_304_if_partials_have_not_changed(notify_admin, mocker, render_partials):
+    mocker.patch('app.utils.polling.current_user', id='1234')
+
+    with notify_admin.test_request_context('/services/abc/jobs/def.json'):
+        etag, _ = partials_response(render_partials, upstream_data={'id': 'def'}).get_etag()
+
+    with notify_admin.test_request_context('/services/abc/jobs/def.json', headers={'If-None-Match': f'"{etag}"'}):
+        response = partials_response(render_partials, upstream_data={'id': 'def'})
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+
+def test_partials_response_returns_200_if_partials_have_changed(notify_admin, mocker, render_partials):
+    mocker.patch('app.utils.polling.current_user', id='1234')
+
+    with notify_admin.test_request_context('/services/abc/jobs/def.json'):
+        etag, _ = partials_response(render_partials, upstream_data={'id': 'def'}).get_etag()
+
+    render_partials.return_value = {'counts': '<p>2 sent</p>'}
+
+    with notify_admin.test_request_context('/services/abc/jobs/def.json', headers={'If-None-Match': f'"{etag}"'}):
+        response = partials_response(render_partials, upstream_data={'id': 'def', 'count': 2})
+
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {'counts': '<p>2 sent</p>'}
+
+
+@pytest.mark.parametrize('second_request_path, second_user_id, second_upstream_data, expected_renders', [
+    ('/services/abc/jobs/def.json', '1234', {'id': 'def'}, 1),
+    ('/services/abc/jobs/def.json?status=failed', '1234', {'id': 'def'}, 2),
+    ('/services/abc/jobs/def.json', '5678', {'id': 'def'}, 2),
+    ('/services/abc/jobs/def.json', '1234', {'id': 'def', 'status': 'finished'}, 2),
+])
+def test_partials_response_only_renders_once_for_the_same_upstream_data(
+    notify_admin,
+    mocker,
+    fake_redis,
+    render_partials,
+    second_request_path,
+    second_user_id,
+    second_upstream_data,
+    expected_renders,
+):
+    mock_current_user = mocker.patch('app.utils.polling.current_user', id='1234')
+
+    with notify_admin.test_request_context('/services/abc/jobs/def.json'):
+        first_response = partials_response(render_partials, upstream_data={'id': 'def'})
+
+    mock_current_user.id = second_user_id
+
+    with notify_admin.test_request_context(second_request_path):
+        second_response = partials_response(render_partials, upstream_data=second_upstream_data)
+
+    assert render_partials.call_count == expected_renders
+    assert first_response.get_data() == second_response.get_data()
+    assert first_response.get_etag() == second_response.get_etag()
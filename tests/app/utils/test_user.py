@@ -2,7 +2,13 @@ import pytest
 from flask import request
 from werkzeug.exceptions import Forbidden
 
-from app.utils.user import user_has_permissions
+from app.utils.user import (
+    DomainTrie,
+    clear_organisation_domains_cache,
+    is_gov_user,
+    user_has_permissions,
+)
+from tests.conftest import set_config
 
 
 @pytest.mark.parametrize('permissions', (
@@ -153,3 +159,43 @@ def test_user_with_no_permissions_to_service_goes_to_templates(
         pass
 
     index()
+
+
+@pytest.mark.parametrize('email_address, expected_match', (
+    ('test@gov.uk', True),
+    ('test@GOV.UK', True),
+    ('test@test.gov.uk', True),
+    ('test@a.b.c.gov.uk', True),
+    ('test@nhs.net', True),
+    ('test@x.nhs.net', True),
+    ('test@example.ac.uk', True),
+    ('test@other.ac.uk', False),
+    ('test@notgov.uk', False),
+    ('test@gov.uk.com', False),
+    ('gov.uk@example.com', False),
+    ('test@uk', False),
+))
+def test_domain_trie_matches_domains_and_subdomains(email_address, expected_match):
+    trie = DomainTrie(['gov.uk', 'NHS.net', 'example.ac.uk'])
+    assert trie.matches(email_address) is expected_match
+
+
+def test_is_gov_user_caches_organisation_domains(notify_admin, mocker):
+    mock_get_domains = mocker.patch(
+        'app.utils.user.organisations_client.get_domains',
+        return_value=['example.gov.uk'],
+    )
+    clear_organisation_domains_cache()
+
+    with set_config(notify_admin, 'ORGANISATION_DOMAINS_CACHE_TTL_IN_SECONDS', 60):
+        assert is_gov_user('test@example.gov.uk') is True
+        assert is_gov_user('test@example.com') is False
+        assert mock_get_domains.call_count == 1
+
+        mock_get_domains.return_value = ['example.com']
+        clear_organisation_domains_cache()
+
+        assert is_gov_user('test@example.com') is True
+        assert mock_get_domains.call_count == 2
+
+    clear_organisation_domains_cache()
@@ -16,6 +16,7 @@ from notifications_utils.url_safe_token import generate_token
 from app import create_app, webauthn_server
 
 from . import (
+    FakeRedis,
     TestClient,
     api_key_json,
     assert_url_expected,
@@ -52,6 +53,14 @@ def notify_admin():
     yield app
 
 
+@pytest.fixture
+def fake_redis(mocker):
+    redis = FakeRedis()
+    for method in ('get', 'set', 'delete', 'delete_by_pattern'):
+        mocker.patch(f'app.extensions.RedisClient.{method}', side_effect=getattr(redis, method))
+    return redis
+
+
 @pytest.fixture(scope='function')
 def service_one(api_user_active):
     return service_json(SERVICE_ONE_ID, 'service one', [api_user_active['id']])
@@ -2133,7 +2142,7 @@ def mock_get_users_by_service(mocker):
 
 @pytest.fixture(scope='function')
 def mock_s3_upload(mocker):
-    def _upload(service_id, filedata, region):
+    def _upload(service_id, filedata, region, metadata=None):
         return sample_uuid()
 
     return mocker.patch('app.main.views.send.s3upload', side_effect=_upload)